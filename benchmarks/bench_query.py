@@ -0,0 +1,68 @@
+"""
+Benchmark of /logs/query lookups: linear scan versus the per-room time index.
+Run from the project root with: python -m benchmarks.bench_query [max_rows]
+"""
+import sys
+import time
+import numpy as np
+import pandas as pd
+from src.log_store import LogStore
+
+ROOMS = [f"Sala_{i}" for i in range(1, 21)]
+QUERIES = 200
+
+
+def make_store(n_rows, seed=0):
+    """
+    Build a store with n_rows synthetic logs, one reading every second across ROOMS.
+
+    Args:
+        n_rows (int): Number of rows to generate.
+        seed (int): Random seed.
+    Returns:
+        LogStore: The populated store.
+    """
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2025-05-01T08:00:00", "us")
+    return LogStore.from_frame(pd.DataFrame({
+        "timestamp": start + np.arange(n_rows) * np.timedelta64(1, "s"),
+        "sala": np.asarray(ROOMS, dtype=object)[rng.integers(0, len(ROOMS), n_rows)],
+        "estado": "INFO",
+        "temperatura": rng.normal(22, 2, n_rows),
+        "humedad": rng.normal(50, 5, n_rows),
+        "co2": rng.normal(800, 150, n_rows),
+        "mensaje": None,
+    }))
+
+
+def linear_scan(store, room, start, end):
+    timestamps = store.timestamp
+    return np.flatnonzero((timestamps >= start) & (timestamps <= end) & (store.sala_codes == store.room_code(room)))
+
+
+def time_queries(func, store, windows):
+    started = time.perf_counter()
+    for room, start, end in windows:
+        func(store, room, start, end)
+    return (time.perf_counter() - started) / len(windows) * 1e6
+
+
+def main(max_rows=1_000_000):
+    rng = np.random.default_rng(1)
+    print(f"{'rows':>10} {'scan (us)':>12} {'index (us)':>12} {'speedup':>8}")
+    n_rows = 10_000
+    while n_rows <= max_rows:
+        store = make_store(n_rows)
+        first, last = store.timestamp[0], store.timestamp[-1]
+        windows = []
+        for _ in range(QUERIES):
+            start = first + np.timedelta64(int(rng.integers(0, n_rows)), "s")
+            windows.append((ROOMS[rng.integers(0, len(ROOMS))], start, min(start + np.timedelta64(3600, "s"), last)))
+        scan = time_queries(linear_scan, store, windows)
+        index = time_queries(lambda s, room, start, end: s.query(room, start, end), store, windows)
+        print(f"{n_rows:>10} {scan:>12.1f} {index:>12.1f} {scan / index:>7.1f}x")
+        n_rows *= 10
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
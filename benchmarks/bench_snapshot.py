@@ -0,0 +1,41 @@
+"""
+Startup benchmark: parsing the CSV (cold) versus loading the binary snapshot (warm).
+Run from the project root with: python -m benchmarks.bench_snapshot [rows]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from benchmarks.bench_query import make_store
+from src.log_reader import LogReader
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main(n_rows=1_000_000):
+    workdir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(workdir, "logs.csv")
+        snapshot_dir = os.path.join(workdir, "snapshot")
+        make_store(n_rows).to_frame().to_csv(csv_path, index=False)
+        reader = LogReader(csv_path)
+        _, parse = timed(lambda: reader.read_store())
+        _, cold = timed(lambda: reader.read_store(snapshot_dir=snapshot_dir))
+        store, warm = timed(lambda: reader.read_store(snapshot_dir=snapshot_dir))
+        _, first_scan = timed(lambda: float(store.temperatura.sum()))
+        print(f"rows: {n_rows}")
+        print(f"CSV parse only:         {parse:8.3f} s")
+        print(f"cold (parse + snapshot): {cold:8.3f} s")
+        print(f"warm (snapshot load):    {warm:8.3f} s  ({parse / warm:.1f}x faster than parsing)")
+        print(f"first full column scan:  {first_scan:8.3f} s")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,53 @@
+"""
+Startup benchmark of the API: time until the app answers liveness checks versus
+time until the dataset is loaded and readiness turns green.
+Run from the project root with: python -m benchmarks.bench_startup [rows]
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from benchmarks.bench_query import make_store
+
+CHILD = """
+import json, time
+started = time.perf_counter()
+import src.api as api
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(api.app) as client:
+    assert client.get("/health/live").status_code == 200
+    live = time.perf_counter()
+    early = client.get("/health/ready").status_code
+    while client.get("/health/ready").status_code != 200:
+        time.sleep(0.005)
+    ready = time.perf_counter()
+print(json.dumps({"import": imported - started, "live": live - started, "ready": ready - started, "ready_status_at_live": early}))
+"""
+
+
+def run(env):
+    output = subprocess.run([sys.executable, "-c", CHILD], env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(n_rows=1_000_000):
+    workdir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(workdir, "logs.csv")
+        make_store(n_rows).to_frame().to_csv(csv_path, index=False)
+        env = dict(os.environ, LOGS_PATH=csv_path)
+        print(f"rows: {n_rows}")
+        for label, extra in (("CSV", {}), ("snapshot (cold)", {"LOGS_SNAPSHOT_DIR": os.path.join(workdir, "snap")}),
+                             ("snapshot (warm)", {"LOGS_SNAPSHOT_DIR": os.path.join(workdir, "snap")})):
+            result = run(dict(env, **extra))
+            print(f"{label:16} import {result['import']:6.3f} s | live {result['live']:6.3f} s "
+                  f"(ready={result['ready_status_at_live']}) | ready {result['ready']:6.3f} s")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,62 @@
+"""
+Throughput benchmark of TemporalCache: sustained inserts with late events, and lookups.
+Run from the project root with: python -m benchmarks.bench_temporal_cache [events] [rooms]
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+import numpy as np
+from src.cache import TemporalCache
+from src.log import Log
+
+
+def make_events(n_events, n_rooms, late_ratio=0.05, rate_per_second=1000, seed=0):
+    """
+    Build a stream of logs at a fixed event rate, with a fraction delivered late.
+
+    Args:
+        n_events (int): Number of logs to generate.
+        n_rooms (int): Number of distinct rooms.
+        late_ratio (float): Fraction of logs delayed by up to 30 seconds.
+        rate_per_second (int): Event-time rate of the stream.
+        seed (int): Random seed.
+    Returns:
+        list: Log objects in arrival order.
+    """
+    rng = np.random.default_rng(seed)
+    start = datetime(2025, 5, 1, 8, 0, 0)
+    offsets = np.arange(n_events) / rate_per_second
+    late = rng.random(n_events) < late_ratio
+    offsets[late] -= rng.uniform(0, 30, late.sum())
+    rooms = rng.integers(0, n_rooms, n_events)
+    return [
+        Log(start + timedelta(seconds=float(offset)), f"Sala_{room}", "INFO", 22.0, 50.0, 800.0)
+        for offset, room in zip(offsets, rooms)
+    ]
+
+
+def main(n_events=200_000, n_rooms=100):
+    events = make_events(n_events, n_rooms)
+    cache = TemporalCache(window_minutes=1, allowed_lateness_seconds=30)
+    started = time.perf_counter()
+    cache.add_logs(events)
+    elapsed = time.perf_counter() - started
+    print(f"inserts: {n_events} events, {n_rooms} rooms -> {n_events / elapsed:,.0f} events/s "
+          f"(cached {len(cache)}, late dropped {cache.late_dropped})")
+
+    lookups = 10_000
+    started = time.perf_counter()
+    for i in range(lookups):
+        cache.get_logs_by_room(f"Sala_{i % n_rooms}")
+    by_room = (time.perf_counter() - started) / lookups * 1e6
+    recent = events[-lookups:]
+    started = time.perf_counter()
+    for log in recent:
+        cache.get_logs_by_timestamp(log.timestamp)
+    by_timestamp = (time.perf_counter() - started) / lookups * 1e6
+    print(f"lookups: by room {by_room:.1f} us, by timestamp {by_timestamp:.2f} us")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
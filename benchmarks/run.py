@@ -0,0 +1,252 @@
+"""
+Benchmark suite over synthetic datasets of growing size, with machine-readable results.
+Run from the project root with, e.g.:
+    python -m benchmarks.run --sizes 10000,100000,1000000 --output results.json
+    python -m benchmarks.run --sizes 10000,100000 --baseline results.json
+
+Each benchmark is repeated and its best and median wall times are written as JSON together
+with the commit, so results of two commits can be compared with --baseline.
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+import numpy as np
+from benchmarks.synthetic import write_csv
+from src.cache import TemporalCache
+from src.export_jobs import ExportJobManager
+from src.log_reader import LogReader
+from src.reports_critical_alerts import CriticalAlertsStrategy
+from src.reports_state_by_room import StateByRoomStrategy
+
+# The row-by-row parser is skipped above this size to keep runs short
+ROW_PATH_MAX_ROWS = 200_000
+# The TemporalCache benchmarks are fed at most this many rows, built as Log objects
+TEMPORAL_CACHE_MAX_ROWS = 200_000
+# XLSX exports are skipped above this many rows
+XLSX_MAX_ROWS = 200_000
+LOOKUPS = 1_000
+QUERY_WINDOW = np.timedelta64(1, "h")
+
+
+def measure(func, repeat, setup=None):
+    """
+    Time a function.
+
+    Args:
+        func (callable): The code to time.
+        repeat (int): Number of runs.
+        setup (callable, optional): Called before each run, outside the timing.
+    Returns:
+        dict: Best and median wall time in seconds over the runs.
+    """
+    times = []
+    # Validation warnings of the invalid rows are discarded to keep the output readable
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            if setup:
+                setup()
+            started = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - started)
+    return {"best": min(times), "median": statistics.median(times)}
+
+
+def bench_size(n_rows, workdir, args):
+    """
+    Run every benchmark on a synthetic dataset of n_rows rows.
+
+    Args:
+        n_rows (int): Dataset size.
+        workdir (str): Scratch directory for the dataset and exports.
+        args (argparse.Namespace): Command-line options.
+    Returns:
+        list: Result dicts (benchmark, rows, best, median, extra fields).
+    """
+    results = []
+
+    def record(name, timing, **extra):
+        results.append({"benchmark": name, "rows": n_rows, **timing, **extra})
+        print(f"{n_rows:>10} {name:<36} best {timing['best']:9.4f} s  median {timing['median']:9.4f} s")
+
+    csv_path = os.path.join(workdir, f"logs_{n_rows}.csv")
+    write_csv(csv_path, n_rows, rooms=args.rooms, invalid_ratio=args.invalid_ratio,
+              out_of_order_ratio=args.out_of_order_ratio, seed=args.seed)
+    reader = LogReader(csv_path)
+    if n_rows <= ROW_PATH_MAX_ROWS:
+        record("log_reader.read_logs", measure(reader.read_logs, args.repeat))
+    record("log_reader.read_logs_vectorized", measure(lambda: reader.read_logs(vectorized=True), args.repeat))
+    record("log_reader.read_store", measure(reader.read_store, args.repeat))
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        store = reader.read_store()
+    logs = list(itertools.islice(store, TEMPORAL_CACHE_MAX_ROWS))
+    record("temporal_cache.add_logs", measure(lambda: TemporalCache().add_logs(logs), args.repeat), cache_rows=len(logs))
+    cache = TemporalCache()
+    cache.add_logs(logs)
+    rng = np.random.default_rng(args.seed)
+    rooms = [store.rooms[i] for i in rng.integers(0, len(store.rooms), LOOKUPS)]
+    recent = [logs[i].timestamp for i in rng.integers(max(0, len(logs) - LOOKUPS), len(logs), LOOKUPS)]
+    record("temporal_cache.get_logs_by_room", measure(lambda: [cache.get_logs_by_room(r) for r in rooms], args.repeat),
+           lookups=LOOKUPS, cache_rows=len(logs))
+    record("temporal_cache.get_logs_by_timestamp",
+           measure(lambda: [cache.get_logs_by_timestamp(t) for t in recent], args.repeat), lookups=LOOKUPS, cache_rows=len(logs))
+
+    record("report.state_by_room", measure(lambda: StateByRoomStrategy().generate(store), args.repeat))
+    record("report.critical_alerts", measure(lambda: CriticalAlertsStrategy().generate(store), args.repeat))
+
+    bench_api(store, n_rows, workdir, args, record)
+    return results
+
+
+def bench_api(store, n_rows, workdir, args, record):
+    """
+    Benchmark the query and export endpoints through the ASGI app.
+
+    Args:
+        store (LogStore): The dataset served by the app.
+        n_rows (int): Dataset size.
+        workdir (str): Scratch directory for the exports.
+        args (argparse.Namespace): Command-line options.
+        record (callable): Called with the name and timing of each benchmark.
+    """
+    from fastapi.testclient import TestClient
+    from src import api
+
+    api.reload_logs(store)
+    api.dataset_ready.set()
+    client = TestClient(api.app)
+    rng = np.random.default_rng(args.seed)
+    first, last = store.timestamp.min(), store.timestamp.max()
+    span = max(int((last - first) / np.timedelta64(1, "s")), 1)
+    windows = []
+    for _ in range(args.queries):
+        start = first + np.timedelta64(int(rng.integers(0, span)), "s")
+        windows.append({
+            "start_time_date": str(start.astype("datetime64[s]")).replace("T", " "),
+            "end_time_date": str((start + QUERY_WINDOW).astype("datetime64[s]")).replace("T", " "),
+            "room": store.rooms[int(rng.integers(0, len(store.rooms)))],
+        })
+    query_all = {
+        "start_time_date": str(first.astype("datetime64[s]")).replace("T", " "),
+        "end_time_date": str(last.astype("datetime64[s]")).replace("T", " "),
+        "room": store.rooms[0],
+    }
+
+    def get(path, params=None):
+        response = client.get(path, params=params)
+        response.raise_for_status()
+        return response.content
+
+    record("api.logs_query", measure(lambda: [get("/logs/query", w) for w in windows], args.repeat),
+           queries=args.queries)
+    record("api.logs_aggregate", measure(lambda: [get("/logs/aggregate", w) for w in windows], args.repeat),
+           queries=args.queries)
+    record("api.rooms", measure(lambda: [get("/rooms") for _ in windows], args.repeat), queries=args.queries)
+    exports = [
+        ("api.export.state_by_room", "/report/state_by_room/export", None),
+        ("api.export.critical_alerts", "/report/critical_alerts/export", None),
+        ("api.export.logs_query", "/logs/query/export", query_all),
+    ]
+    formats = ["csv"]
+    if n_rows <= XLSX_MAX_ROWS and api._xlsx_unavailable() is None:
+        formats.append("xlsx")
+    previous = os.getcwd()
+    os.chdir(workdir)
+    try:
+        for name, path, params in exports:
+            for format in formats:
+                record(f"{name}.{format}", measure(
+                    lambda: get(path, {**(params or {}), "format": format}), args.repeat,
+                    setup=api.report_cache.clear,
+                ))
+
+        def export_job():
+            job = client.post("/exports", params={"report": "critical_alerts", "format": "csv"}).json()
+            while client.get(f"/exports/{job['id']}").json()["status"] not in ("done", "failed"):
+                time.sleep(0.001)
+
+        def fresh_jobs():
+            api.report_cache.clear()
+            api.export_jobs = ExportJobManager(tempfile.mkdtemp(dir=workdir))
+
+        record("api.export_job.critical_alerts.csv", measure(export_job, args.repeat, setup=fresh_jobs))
+    finally:
+        os.chdir(previous)
+
+
+def git_commit():
+    """
+    Return the current commit hash, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """
+    Print the median time of each benchmark relative to a previous run.
+
+    Args:
+        results (list): Results of this run.
+        baseline_path (str): JSON file written by a previous run.
+    """
+    with open(baseline_path) as f:
+        baseline = {(r["benchmark"], r["rows"]): r for r in json.load(f)["results"]}
+    print(f"\n{'benchmark':<40} {'rows':>10} {'baseline':>10} {'now':>10} {'ratio':>7}")
+    for result in results:
+        before = baseline.get((result["benchmark"], result["rows"]))
+        if before:
+            ratio = result["median"] / before["median"]
+            print(f"{result['benchmark']:<40} {result['rows']:>10} {before['median']:>10.4f} "
+                  f"{result['median']:>10.4f} {ratio:>6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the EcoWatch benchmark suite.")
+    parser.add_argument("--sizes", default="10000,100000", help="comma-separated dataset sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--queries", type=int, default=100, help="/logs/query requests per run")
+    parser.add_argument("--rooms", type=int, default=20)
+    parser.add_argument("--invalid-ratio", type=float, default=0.01)
+    parser.add_argument("--out-of-order-ratio", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark-results.json", help="JSON file to write")
+    parser.add_argument("--baseline", help="JSON file of a previous run to compare against")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    results = []
+    try:
+        for n_rows in (int(size) for size in args.sizes.split(",")):
+            results.extend(bench_size(n_rows, workdir, args))
+    finally:
+        shutil.rmtree(workdir)
+    report = {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "options": vars(args),
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nresults written to {args.output}")
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Synthetic EcoWatch logs in the schema of dataset/logs_ambientales_ecowatch.csv.
+Run from the project root with, e.g.:
+    python -m benchmarks.synthetic logs.csv --rows 1000000 --rooms 50 --invalid-ratio 0.01 --out-of-order-ratio 0.02
+"""
+import argparse
+import numpy as np
+import pandas as pd
+
+STATES = np.array(["INFO", "WARNING", "ERROR"], dtype=object)
+# State frequencies of the sample dataset
+STATE_WEIGHTS = [0.68, 0.21, 0.11]
+# Ways a row is made invalid, by the column they break
+INVALID_KINDS = ("missing_timestamp", "bad_timestamp", "missing_room", "bad_number", "missing_co2")
+
+
+def iter_frames(n_rows=None, rooms=20, duration_seconds=None, rate=1.0, invalid_ratio=0.0,
+                out_of_order_ratio=0.0, max_delay_seconds=300, start="2025-05-01T08:00:00",
+                chunk_rows=1_000_000, seed=0):
+    """
+    Generate synthetic logs chunk by chunk, in file order.
+
+    Readings arrive as a Poisson process at `rate` readings per second across all rooms.
+    Each room has its own baseline climate; about 1% of readings spike above the
+    critical alert thresholds.
+
+    Args:
+        n_rows (int, optional): Number of rows (defaults to duration_seconds * rate).
+        rooms (int): Number of rooms (named Sala_1 ... Sala_N).
+        duration_seconds (float, optional): Time span covered by the logs. With n_rows it sets the rate.
+        rate (float): Readings per second across all rooms (ignored if both n_rows and duration are given).
+        invalid_ratio (float): Fraction of rows with a missing or malformed field.
+        out_of_order_ratio (float): Fraction of rows delayed by up to max_delay_seconds in the file.
+        max_delay_seconds (float): Maximum delay of out-of-order rows.
+        start (str): Timestamp of the first reading.
+        chunk_rows (int): Rows per generated chunk.
+        seed (int): Random seed.
+    Yields:
+        pd.DataFrame: Chunks with the CSV columns, as they would be read from the file.
+    Raises:
+        ValueError: If neither n_rows nor duration_seconds is given.
+    """
+    if n_rows is None and duration_seconds is None:
+        raise ValueError("Give n_rows or duration_seconds.")
+    if n_rows is None:
+        n_rows = int(duration_seconds * rate)
+    elif duration_seconds is not None:
+        rate = n_rows / duration_seconds
+    rng = np.random.default_rng(seed)
+    names = np.array([f"Sala_{i}" for i in range(1, rooms + 1)], dtype=object)
+    base_temperature = rng.uniform(19, 25, rooms)
+    base_humidity = rng.uniform(40, 60, rooms)
+    base_co2 = rng.uniform(500, 900, rooms)
+    origin = np.datetime64(start, "s")
+    elapsed = 0.0
+    for offset in range(0, n_rows, chunk_rows):
+        size = min(chunk_rows, n_rows - offset)
+        seconds = elapsed + np.cumsum(rng.exponential(1 / rate, size))
+        elapsed = seconds[-1]
+        late = rng.random(size) < out_of_order_ratio
+        seconds[late] = np.maximum(seconds[late] - rng.uniform(0, max_delay_seconds, late.sum()), 0)
+        room = rng.integers(0, rooms, size)
+        spike = rng.random(size) < 0.01
+        temperature = np.round(base_temperature[room] + rng.normal(0, 1.5, size) + spike * rng.uniform(0, 12, size), 1)
+        humidity = np.round(np.clip(base_humidity[room] + rng.normal(0, 5, size) + spike * rng.uniform(0, 30, size), 0, 100), 1)
+        co2 = np.round(base_co2[room] + rng.normal(0, 120, size) + spike * rng.uniform(0, 600, size)).astype(np.int64)
+        frame = pd.DataFrame({
+            "timestamp": np.datetime_as_string(origin + seconds.astype(np.int64).astype("timedelta64[s]"), unit="s"),
+            "sala": names[room],
+            "estado": STATES[rng.choice(len(STATES), size, p=STATE_WEIGHTS)],
+            "temperatura": temperature,
+            "humedad": humidity,
+            "co2": co2,
+        })
+        frame["mensaje"] = (
+            "Medición registrada: T=" + frame["temperatura"].astype(str) + "°C, H="
+            + frame["humedad"].astype(str) + "%, CO2=" + frame["co2"].astype(str) + "ppm"
+        )
+        _break_rows(frame, rng, invalid_ratio)
+        yield frame
+
+
+def generate_frame(n_rows=None, **kwargs):
+    """
+    Generate synthetic logs as a single DataFrame (see iter_frames for the arguments).
+
+    Returns:
+        pd.DataFrame: The logs, in file order.
+    """
+    return pd.concat(iter_frames(n_rows, **kwargs), ignore_index=True)
+
+
+def write_csv(path, n_rows=None, **kwargs):
+    """
+    Write synthetic logs to a CSV file chunk by chunk (see iter_frames for the arguments).
+
+    Args:
+        path (str): Output file.
+        n_rows (int, optional): Number of rows.
+    Returns:
+        int: Number of rows written.
+    """
+    written = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for frame in iter_frames(n_rows, **kwargs):
+            frame.to_csv(f, index=False, header=not written)
+            written += len(frame)
+    return written
+
+
+def _break_rows(frame, rng, invalid_ratio):
+    """
+    Make a fraction of the rows invalid, in place.
+    """
+    broken = np.flatnonzero(rng.random(len(frame)) < invalid_ratio)
+    if not len(broken):
+        return
+    kinds = rng.integers(0, len(INVALID_KINDS), len(broken))
+    for kind, column, value in (
+        (0, "timestamp", None),
+        (1, "timestamp", "2025/05/01 08:00:00"),
+        (2, "sala", None),
+        (3, "temperatura", "n/a"),
+        (4, "co2", None),
+    ):
+        rows = broken[kinds == kind]
+        if len(rows):
+            if frame[column].dtype != object:
+                frame[column] = frame[column].astype(object)
+            frame.loc[rows, column] = value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic EcoWatch logs as CSV.")
+    parser.add_argument("output", help="CSV file to write")
+    parser.add_argument("--rows", type=int, help="number of rows (default: duration * rate)")
+    parser.add_argument("--rooms", type=int, default=20)
+    parser.add_argument("--duration", type=float, help="time span in seconds")
+    parser.add_argument("--rate", type=float, default=1.0, help="readings per second across all rooms")
+    parser.add_argument("--invalid-ratio", type=float, default=0.0)
+    parser.add_argument("--out-of-order-ratio", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if args.rows is None and args.duration is None:
+        parser.error("give --rows or --duration")
+    written = write_csv(
+        args.output, args.rows, rooms=args.rooms, duration_seconds=args.duration, rate=args.rate,
+        invalid_ratio=args.invalid_ratio, out_of_order_ratio=args.out_of_order_ratio, seed=args.seed,
+    )
+    print(f"wrote {written} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
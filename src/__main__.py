@@ -13,23 +13,18 @@ if __name__ == "__main__":
         sys.exit(1)
     log_path = sys.argv[1]
 
-    # Read and validate logs
+    # Read and validate logs into the columnar store
     reader = LogReader(log_path)
-    logs = reader.read_logs()
+    logs = reader.read_store()
     print(f"Loaded {len(logs)} valid logs.")
 
     # Set up the report factory and register default reports
     factory = ReportFactory()
     factory.register_default_reports()
 
-    # Generate and print State by Room report
-    state_report = factory.create_report("state_by_room")
-    state_df = state_report.generate(logs)
+    # Generate both reports from the same columnar store
+    reports = factory.generate_many(["state_by_room", "critical_alerts"], logs)
     print("\nState by Room Report:")
-    print(state_df)
-
-    # Generate and print Critical Alerts report
-    alerts_report = factory.create_report("critical_alerts")
-    alerts_df = alerts_report.generate(logs)
+    print(reports["state_by_room"])
     print("\nCritical Alerts Report:")
-    print(alerts_df) 
\ No newline at end of file
+    print(reports["critical_alerts"])
@@ -0,0 +1,202 @@
+import json
+import numpy as np
+
+# Report metric names and the LogStore columns they are read from
+METRICS = {"temperature": "temperatura", "humidity": "humedad", "co2": "co2"}
+
+
+class ThresholdRule:
+    """
+    Fires when a metric leaves the [lower, upper] range.
+    Each bound is either a number applied to every room or a dict mapping room names to
+    bounds, with an optional "default" entry for the rooms not listed. Per-room bounds are
+    compiled into a lookup array indexed by room code, so hundreds of rooms still cost a
+    single gather and comparison per bound.
+    """
+    def __init__(self, name, metric, lower=None, upper=None, rooms=None):
+        """
+        Initialize the rule.
+
+        Args:
+            name (str): Name the alerts raised by this rule are tagged with.
+            metric (str): One of METRICS ("temperature", "humidity" or "co2").
+            lower (float or dict, optional): Values strictly below it fire the rule.
+            upper (float or dict, optional): Values strictly above it fire the rule.
+            rooms (list, optional): Restrict the rule to these rooms.
+        Raises:
+            ValueError: If the metric is unknown or no bound is given.
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Use one of: {', '.join(METRICS)}")
+        if lower is None and upper is None:
+            raise ValueError(f"Rule '{name}' needs a lower or upper bound.")
+        self.name = name
+        self.metric = metric
+        self.lower = lower
+        self.upper = upper
+        self.rooms = rooms
+
+    def mask(self, store):
+        """
+        Evaluate the rule over every row of a store.
+
+        Args:
+            store (LogStore): The logs to check.
+        Returns:
+            np.ndarray: Boolean mask of the rows that fire the rule.
+        """
+        values = getattr(store, METRICS[self.metric])
+        mask = np.zeros(len(store), dtype=bool)
+        if self.lower is not None:
+            mask |= values < _bounds(store, self.lower, -np.inf)
+        if self.upper is not None:
+            mask |= values > _bounds(store, self.upper, np.inf)
+        return mask & _room_mask(store, self.rooms)
+
+
+class CompoundRule:
+    """
+    Combines other rules: fires when all of them (mode "all") or any of them (mode "any")
+    fire for the same reading.
+    """
+    def __init__(self, name, rules, mode="all", rooms=None):
+        """
+        Initialize the rule.
+
+        Args:
+            name (str): Name the alerts raised by this rule are tagged with.
+            rules (list): The ThresholdRule or CompoundRule instances to combine.
+            mode (str): "all" or "any".
+            rooms (list, optional): Restrict the rule to these rooms.
+        Raises:
+            ValueError: If the mode is unknown or no rule is given.
+        """
+        if mode not in ("all", "any"):
+            raise ValueError(f"Unknown mode '{mode}'. Use 'all' or 'any'.")
+        if not rules:
+            raise ValueError(f"Rule '{name}' needs at least one rule to combine.")
+        self.name = name
+        self.rules = rules
+        self.mode = mode
+        self.rooms = rooms
+
+    def mask(self, store):
+        """
+        Evaluate the rule over every row of a store.
+
+        Args:
+            store (LogStore): The logs to check.
+        Returns:
+            np.ndarray: Boolean mask of the rows that fire the rule.
+        """
+        combine = np.logical_and if self.mode == "all" else np.logical_or
+        mask = combine.reduce([rule.mask(store) for rule in self.rules])
+        return mask & _room_mask(store, self.rooms)
+
+
+class RuleSet:
+    """
+    Ordered collection of alert rules. A reading that fires several rules is tagged
+    with the first one, so rules are listed by priority.
+    """
+    def __init__(self, rules):
+        """
+        Initialize the rule set.
+
+        Args:
+            rules (list): ThresholdRule and CompoundRule instances, by priority.
+        """
+        self.rules = list(rules)
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build a rule set from its declarative description.
+
+        Each entry is a dict with a "name" and either "metric" with "lower"/"upper"
+        (a threshold rule) or "all"/"any" with a list of nested entries (a compound
+        rule). Any entry may restrict itself to a list of "rooms". Nested entries
+        may omit their name.
+
+        Args:
+            config (list): The rule descriptions.
+        Returns:
+            RuleSet: The compiled rule set.
+        """
+        return cls(_rule_from_config(entry) for entry in config)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a rule set from a JSON file (see from_config for the format).
+
+        Args:
+            path (str): Path to the JSON file.
+        Returns:
+            RuleSet: The compiled rule set.
+        """
+        with open(path) as f:
+            return cls.from_config(json.load(f))
+
+    def evaluate(self, store):
+        """
+        Find the rows that fire any rule and the rule each one is tagged with.
+
+        Args:
+            store (LogStore): The logs to check.
+        Returns:
+            tuple: (np.ndarray of row ids in store order, np.ndarray of rule names).
+        """
+        fired = np.full(len(store), -1, dtype=np.int32)
+        for i, rule in enumerate(self.rules):
+            fired[(fired < 0) & rule.mask(store)] = i
+        ids = np.flatnonzero(fired >= 0)
+        names = np.array([rule.name for rule in self.rules], dtype=object)
+        return ids, names[fired[ids]]
+
+
+def _rule_from_config(entry):
+    """
+    Build one rule from its declarative description (see RuleSet.from_config).
+    """
+    name = entry.get("name")
+    if name is None:
+        name = entry.get("metric") or ("all" if "all" in entry else "any")
+    for mode in ("all", "any"):
+        if mode in entry:
+            rules = [_rule_from_config(child) for child in entry[mode]]
+            return CompoundRule(name, rules, mode=mode, rooms=entry.get("rooms"))
+    if "metric" not in entry:
+        raise ValueError(f"Rule '{name}' needs a 'metric' or an 'all'/'any' list.")
+    return ThresholdRule(name, entry["metric"], entry.get("lower"), entry.get("upper"), entry.get("rooms"))
+
+
+def _bounds(store, bound, missing):
+    """
+    Resolve a bound to a scalar or to one value per row.
+
+    Args:
+        store (LogStore): The logs being checked.
+        bound (float or dict): A number, or a dict of per-room bounds with an optional "default".
+        missing (float): Bound used for rooms without one (never fires).
+    Returns:
+        float or np.ndarray: The bound to compare each row against.
+    """
+    if not isinstance(bound, dict):
+        return bound
+    by_code = np.full(len(store.rooms), bound.get("default", missing), dtype=np.float64)
+    for room, value in bound.items():
+        code = store.room_code(room)
+        if code is not None:
+            by_code[code] = value
+    return by_code[store.sala_codes]
+
+
+def _room_mask(store, rooms):
+    """
+    Mask of the rows belonging to the given rooms (every row when rooms is None).
+    """
+    if rooms is None:
+        return np.ones(len(store), dtype=bool)
+    codes = [code for code in map(store.room_code, rooms) if code is not None]
+    return np.isin(store.sala_codes, codes)
@@ -1,131 +1,659 @@
-from fastapi import FastAPI, Query, Response
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from contextlib import asynccontextmanager
 from typing import Optional
 from src.log_reader import LogReader
-from src.report_factory import ReportFactory, export_report
-import pandas as pd
+from src.report_factory import (
+    ReportFactory, frame_to_xlsx, iter_csv_export, iter_frame_chunks, iter_ndjson, write_export, write_xlsx,
+)
+from src.export_jobs import ExportJobManager
+from src.cache import ReportCache, TemporalCache
+from src.ingest import IngestQueue
+from src.log_follower import LogFollower
+from src.log_store import LogStore
+from src.reports_state_by_room import StateByRoomAggregator
+from src.reports_critical_alerts import CriticalAlertsReport, CriticalAlertsStrategy
+from src.reports_anomalies import AnomalyDetector
+from src.alert_rules import RuleSet
+from src.rollups import Rollups
+from src.shared_dataset import SharedDataset
+from src.messages import compression_stats
+from src.metrics import REQUEST_METRIC, metrics
+from src.workers import WorkerPool
 import os
 from dotenv import load_dotenv
+import asyncio
+import base64
+import functools
 import io
+import json
+import threading
+import time
+import numpy as np
+import pandas as pd
 from datetime import datetime
 
-app = FastAPI(title="EcoWatch API")
+@asynccontextmanager
+async def lifespan(app):
+    """
+    Start background work when the app starts and stop it on shutdown.
+    The dataset is loaded in a background thread, so health checks are answered
+    immediately and data endpoints answer 503 until it is ready.
+    """
+    threading.Thread(target=load_dataset, name="ecowatch-loader", daemon=True).start()
+    ingest_queue.start()
+    yield
+    ingest_queue.stop(timeout=5)
+    log_follower.stop()
+    if shared_dataset:
+        shared_dataset.stop()
+    worker_pool.shutdown()
+
+app = FastAPI(title="EcoWatch API", lifespan=lifespan)
 
 # Load environment variables from .env
 load_dotenv()
 LOGS_PATH = os.getenv("LOGS_PATH", "dataset/logs_ambientales_ecowatch.csv")
 
-# Load logs and set up factory at startup (for demo purposes)
-log_reader = LogReader(LOGS_PATH)
-logs = log_reader.read_logs()
 report_factory = ReportFactory()
 report_factory.register_default_reports()
+# ALERT_RULES_PATH points to a JSON rule set (see RuleSet.from_config) replacing the default alert thresholds
+if os.getenv("ALERT_RULES_PATH"):
+    alert_rules = RuleSet.load(os.getenv("ALERT_RULES_PATH"))
+    report_factory.register_report("critical_alerts", lambda: CriticalAlertsReport(CriticalAlertsStrategy(alert_rules)))
+report_cache = ReportCache(maxsize=int(os.getenv("REPORT_CACHE_SIZE", "32")))
+# Most recent anomalies kept by the streaming detector behind /report/anomalies
+ANOMALY_MAX_ROWS = int(os.getenv("ANOMALY_MAX_ROWS", "10000"))
+
+# Report generation and export serialization run on a worker pool instead of the request
+# threads, with XLSX serialization in worker processes (XLSX_PROCESSES=0 keeps it in threads).
+# Each group of heavy endpoints has a concurrency limit; requests beyond it wait for a slot.
+worker_pool = WorkerPool(
+    threads=int(os.getenv("REPORT_WORKERS", "4")),
+    processes=int(os.getenv("XLSX_PROCESSES", "2")),
+)
+report_slots = asyncio.Semaphore(int(os.getenv("REPORT_CONCURRENCY", "4")))
+export_slots = asyncio.Semaphore(int(os.getenv("EXPORT_CONCURRENCY", "2")))
+
+# Timings exposed at /metrics; METRICS_ENABLED=0 turns the timers into no-ops
+metrics.enabled = os.getenv("METRICS_ENABLED", "1") != "0"
+metrics.gauge("ecowatch_report_cache_hits", "Report cache hits.", lambda: report_cache.stats()["hits"])
+metrics.gauge("ecowatch_report_cache_misses", "Report cache misses.", lambda: report_cache.stats()["misses"])
+metrics.gauge("ecowatch_report_cache_coalesced", "Report requests that waited for an identical computation.", lambda: report_cache.stats()["coalesced"])
+metrics.gauge("ecowatch_report_cache_hit_ratio", "Report cache hit ratio.", lambda: report_cache.stats()["hit_ratio"])
+
+ingest_lock = threading.Lock()
+
+def reload_logs(store):
+    """
+    Replace the live dataset and rebuild the report state kept on ingest.
+
+    Args:
+        store (LogStore): The complete set of valid logs.
+    """
+    global log_store, state_aggregator, temporal_cache, rollups, anomaly_detector
+    aggregator = StateByRoomAggregator()
+    aggregator.add_batch(store)
+    buckets = Rollups()
+    buckets.add_batch(store)
+    detector = AnomalyDetector(max_anomalies=ANOMALY_MAX_ROWS)
+    detector.add_batch(store)
+    cache = TemporalCache()
+    if len(store):
+        recent = store.timestamp >= store.timestamp.max() - np.timedelta64(cache.window)
+        cache.add_logs(store[int(i)] for i in np.flatnonzero(recent))
+    with ingest_lock:
+        log_store, state_aggregator, temporal_cache, rollups, anomaly_detector = store, aggregator, cache, buckets, detector
+        # The new dataset comes from the source files, which never saw the pushed readings
+        pushed_rows["discarded"] += pushed_rows["live"]
+        pushed_rows["live"] = 0
+
+def ingest_logs(batch, pushed=False):
+    """
+    Append a batch of validated logs to the live dataset and the report state kept on ingest.
+
+    Args:
+        batch (LogStore): The logs to add.
+        pushed (bool): Whether the logs were pushed through POST /logs/batch rather than
+            read from the source files.
+    """
+    with ingest_lock:
+        if pushed:
+            pushed_rows["live"] += len(batch)
+        log_store.append_store(batch)
+        state_aggregator.add_batch(batch)
+        # Every ingested log is scored, including logs the TemporalCache drops as late,
+        # so anomalies do not depend on whether a reading arrived through a reload or ingest
+        anomaly_detector.add_batch(batch)
+        temporal_cache.add_logs(batch)
+        rollups.add_batch(batch)
+
+# Live dataset, filled by load_dataset() once the app has started
+log_store = LogStore()
+state_aggregator = StateByRoomAggregator()
+anomaly_detector = AnomalyDetector(max_anomalies=ANOMALY_MAX_ROWS)
+temporal_cache = TemporalCache()
+rollups = Rollups()
+dataset_ready = threading.Event()
+dataset_status = {"status": "loading", "error": None, "load_seconds": None}
+# Readings pushed through POST /logs/batch are kept in memory only: a reload replaces the
+# dataset with the source files and discards them. "live" counts the pushed rows in the
+# current dataset, "discarded" those lost to reloads since startup.
+pushed_rows = {"live": 0, "discarded": 0}
+
+# LOGS_PATH may also be a directory of CSV shards or a glob pattern; shards are parsed in
+# parallel. With LOGS_FOLLOW_SECONDS > 0 a single file is followed after loading: appended
+# rows are ingested and a rotated file is reloaded.
+LOGS_FOLLOW_SECONDS = float(os.getenv("LOGS_FOLLOW_SECONDS", "0"))
+log_reader = LogReader(LOGS_PATH)
+log_follower = LogFollower(log_reader, on_append=ingest_logs, on_reload=reload_logs)
+
+# With SHARED_DATASET_DIR set, workers do not parse the logs: they map the dataset published
+# there by a loader process (python -m src.shared_dataset) read-only, so memory stays flat as
+# uvicorn workers are added, and swap to each new generation within SHARED_DATASET_POLL_SECONDS.
+SHARED_DATASET_DIR = os.getenv("SHARED_DATASET_DIR")
+SHARED_DATASET_POLL_SECONDS = float(os.getenv("SHARED_DATASET_POLL_SECONDS", "1"))
+shared_dataset = SharedDataset(SHARED_DATASET_DIR) if SHARED_DATASET_DIR else None
+
+def load_dataset():
+    """
+    Load the logs and mark the API as ready (run in a background thread at startup).
+    """
+    started = time.perf_counter()
+    try:
+        if shared_dataset:
+            # Wait for the loader process to publish the first generation
+            store = shared_dataset.attach()
+            while store is None:
+                time.sleep(SHARED_DATASET_POLL_SECONDS)
+                store = shared_dataset.attach()
+            reload_logs(store)
+            shared_dataset.start(SHARED_DATASET_POLL_SECONDS, on_reload=reload_logs)
+        elif LOGS_FOLLOW_SECONDS > 0 and os.path.isfile(LOGS_PATH):
+            reload_logs(log_follower.load())
+            log_follower.start(LOGS_FOLLOW_SECONDS)
+        else:
+            # With LOGS_SNAPSHOT_DIR set, a binary snapshot of the validated logs is reused across restarts
+            reload_logs(log_reader.read_store(snapshot_dir=os.getenv("LOGS_SNAPSHOT_DIR")))
+    except Exception as e:
+        dataset_status.update(status="failed", error=str(e))
+        print(f"[WARN] Failed to load {LOGS_PATH}: {e}")
+        return
+    dataset_status.update(status="ready", load_seconds=time.perf_counter() - started)
+    dataset_ready.set()
+
+# Paths served while the dataset is still loading
+ALWAYS_AVAILABLE = ("/health", "/metrics", "/docs", "/redoc", "/openapi.json")
+
+@app.middleware("http")
+async def require_dataset(request: Request, call_next):
+    """
+    Answer 503 on data endpoints until the dataset is loaded.
+    """
+    if not dataset_ready.is_set() and not request.url.path.startswith(ALWAYS_AVAILABLE):
+        return JSONResponse(status_code=503, content={"error": f"Dataset is {dataset_status['status']}"}, headers={"Retry-After": "1"})
+    return await call_next(request)
+
+@app.middleware("http")
+async def record_latency(request: Request, call_next):
+    """
+    Record the latency of every request, labelled by route template, method and status.
+    """
+    if not metrics.enabled:
+        return await call_next(request)
+    started = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    metrics.observe(
+        REQUEST_METRIC, time.perf_counter() - started,
+        method=request.method, path=route.path if route else "unmatched", status=response.status_code,
+    )
+    return response
+
+@app.get("/metrics")
+def get_metrics():
+    """
+    Expose stage timings, request latency and report cache counters in the Prometheus text format.
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/health/live")
+def liveness():
+    """
+    Liveness probe: the process is up and serving requests.
+    """
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+def readiness():
+    """
+    Readiness probe: 200 once the dataset is loaded, 503 while loading or if loading failed.
+    """
+    if not dataset_ready.is_set():
+        return JSONResponse(status_code=503, content=dataset_status)
+    if shared_dataset:
+        return {**dataset_status, "rows": len(log_store), "generation": shared_dataset.generation}
+    return {**dataset_status, "rows": len(log_store), "pushed_rows_discarded": pushed_rows["discarded"]}
+
+# Live readings posted to /logs/batch are appended by a background consumer
+ingest_queue = IngestQueue(functools.partial(ingest_logs, pushed=True), maxsize=int(os.getenv("INGEST_QUEUE_SIZE", "100")))
 
 EXPORT_DIRS = {
     "csv": "src/reports/csv",
     "xlsx": "src/reports/xlsx"
 }
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+export_jobs = ExportJobManager(
+    os.getenv("EXPORT_CACHE_DIR", "src/reports/cache"),
+    max_bytes=int(os.getenv("EXPORT_CACHE_MAX_MB", "512")) * 1024 * 1024,
+    max_age_seconds=float(os.getenv("EXPORT_CACHE_MAX_AGE_SECONDS", "86400")),
+)
+
+def _xlsx_unavailable():
+    """
+    Check that the optional XLSX engine is installed, importing it only when an XLSX export is requested.
+
+    Returns:
+        JSONResponse or None: An error response if openpyxl is missing, None otherwise.
+    """
+    try:
+        import openpyxl  # noqa: F401
+    except ImportError:
+        return JSONResponse(status_code=501, content={"error": "XLSX export requires openpyxl (pip install openpyxl)"})
+    return None
+
+async def _export_response(name, format, frames):
+    """
+    Build the download response of an export and save a copy under EXPORT_DIRS.
+
+    CSV is streamed chunk by chunk and written to disk in the same pass, so memory and
+    time-to-first-byte do not grow with the export size. XLSX cannot be streamed: it is
+    serialized once in a worker process and the same bytes are saved and returned.
+    Both formats hold an export slot while they run and build their chunks off the event loop.
+
+    Args:
+        name (str): Base name of the exported file.
+        format (str): "csv" or "xlsx".
+        frames (iterable): Lazy iterable of the DataFrame chunks making up the export.
+    Returns:
+        Response: The download response.
+    """
+    export_dir = EXPORT_DIRS[format]
+    os.makedirs(export_dir, exist_ok=True)
+    filename = f"{name}.{format}"
+    path = os.path.join(export_dir, filename)
+    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    if format == "csv":
+        return StreamingResponse(_stream_csv(frames, path), media_type="text/csv", headers=headers)
+    unavailable = _xlsx_unavailable()
+    if unavailable:
+        return unavailable
+    async with export_slots:
+        with metrics.stage("export", format="xlsx"):
+            # pd.concat consumes the chunks in the worker thread
+            df = await worker_pool.run(pd.concat, frames, ignore_index=True)
+            content = await worker_pool.run_cpu(frame_to_xlsx, df)
+            await worker_pool.run(_write_file, path, content)
+    return Response(content, media_type=XLSX_MEDIA_TYPE, headers=headers)
+
+async def _stream_csv(frames, path):
+    """
+    Stream a CSV export while holding an export slot, producing each chunk in a thread.
+    """
+    chunks = iter_csv_export(frames, path)
+    async with export_slots:
+        try:
+            async for chunk in iterate_in_threadpool(chunks):
+                yield chunk
+        finally:
+            # Closing removes the partial file of an interrupted download
+            await run_in_threadpool(chunks.close)
+
+def _write_file(path, content):
+    """
+    Write bytes to a file.
+    """
+    with open(path, "wb") as f:
+        f.write(content)
+
+def _encode_cursor(store, row):
+    """
+    Build the opaque pagination cursor pointing after a row.
+
+    Args:
+        store (LogStore): The logs being paged through.
+        row (int): Position of the last row returned.
+    Returns:
+        str: URL-safe cursor encoding the row's timestamp and position.
+    """
+    ts = int(store.timestamp[row].astype("datetime64[us]").astype(np.int64))
+    return base64.urlsafe_b64encode(f"{ts}:{row}".encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor, store):
+    """
+    Decode a pagination cursor.
+
+    Args:
+        cursor (str): Cursor built by _encode_cursor.
+        store (LogStore): The logs being paged through.
+    Returns:
+        tuple: (np.datetime64 timestamp, int row position).
+    Raises:
+        ValueError: If the cursor is malformed or points outside the store.
+    """
+    try:
+        ts, row = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split(":")
+        ts, row = np.datetime64(int(ts), "us"), int(row)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not 0 <= row < len(store):
+        raise ValueError(f"Invalid cursor: row {row} is outside the {len(store)} stored logs")
+    return ts, row
+
+def _logs_response(request, store, ids, format, next_cursor):
+    """
+    Return rows as a JSON array or, for format=ndjson or an Accept: application/x-ndjson
+    header, as newline-delimited JSON streamed chunk by chunk. The cursor of the next
+    page, if any, is sent in the X-Next-Cursor header.
+
+    Args:
+        request (Request): The incoming request.
+        store (LogStore): The logs.
+        ids (np.ndarray): Row positions to return, in order.
+        format (str): "json" or "ndjson".
+        next_cursor (str or None): Cursor of the next page.
+    Returns:
+        Response: The rows.
+    """
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    if format == "ndjson" or "application/x-ndjson" in request.headers.get("accept", ""):
+        return StreamingResponse(iter_ndjson(store.iter_records(ids)), media_type="application/x-ndjson", headers=headers)
+    return JSONResponse(jsonable_encoder(store.records(ids)), headers=headers)
 
 @app.get("/logs")
-def get_logs(limit: int = Query(100, ge=1, le=1000)):
+def get_logs(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    format: str = Query("json", enum=["json", "ndjson"])
+):
     """
-    Get a list of validated logs (limited).
+    Get a page of validated logs in insertion order.
     """
-    return [log.__dict__ for log in logs[:limit]]
+    store = log_store.snapshot()
+    start = 0
+    if cursor:
+        try:
+            start = _decode_cursor(cursor, store)[1] + 1
+        except ValueError as e:
+            return JSONResponse(status_code=400, content={"error": str(e)})
+    ids = np.arange(min(start, len(store)), min(start + limit, len(store)))
+    next_cursor = _encode_cursor(store, int(ids[-1])) if len(ids) and ids[-1] + 1 < len(store) else None
+    return _logs_response(request, store, ids, format, next_cursor)
 
 @app.get("/logs/query")
 def query_logs(
+    request: Request,
     start_time_date: str = Query(..., description="Start datetime in YYYY-MM-DD HH:MM:SS format"),
     end_time_date: str = Query(..., description="End datetime in YYYY-MM-DD HH:MM:SS format"),
     room: str = Query(..., description="Room name to filter logs"),
-    sensor: Optional[str] = Query(None, description="Sensor name to filter logs (optional)")
+    sensor: Optional[str] = Query(None, description="Sensor name to filter logs (optional)"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum rows per page (all rows if omitted)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    format: str = Query("json", enum=["json", "ndjson"])
 ):
     """
-    Query logs by date range, room, and optionally sensor.
+    Query logs by date range, room, and optionally sensor, ordered by timestamp.
     """
     try:
         start_dt = datetime.strptime(start_time_date, "%Y-%m-%d %H:%M:%S")
         end_dt = datetime.strptime(end_time_date, "%Y-%m-%d %H:%M:%S")
     except ValueError:
         return {"error": "Invalid date format. Use YYYY-MM-DD HH:MM:SS"}
-    filtered = []
-    for log in logs:
-        if not (start_dt <= log.timestamp <= end_dt):
-            continue
-        if log.sala != room:
-            continue
-        # If sensor field exists in log, filter by it
-        if sensor is not None and hasattr(log, 'sensor') and getattr(log, 'sensor', None) != sensor:
-            continue
-        filtered.append(log.__dict__)
-    return filtered
+    store = log_store.snapshot()
+    try:
+        after = _decode_cursor(cursor, store) if cursor else None
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
+    # Logs carry no sensor field, so the sensor filter does not narrow the result
+    ids = store.query(room, start_dt, end_dt, after=after)
+    next_cursor = None
+    if limit is not None and len(ids) > limit:
+        ids = ids[:limit]
+        next_cursor = _encode_cursor(store, int(ids[-1]))
+    return _logs_response(request, store, ids, format, next_cursor)
+
+@app.get("/logs/aggregate")
+def aggregate_logs(
+    start_time_date: str = Query(..., description="Start datetime in YYYY-MM-DD HH:MM:SS format"),
+    end_time_date: str = Query(..., description="End datetime in YYYY-MM-DD HH:MM:SS format"),
+    room: str = Query(..., description="Room name")
+):
+    """
+    Aggregate a room's readings over a date range: count, mean/min/max of each metric and state frequencies.
+    Served from the pre-aggregated day, hour and minute rollups.
+    """
+    try:
+        start_dt = datetime.strptime(start_time_date, "%Y-%m-%d %H:%M:%S")
+        end_dt = datetime.strptime(end_time_date, "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return {"error": "Invalid date format. Use YYYY-MM-DD HH:MM:SS"}
+    with ingest_lock:
+        result = rollups.aggregate(room, start_dt, end_dt, store=log_store)
+    return {"room": room, "start": start_time_date, "end": end_time_date, **result}
+
+@app.get("/rooms")
+def get_rooms():
+    """
+    List the rooms with their row counts and first/last timestamps, read from the room
+    segments in O(rooms) without touching the rows.
+    """
+    store = log_store.snapshot()
+    return sorted((room.describe() for room in store.registry), key=lambda room: room["room"])
+
+@app.get("/logs/messages/stats")
+async def get_message_stats():
+    """
+    Report how the messages are stored: rows rebuilt from a template, free-text and missing
+    rows, the compression ratio and the memory saved against one string per row.
+    """
+    return await worker_pool.run(compression_stats, log_store.snapshot())
+
+def _parse_batch(body, content_type):
+    """
+    Parse and validate a batch of readings with the same rules as LogReader.
+
+    Args:
+        body (bytes): Request body, a JSON array of readings ({"logs": [...]} is also accepted) or CSV.
+        content_type (str): Content-Type header of the request.
+    Returns:
+        tuple: (LogStore of valid readings, pd.Index of rejected positions).
+    Raises:
+        ValueError: If the body cannot be parsed.
+    """
+    if "csv" in content_type:
+        try:
+            df = pd.read_csv(io.BytesIO(body))
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid CSV body: {e}")
+    else:
+        try:
+            payload = json.loads(body)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON body: {e}")
+        if isinstance(payload, dict):
+            payload = payload.get("logs")
+        if not isinstance(payload, list) or not all(isinstance(item, dict) for item in payload):
+            raise ValueError('Expected a JSON array of readings or {"logs": [...]}')
+        df = pd.DataFrame(payload)
+    frame, rejected = log_reader.validate_frame(df)
+    return LogStore.from_frame(frame), rejected
+
+@app.post("/logs/batch", status_code=202)
+async def post_logs_batch(request: Request):
+    """
+    Ingest a batch of sensor readings sent as JSON or CSV.
+    Valid readings are queued for the background consumer; answers 429 when the queue is full.
+    Pushed readings are not written to the source files, so a reload of the dataset (a rotated
+    log file) discards them; /health/ready reports how many were discarded.
+    Workers of a shared dataset answer 409: their dataset is read-only and replaced by each generation.
+    """
+    if shared_dataset:
+        return JSONResponse(status_code=409, content={
+            "error": "This worker serves a shared read-only dataset; append readings to the loader's source instead",
+        })
+    body = await request.body()
+    try:
+        batch, rejected = await run_in_threadpool(_parse_batch, body, request.headers.get("content-type", ""))
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
+    if len(batch) and not ingest_queue.submit(batch):
+        return JSONResponse(status_code=429, content={"error": "Ingest queue is full, retry later"}, headers={"Retry-After": "1"})
+    return {"accepted": len(batch), "rejected": [int(i) for i in rejected]}
+
+def _generate_report(report_type):
+    """
+    Generate a report over the current logs, reusing the cached result while the logs are unchanged.
+
+    Args:
+        report_type (str): The report identifier registered in the factory.
+    Returns:
+        pd.DataFrame: The generated report.
+    """
+    return _generate_reports([report_type])[report_type]
+
+def _generate_reports(report_types, store=None):
+    """
+    Generate several reports over one snapshot of the logs, reusing cached results while the logs are unchanged.
+    Reports maintained on ingest are read under the same lock as the snapshot; the others all
+    run over the snapshot's shared columns, so the logs are never converted per report.
+
+    Args:
+        report_types (list): Report identifiers registered in the factory.
+        store (LogStore, optional): Snapshot to report on (a new snapshot of the logs if omitted).
+            Maintained reports reflect the live logs, so for an older snapshot they are
+            generated from the snapshot instead.
+    Returns:
+        dict: Report identifier to generated report (pd.DataFrame), in request order.
+    """
+    generated = {}
+    with ingest_lock:
+        if store is None:
+            store = log_store.snapshot()
+        # Maintained on ingest: O(rooms) or O(anomalies kept) instead of a pass over every log
+        maintained = {"state_by_room": state_aggregator.to_frame, "anomalies": anomaly_detector.to_frame}
+        for report_type in report_types:
+            if report_type in maintained and store.version == log_store.version:
+                timed = metrics.timed("report_generation", report=report_type)
+                generated[report_type] = report_cache.get_or_compute(report_type, {}, store.version, timed(maintained[report_type]))
+    for report_type in report_types:
+        if report_type not in generated:
+            timed = metrics.timed("report_generation", report=report_type)
+            generated[report_type] = report_cache.get_or_compute(
+                report_type, {}, store.version,
+                timed(lambda report_type=report_type: report_factory.create_report(report_type).generate(store)),
+            )
+    return {report_type: generated[report_type] for report_type in report_types}
+
+async def _run_report(report_type):
+    """
+    Generate a report on the worker pool, within the report concurrency limit.
+    Identical concurrent requests share one computation (see ReportCache.get_or_compute).
+
+    Args:
+        report_type (str): The report identifier registered in the factory.
+    Returns:
+        pd.DataFrame: The generated report.
+    """
+    async with report_slots:
+        return await worker_pool.run(_generate_report, report_type)
+
+@app.get("/report/cache/stats")
+def get_report_cache_stats():
+    """
+    Get hit/miss counters of the report cache.
+    """
+    return report_cache.stats()
 
 @app.get("/report/state_by_room")
-def get_state_by_room():
+async def get_state_by_room():
     """
     Get the state by room report as JSON.
     """
-    report = report_factory.create_report("state_by_room")
-    df = report.generate(logs)
-    return df.to_dict(orient="records")
+    df = await _run_report("state_by_room")
+    return await worker_pool.run(_report_records, df)
 
 @app.get("/report/critical_alerts")
-def get_critical_alerts():
+async def get_critical_alerts():
     """
     Get the critical alerts report as JSON.
     """
-    report = report_factory.create_report("critical_alerts")
-    df = report.generate(logs)
-    return df.to_dict(orient="records")
+    df = await _run_report("critical_alerts")
+    return await worker_pool.run(_report_records, df)
+
+@app.get("/report/anomalies")
+async def get_anomalies():
+    """
+    Get the most recent anomalies (readings far from their room's moving average) as JSON.
+    """
+    df = await _run_report("anomalies")
+    return await worker_pool.run(_report_records, df)
+
+@app.get("/report/bundle")
+async def get_report_bundle(reports: str = Query("state_by_room,critical_alerts,anomalies",
+                                                 description="Comma-separated report types")):
+    """
+    Get several reports in one response, all generated from the same snapshot of the logs.
+    """
+    report_types = list(dict.fromkeys(report.strip() for report in reports.split(",") if report.strip()))
+    unknown = [report for report in report_types if report not in report_factory.report_types]
+    if not report_types or unknown:
+        return JSONResponse(status_code=400, content={"error": f"Unknown report types: {', '.join(unknown)}" if unknown else "No report requested"})
+    async with report_slots:
+        generated = await worker_pool.run(_generate_reports, report_types)
+    return await worker_pool.run(_bundle_records, generated)
+
+def _report_records(df):
+    """
+    Convert a report to JSON-friendly records.
+    """
+    # Readings pushed without a message carry NaN, which is not valid JSON
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+def _bundle_records(generated):
+    """
+    Convert generated reports to JSON-friendly records, keyed by report type.
+    """
+    return {report_type: _report_records(df) for report_type, df in generated.items()}
 
 @app.get("/report/state_by_room/export")
-def export_state_by_room(format: str = Query("csv", enum=["csv", "xlsx"])):
+async def export_state_by_room(format: str = Query("csv", enum=["csv", "xlsx"])):
     """
     Export the state by room report as CSV or XLSX, save it to disk, and return it.
     """
-    report = report_factory.create_report("state_by_room")
-    df = report.generate(logs)
-    buf = io.BytesIO()
-    export_dir = EXPORT_DIRS[format]
-    os.makedirs(export_dir, exist_ok=True)
-    if format == "csv":
-        filename = os.path.join(export_dir, "state_by_room_report.csv")
-        df.to_csv(filename, index=False)
-        df.to_csv(buf, index=False)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=state_by_room_report.csv"})
-    elif format == "xlsx":
-        filename = os.path.join(export_dir, "state_by_room_report.xlsx")
-        df.to_excel(filename, index=False)
-        df.to_excel(buf, index=False)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", headers={"Content-Disposition": "attachment; filename=state_by_room_report.xlsx"})
+    df = await _run_report("state_by_room")
+    return await _export_response("state_by_room_report", format, iter_frame_chunks(df))
 
 @app.get("/report/critical_alerts/export")
-def export_critical_alerts(format: str = Query("csv", enum=["csv", "xlsx"])):
+async def export_critical_alerts(format: str = Query("csv", enum=["csv", "xlsx"])):
     """
     Export the critical alerts report as CSV or XLSX, save it to disk, and return it.
     """
-    report = report_factory.create_report("critical_alerts")
-    df = report.generate(logs)
-    buf = io.BytesIO()
-    export_dir = EXPORT_DIRS[format]
-    os.makedirs(export_dir, exist_ok=True)
-    if format == "csv":
-        filename = os.path.join(export_dir, "critical_alerts_report.csv")
-        df.to_csv(filename, index=False)
-        df.to_csv(buf, index=False)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=critical_alerts_report.csv"})
-    elif format == "xlsx":
-        filename = os.path.join(export_dir, "critical_alerts_report.xlsx")
-        df.to_excel(filename, index=False)
-        df.to_excel(buf, index=False)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", headers={"Content-Disposition": "attachment; filename=critical_alerts_report.xlsx"})
+    df = await _run_report("critical_alerts")
+    return await _export_response("critical_alerts_report", format, iter_frame_chunks(df))
+
+@app.get("/report/anomalies/export")
+async def export_anomalies(format: str = Query("csv", enum=["csv", "xlsx"])):
+    """
+    Export the anomalies report as CSV or XLSX, save it to disk, and return it.
+    """
+    df = await _run_report("anomalies")
+    return await _export_response("anomalies_report", format, iter_frame_chunks(df))
 
 @app.get("/logs/query/export")
-def export_query_logs(
+async def export_query_logs(
     start_time_date: str = Query(..., description="Start datetime in YYYY-MM-DD HH:MM:SS format"),
     end_time_date: str = Query(..., description="End datetime in YYYY-MM-DD HH:MM:SS format"),
     room: str = Query(..., description="Room name to filter logs"),
@@ -140,28 +668,70 @@ def export_query_logs(
         end_dt = datetime.strptime(end_time_date, "%Y-%m-%d %H:%M:%S")
     except ValueError:
         return {"error": "Invalid date format. Use YYYY-MM-DD HH:MM:SS"}
-    filtered = []
-    for log in logs:
-        if not (start_dt <= log.timestamp <= end_dt):
-            continue
-        if log.sala != room:
-            continue
-        if sensor is not None and hasattr(log, 'sensor') and getattr(log, 'sensor', None) != sensor:
-            continue
-        filtered.append(log.__dict__)
-    df = pd.DataFrame(filtered)
-    buf = io.BytesIO()
-    export_dir = EXPORT_DIRS[format]
-    os.makedirs(export_dir, exist_ok=True)
-    if format == "csv":
-        filename = os.path.join(export_dir, "filtered_logs.csv")
-        df.to_csv(filename, index=False)
-        df.to_csv(buf, index=False)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=filtered_logs.csv"})
-    elif format == "xlsx":
-        filename = os.path.join(export_dir, "filtered_logs.xlsx")
-        df.to_excel(filename, index=False)
-        df.to_excel(buf, index=False)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", headers={"Content-Disposition": "attachment; filename=filtered_logs.xlsx"}) 
\ No newline at end of file
+    store = log_store.snapshot()
+    return await _export_response("filtered_logs", format, store.iter_frames(store.query(room, start_dt, end_dt)))
+
+@app.post("/exports", status_code=202)
+def submit_export(
+    report: str = Query(..., enum=["state_by_room", "critical_alerts", "anomalies", "filtered_logs"]),
+    format: str = Query("csv", enum=["csv", "xlsx"]),
+    start_time_date: Optional[str] = Query(None, description="Start datetime (filtered_logs only)"),
+    end_time_date: Optional[str] = Query(None, description="End datetime (filtered_logs only)"),
+    room: Optional[str] = Query(None, description="Room name (filtered_logs only)")
+):
+    """
+    Submit an export job. Poll GET /exports/{job_id}, then download the result.
+    Identical exports of the same dataset version are served from the export cache.
+    """
+    if format == "xlsx" and _xlsx_unavailable():
+        return _xlsx_unavailable()
+    store = log_store.snapshot()
+    params = {}
+    if report == "filtered_logs":
+        if not (start_time_date and end_time_date and room):
+            return JSONResponse(status_code=400, content={"error": "filtered_logs requires start_time_date, end_time_date and room"})
+        try:
+            start_dt = datetime.strptime(start_time_date, "%Y-%m-%d %H:%M:%S")
+            end_dt = datetime.strptime(end_time_date, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return JSONResponse(status_code=400, content={"error": "Invalid date format. Use YYYY-MM-DD HH:MM:SS"})
+        params = {"start_time_date": start_time_date, "end_time_date": end_time_date, "room": room}
+        frames = lambda: store.iter_frames(store.query(room, start_dt, end_dt))
+    else:
+        # Generated from the snapshot the job is keyed by, even if logs are ingested before it runs
+        frames = lambda: iter_frame_chunks(_generate_reports([report], store)[report])
+    def write(path):
+        if format == "xlsx":
+            # Serialized in a worker process so export jobs do not hold the GIL of the API process
+            with metrics.stage("export", format="xlsx"):
+                worker_pool.submit_cpu(write_xlsx, pd.concat(frames(), ignore_index=True), path).result()
+        else:
+            write_export(frames(), path, format)
+    job = export_jobs.submit(report, params, format, store.version, write)
+    return job.to_dict()
+
+@app.get("/exports/{job_id}")
+def get_export(job_id: str):
+    """
+    Get the status of an export job.
+    """
+    job = export_jobs.get(job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": "Unknown export job"})
+    return job.to_dict()
+
+@app.get("/exports/{job_id}/download")
+def download_export(job_id: str):
+    """
+    Download the result of a finished export job.
+    """
+    job = export_jobs.get(job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": "Unknown export job"})
+    if job.status != "done":
+        return JSONResponse(status_code=409, content={"error": f"Export is {job.status}", **job.to_dict()})
+    if not os.path.exists(job.path):
+        return JSONResponse(status_code=410, content={"error": "Export was evicted, submit it again"})
+    format = os.path.splitext(job.path)[1][1:]
+    media_type = "text/csv" if format == "csv" else XLSX_MEDIA_TYPE
+    return FileResponse(job.path, media_type=media_type, filename=f"export.{format}")
@@ -1,39 +1,151 @@
-from collections import deque
-from datetime import datetime, timedelta
+import bisect
+import heapq
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import timedelta
+
+class _RoomBucket:
+    """
+    Logs of one room kept in timestamp order.
+    Evicted logs are skipped with a start offset and compacted away in bulk.
+    """
+    __slots__ = ("timestamps", "logs", "start")
+
+    def __init__(self):
+        self.timestamps = []
+        self.logs = []
+        self.start = 0
+
+    def insert(self, log):
+        """
+        Insert a log at its timestamp position (after logs with the same timestamp).
+
+        Args:
+            log (Log): The log entry to insert.
+        """
+        if len(self.logs) == self.start or log.timestamp >= self.timestamps[-1]:
+            self.timestamps.append(log.timestamp)
+            self.logs.append(log)
+            return
+        position = bisect.bisect_right(self.timestamps, log.timestamp, lo=self.start)
+        self.timestamps.insert(position, log.timestamp)
+        self.logs.insert(position, log)
+
+    def popleft(self):
+        """
+        Remove and return the oldest log of the room.
+
+        Returns:
+            Log: The evicted log.
+        """
+        log = self.logs[self.start]
+        self.start += 1
+        if self.start >= 64 and 2 * self.start >= len(self.logs):
+            del self.timestamps[:self.start]
+            del self.logs[:self.start]
+            self.start = 0
+        return log
+
+    def __len__(self):
+        return len(self.logs) - self.start
+
 
 class TemporalCache:
     """
-    In-memory cache to store environmental logs for the last 5 minutes.
-    Allows fast queries by room or timestamp.
-    Handles late events and ensures only relevant logs are kept.
+    In-memory cache to store environmental logs for the last 5 minutes of event time.
+    Logs are kept in per-room, timestamp-ordered buckets with an exact-timestamp index,
+    so queries by room or timestamp do not scan the whole cache.
+    Eviction follows a watermark (latest event time seen minus the allowed lateness)
+    instead of the wall clock, so replaying historical data works and late events
+    are placed and evicted in timestamp order.
     """
-    def __init__(self, window_minutes=5):
+    def __init__(self, window_minutes=5, allowed_lateness_seconds=0):
         """
         Initialize the temporal cache.
 
         Args:
             window_minutes (int): The time window in minutes to keep logs in cache.
+            allowed_lateness_seconds (int): How far behind the latest event a log may arrive
+                before the window starts moving past it.
         """
         self.window = timedelta(minutes=window_minutes)
-        self.logs = deque()
+        self.allowed_lateness = timedelta(seconds=allowed_lateness_seconds)
+        self.watermark = None
+        self.late_dropped = 0
+        self._rooms = {}
+        self._by_timestamp = {}
+        self._expiry = []
+        self._sequence = itertools.count()
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """
+        Register a callback fed every log the cache accepts, e.g. AnomalyDetector.add_log,
+        so incremental reports are updated as logs arrive.
+
+        Args:
+            listener (callable): Called with each accepted log.
+        """
+        self._listeners.append(listener)
 
     def add_log(self, log):
         """
-        Add a log to the cache and remove outdated logs.
+        Add a log to the cache and remove logs that fell out of the window.
 
         Args:
             log (Log): The log entry to add.
+        Returns:
+            bool: False if the log arrived too late and was dropped, True otherwise.
         """
-        self.logs.append(log)
+        watermark = log.timestamp - self.allowed_lateness
+        if self.watermark is None or watermark > self.watermark:
+            self.watermark = watermark
+        if log.timestamp < self.watermark - self.window:
+            self.late_dropped += 1
+            return False
+        bucket = self._rooms.get(log.sala)
+        if bucket is None:
+            bucket = self._rooms[log.sala] = _RoomBucket()
+        bucket.insert(log)
+        self._by_timestamp.setdefault(log.timestamp, []).append(log)
+        heapq.heappush(self._expiry, (log.timestamp, next(self._sequence), log.sala))
         self._purge_old_logs()
+        for listener in self._listeners:
+            listener(log)
+        return True
+
+    def add_logs(self, logs):
+        """
+        Add several logs to the cache.
+
+        Args:
+            logs (iterable): The log entries to add.
+        Returns:
+            int: Number of logs accepted.
+        """
+        return sum(self.add_log(log) for log in logs)
 
     def _purge_old_logs(self):
         """
-        Remove logs that are outside the time window from the cache.
+        Remove logs older than the watermark minus the window from the cache.
+        Logs expire in timestamp order, so each one is the oldest of its room bucket.
         """
-        now = datetime.now()
-        while self.logs and (now - self.logs[0].timestamp) > self.window:
-            self.logs.popleft()
+        horizon = self.watermark - self.window
+        while self._expiry and self._expiry[0][0] < horizon:
+            timestamp, _, room = heapq.heappop(self._expiry)
+            bucket = self._rooms[room]
+            bucket.popleft()
+            if not bucket:
+                del self._rooms[room]
+            same_time = self._by_timestamp[timestamp]
+            same_time.pop(0)
+            if not same_time:
+                del self._by_timestamp[timestamp]
+
+    def __len__(self):
+        return len(self._expiry)
 
     def get_logs_by_room(self, room):
         """
@@ -42,9 +154,10 @@ class TemporalCache:
         Args:
             room (str): The room name to filter logs.
         Returns:
-            list: List of Log objects for the specified room.
+            list: List of Log objects for the specified room, ordered by timestamp.
         """
-        return [log for log in self.logs if log.sala == room]
+        bucket = self._rooms.get(room)
+        return bucket.logs[bucket.start:] if bucket else []
 
     def get_logs_by_timestamp(self, timestamp):
         """
@@ -55,4 +168,107 @@ class TemporalCache:
         Returns:
             list: List of Log objects for the specified timestamp.
         """
-        return [log for log in self.logs if log.timestamp == timestamp]
+        return list(self._by_timestamp.get(timestamp, []))
+
+
+class ReportCache:
+    """
+    Size-bounded LRU cache for generated reports.
+    Entries are keyed by report type, parameters and dataset version, so results are
+    reused until the underlying logs change. Concurrent misses on the same key are
+    coalesced: one caller computes, the others wait for its result. Hit and miss
+    counters are kept for monitoring.
+    """
+    def __init__(self, maxsize=32):
+        """
+        Initialize the report cache.
+
+        Args:
+            maxsize (int): Maximum number of reports kept in cache.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._version = None
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, report_type, params, version, compute):
+        """
+        Return a cached report, computing and storing it on a miss.
+
+        Entries built for an older dataset version are dropped as soon as a newer
+        version is requested. A request for an older version (a snapshot taken before
+        a later ingest) is computed without storing or evicting anything. If the same
+        report is already being computed, the caller waits for that computation
+        instead of starting another one.
+
+        Args:
+            report_type (str): The report identifier.
+            params (dict): Parameters the report depends on.
+            version (int): Version of the dataset the report is built from.
+            compute (callable): Function that generates the report.
+        Returns:
+            Any: The cached or freshly computed report.
+        """
+        key = (report_type, tuple(sorted(params.items())), version)
+        owner = False
+        with self._lock:
+            if self._version is None or version > self._version:
+                self._entries.clear()
+                self._version = version
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.coalesced += 1
+            else:
+                pending = self._pending[key] = Future()
+                self.misses += 1
+                owner = True
+        if not owner:
+            return pending.result()
+        try:
+            result = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(e)
+            raise
+        with self._lock:
+            del self._pending[key]
+            if version == self._version:
+                self._entries[key] = result
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        pending.set_result(result)
+        return result
+
+    def clear(self):
+        """
+        Remove all cached reports.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Return cache usage counters.
+
+        Returns:
+            dict: Hits, misses, coalesced waits, hit ratio, current size and capacity.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
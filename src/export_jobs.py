@@ -0,0 +1,192 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ExportJob:
+    """
+    Status of one asynchronous export request.
+    """
+    def __init__(self, job_id, key, path):
+        """
+        Initialize a job.
+
+        Args:
+            job_id (str): Public identifier of the job.
+            key (str): Content address of the export (see ExportJobManager.cache_key).
+            path (str): Where the finished export is stored.
+        """
+        self.id = job_id
+        self.key = key
+        self.path = path
+        self.status = "pending"
+        self.error = None
+        self.cached = False
+        self.created_at = time.time()
+        self.finished_at = None
+
+    def to_dict(self):
+        """
+        Describe the job for API responses.
+
+        Returns:
+            dict: Identifier, status, cache flag and error (if any).
+        """
+        return {"id": self.id, "status": self.status, "cached": self.cached, "error": self.error}
+
+
+class ExportJobManager:
+    """
+    Runs exports in a background thread pool and stores results under a content address
+    derived from report type, parameters, format and dataset version (within this process).
+    Identical exports are served from disk (or joined while still running) instead of
+    being recomputed. Stored exports are evicted by age and total size.
+    """
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024, max_age_seconds=24 * 3600, max_workers=2):
+        """
+        Initialize the job manager.
+
+        Args:
+            directory (str): Directory holding finished exports.
+            max_bytes (int): Total size of stored exports before the least recently used are evicted.
+            max_age_seconds (float): Age after which stored exports and finished jobs are evicted.
+            max_workers (int): Number of exports generated concurrently.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        # Dataset versions come from a per-process counter and restart at 1, while stored
+        # exports outlive the process: keys are scoped to this instance so a restart on
+        # other data never serves an export of the previous dataset
+        self.instance = uuid.uuid4().hex
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ecowatch-export")
+        self._jobs = {}
+        self._running = {}
+        self._lock = threading.Lock()
+
+    def cache_key(self, report_type, params, format, version):
+        """
+        Derive the content address of an export.
+
+        Args:
+            report_type (str): The report identifier.
+            params (dict): Parameters the export depends on.
+            format (str): Output format ("csv" or "xlsx").
+            version (int): Version of the dataset the export is built from.
+        Returns:
+            str: Hex digest identifying the export.
+        """
+        payload = json.dumps([self.instance, report_type, params, format, version], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def submit(self, report_type, params, format, version, write):
+        """
+        Submit an export, reusing a stored or in-flight identical export when possible.
+
+        Args:
+            report_type (str): The report identifier.
+            params (dict): Parameters the export depends on.
+            format (str): Output format ("csv" or "xlsx").
+            version (int): Version of the dataset the export is built from.
+            write (callable): Function writing the export to the path it is given.
+        Returns:
+            ExportJob: The job tracking the export.
+        """
+        key = self.cache_key(report_type, params, format, version)
+        path = os.path.join(self.directory, f"{key}.{format}")
+        with self._lock:
+            self._prune_jobs()
+            running = self._running.get(key)
+            if running is not None:
+                return running
+            job = ExportJob(uuid.uuid4().hex, key, path)
+            self._jobs[job.id] = job
+            if os.path.exists(path):
+                # Refresh the access time used by the size-based eviction
+                os.utime(path)
+                job.status, job.cached, job.finished_at = "done", True, time.time()
+                return job
+            self._running[key] = job
+        self._executor.submit(self._run, job, write)
+        return job
+
+    def get(self, job_id):
+        """
+        Look up a job.
+
+        Args:
+            job_id (str): The job identifier.
+        Returns:
+            ExportJob or None: The job, or None if it is unknown or expired.
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job, write):
+        """
+        Generate an export into a temporary file and move it into place.
+        """
+        job.status = "running"
+        os.makedirs(self.directory, exist_ok=True)
+        partial = f"{job.path}.{job.id}.part"
+        try:
+            write(partial)
+            os.replace(partial, job.path)
+            job.status = "done"
+        except Exception as e:
+            job.status, job.error = "failed", str(e)
+            if os.path.exists(partial):
+                os.remove(partial)
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._running.pop(job.key, None)
+            self.evict()
+
+    def evict(self):
+        """
+        Remove stored exports older than max_age_seconds, then the least recently used
+        ones until the total size fits in max_bytes.
+        """
+        with self._lock:
+            in_use = {job.path for job in self._running.values()}
+            try:
+                names = os.listdir(self.directory)
+            except FileNotFoundError:
+                return
+            now = time.time()
+            files = []
+            for name in names:
+                path = os.path.join(self.directory, name)
+                if path in in_use or name.endswith(".part"):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                if now - stat.st_mtime > self.max_age_seconds:
+                    os.remove(path)
+                else:
+                    files.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                os.remove(path)
+                total -= size
+
+    def _prune_jobs(self):
+        """
+        Forget finished jobs older than max_age_seconds (caller holds the lock).
+        """
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.max_age_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
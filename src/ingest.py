@@ -0,0 +1,89 @@
+import queue
+import threading
+
+
+class IngestQueue:
+    """
+    Bounded queue of log batches drained by a background consumer thread.
+    Producers never block: when the queue is full, submit() reports it so the caller
+    can apply backpressure (e.g. answer HTTP 429) instead of stalling.
+    """
+    def __init__(self, consumer, maxsize=100):
+        """
+        Initialize the ingest queue.
+
+        Args:
+            consumer (callable): Function called with each batch, in submission order.
+            maxsize (int): Maximum number of batches waiting to be consumed.
+        """
+        self.consumer = consumer
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = None
+        self.errors = 0
+
+    def start(self):
+        """
+        Start the consumer thread (no-op if it is already running).
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="ecowatch-ingest", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stop the consumer thread after the batches already queued are consumed.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread to finish.
+        """
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, batch):
+        """
+        Enqueue a batch without blocking.
+
+        Args:
+            batch: The batch to hand to the consumer.
+        Returns:
+            bool: True if the batch was queued, False if the queue is full.
+        """
+        try:
+            self._queue.put_nowait(batch)
+            return True
+        except queue.Full:
+            return False
+
+    def join(self):
+        """
+        Block until every queued batch has been consumed.
+        """
+        self._queue.join()
+
+    def qsize(self):
+        """
+        Return the number of batches waiting to be consumed.
+
+        Returns:
+            int: Approximate queue length.
+        """
+        return self._queue.qsize()
+
+    def _run(self):
+        """
+        Consume batches until a stop sentinel is received.
+        """
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    return
+                self.consumer(batch)
+            except Exception as e:
+                self.errors += 1
+                print(f"[WARN] Failed to ingest batch: {e}")
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,179 @@
+import io
+import os
+import threading
+import pandas as pd
+from src.log_store import LogStore
+
+
+class LogFollower:
+    """
+    Follows a CSV log file that grows by appends, like `tail -f`.
+    Remembers the header and the byte offset of the last read, so each refresh parses
+    only the newly appended lines. If the file is truncated, rotated or rewritten,
+    the follower falls back to a full reload.
+    """
+    # Bytes before the offset compared on each poll to detect in-place rewrites
+    FINGERPRINT_BYTES = 64
+
+    def __init__(self, reader, on_append=None, on_reload=None):
+        """
+        Initialize the follower.
+
+        Args:
+            reader (LogReader): Reader whose file is followed and whose rules validate new rows.
+            on_append (callable, optional): Called with a LogStore of newly appended valid logs.
+            on_reload (callable, optional): Called with a LogStore of all valid logs after a full reload.
+        """
+        self.reader = reader
+        self.on_append = on_append
+        self.on_reload = on_reload
+        self.offset = 0
+        self._header = b""
+        self._fingerprint = b""
+        self._identity = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def load(self):
+        """
+        Read the whole file and start following it from its current end.
+
+        Returns:
+            LogStore: Store holding the valid logs of the file.
+        """
+        with open(self.reader.filepath, "rb") as f:
+            return self._read_all(f, os.fstat(f.fileno()))
+
+    def poll(self):
+        """
+        Pick up changes to the file since the last read.
+
+        New complete lines are parsed and passed to on_append; a replaced or truncated
+        file is reloaded in full and passed to on_reload.
+
+        Returns:
+            int: Number of valid logs appended or reloaded.
+        """
+        try:
+            f = open(self.reader.filepath, "rb")
+        except FileNotFoundError:
+            return 0
+        with f:
+            stat = os.fstat(f.fileno())
+            if self._was_replaced(f, stat):
+                store = self._read_all(f, stat)
+                if self.on_reload:
+                    self.on_reload(store)
+                return len(store)
+            if stat.st_size <= self.offset:
+                return 0
+            f.seek(self.offset)
+            data = f.read(stat.st_size - self.offset)
+        # Only complete lines are consumed; a partially written row waits for the next poll
+        end = data.rfind(b"\n") + 1
+        if not end:
+            return 0
+        if not self._header:
+            # The header was still being written at the last read; it starts this data
+            self._header = data[:data.find(b"\n") + 1]
+            store = self._parse(data[:end])
+        else:
+            store = self._parse(self._header + data[:end])
+        self.offset += end
+        self._fingerprint = (self._fingerprint + data[:end])[-self.FINGERPRINT_BYTES:]
+        self._identity = (stat.st_dev, stat.st_ino)
+        if len(store) and self.on_append:
+            self.on_append(store)
+        return len(store)
+
+    def start(self, interval):
+        """
+        Poll the file every interval seconds in a background thread.
+
+        Args:
+            interval (float): Seconds between polls.
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="ecowatch-follower", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the background polling thread.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self, interval):
+        while not self._stop.wait(interval):
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"[WARN] Failed to refresh {self.reader.filepath}: {e}")
+
+    def _was_replaced(self, f, stat):
+        """
+        Check whether the file is no longer the one read so far.
+
+        Args:
+            f (file): The open file.
+            stat (os.stat_result): Its status.
+        Returns:
+            bool: True if the file was rotated, truncated or rewritten.
+        """
+        if self._identity != (stat.st_dev, stat.st_ino) or stat.st_size < self.offset:
+            return True
+        f.seek(0)
+        if f.read(len(self._header)) != self._header:
+            return True
+        f.seek(self.offset - len(self._fingerprint))
+        return f.read(len(self._fingerprint)) != self._fingerprint
+
+    def _read_all(self, f, stat):
+        """
+        Read the file from the start, consuming only complete lines.
+        A partially written last row is left for the next poll.
+
+        Args:
+            f (file): The open file.
+            stat (os.stat_result): Its status.
+        Returns:
+            LogStore: Store holding the valid logs of the complete lines.
+        """
+        f.seek(0)
+        data = f.read(stat.st_size)
+        end = data.rfind(b"\n") + 1
+        self._header = data[:data.find(b"\n") + 1]
+        self._remember(stat, data, end)
+        return self._parse(data[:end])
+
+    def _remember(self, stat, data, offset):
+        """
+        Record the identity, offset and fingerprint of the data read so far.
+        """
+        self._identity = (stat.st_dev, stat.st_ino)
+        self.offset = offset
+        self._fingerprint = data[max(0, offset - self.FINGERPRINT_BYTES):offset]
+
+    def _parse(self, data):
+        """
+        Parse and validate CSV bytes with the reader's rules.
+
+        Args:
+            data (bytes): CSV content, starting with the header line.
+        Returns:
+            LogStore: Store holding the valid logs.
+        """
+        try:
+            df = pd.read_csv(io.BytesIO(data))
+        except pd.errors.EmptyDataError:
+            return LogStore()
+        frame, rejected = self.reader.validate_frame(df)
+        if len(rejected):
+            print(f"[WARN] Skipping {len(rejected)} rows: {list(rejected)}")
+        return LogStore.from_frame(frame)
@@ -1,16 +1,29 @@
+import functools
+import glob
+import multiprocessing
+import os
+import time
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from src.log import Log
+from src.log_store import LogStore
+from src.metrics import STAGE_METRIC, metrics
 
 # Decorator for logging execution of methods
 def log_execution(func):
     """
-    Decorator to log the execution of a function or method.
+    Decorator to log the execution of a function or method, with its duration.
+    The duration is also recorded in the metrics registry under the function's name.
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         print(f"[LOG] Executing {func.__name__}...")
+        started = time.perf_counter()
         result = func(*args, **kwargs)
-        print(f"[LOG] Finished {func.__name__}.")
+        elapsed = time.perf_counter() - started
+        metrics.observe(STAGE_METRIC, elapsed, stage=func.__name__)
+        print(f"[LOG] Finished {func.__name__} in {elapsed:.3f} s.")
         return result
     return wrapper
 
@@ -20,44 +33,358 @@ class LogReader:
     Ensures each entry contains the required fields and correct data types.
     """
     REQUIRED_FIELDS = ["timestamp", "sala", "estado", "temperatura", "humedad", "co2"]
+    NUMERIC_FIELDS = ["temperatura", "humedad", "co2"]
+    TIMESTAMP_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
 
-    def __init__(self, filepath):
+    def __init__(self, filepath, max_workers=None):
         """
         Initialize the LogReader with the path to the log file.
 
         Args:
-            filepath (str): Path to the log file (CSV).
+            filepath (str): Path to the log file (CSV), a directory of CSV files, or a glob pattern.
+            max_workers (int, optional): Processes used to parse several files in parallel
+                (defaults to the number of CPUs).
         """
         self.filepath = filepath
+        self.max_workers = max_workers
+        self.file_errors = {}
+
+    @property
+    def paths(self):
+        """
+        CSV files to read: the file itself, the *.csv files of a directory, or the
+        matches of a glob pattern, in name order.
+        """
+        if os.path.isfile(self.filepath):
+            return [self.filepath]
+        if os.path.isdir(self.filepath):
+            return sorted(glob.glob(os.path.join(self.filepath, "*.csv")))
+        if glob.has_magic(self.filepath):
+            return sorted(glob.glob(self.filepath))
+        return [self.filepath]
 
     @log_execution
-    def read_logs(self):
+    def read_logs(self, vectorized=False):
         """
         Read and validate logs from the CSV file.
 
+        Args:
+            vectorized (bool): If True, validate and convert whole columns at once
+                (see read_frame) instead of walking the file row by row.
         Returns:
             list: List of valid Log objects.
         """
-        df = pd.read_csv(self.filepath)
+        if vectorized:
+            frame, rejected = self.read_frame()
+            if len(rejected):
+                print(f"[WARN] Skipping {len(rejected)} rows: {list(rejected)}")
+            return self._frame_to_logs(frame)
         logs = []
-        for idx, row in df.iterrows():
-            if not self._is_valid_row(row):
+        paths = self.paths
+        for path in paths:
+            df = self._read_csv(path)
+            # Validation and Log construction are interleaved on this path
+            with metrics.stage("validation"):
+                for idx, row in df.iterrows():
+                    if not self._is_valid_row(row):
+                        continue
+                    try:
+                        log = Log(
+                            timestamp=self._parse_timestamp(row["timestamp"]),
+                            sala=row["sala"],
+                            estado=row["estado"],
+                            temperatura=float(row["temperatura"]),
+                            humedad=float(row["humedad"]),
+                            co2=float(row["co2"]),
+                            mensaje=row.get("mensaje", None)
+                        )
+                        logs.append(log)
+                    except (ValueError, TypeError) as e:
+                        print(f"[WARN] Skipping row {idx}: {e}")
+                        continue
+        if len(paths) > 1:
+            logs.sort(key=lambda log: log.timestamp)
+        return logs
+
+    @log_execution
+    def read_store(self, snapshot_dir=None):
+        """
+        Read and validate logs from the CSV file into a columnar LogStore.
+
+        Args:
+            snapshot_dir (str, optional): Directory of a binary snapshot of the validated logs.
+                It is loaded (memory-mapped) when it matches the CSV's size and modification
+                time, and rebuilt from the CSV otherwise.
+        Returns:
+            LogStore: Store holding the valid logs.
+        """
+        if snapshot_dir:
+            store = self.read_snapshot(snapshot_dir)
+            if store is not None:
+                return store
+            # Described before reading, so a CSV modified meanwhile makes the snapshot stale
+            source = self.source_info()
+        frame, rejected = self.read_frame()
+        if len(rejected):
+            print(f"[WARN] Skipping {len(rejected)} rows: {list(rejected)}")
+        store = LogStore.from_frame(frame)
+        if snapshot_dir:
+            try:
+                store.save(snapshot_dir, source=source)
+            except OSError as e:
+                # The snapshot only speeds up the next start; the logs are already read
+                print(f"[WARN] Could not write snapshot {snapshot_dir}: {e}")
+        return store
+
+    def write_snapshot(self, snapshot_dir):
+        """
+        Validate the CSV and write a binary snapshot tagged with the CSV's size and modification time.
+
+        Args:
+            snapshot_dir (str): Snapshot directory.
+        """
+        source = self.source_info()
+        LogStore.from_frame(self.read_frame()[0]).save(snapshot_dir, source=source)
+
+    def read_snapshot(self, snapshot_dir):
+        """
+        Load the binary snapshot if it was built from the current version of the CSV.
+
+        Args:
+            snapshot_dir (str): Snapshot directory.
+        Returns:
+            LogStore or None: The loaded store, or None if the snapshot is missing or stale.
+        """
+        manifest = LogStore.read_manifest(snapshot_dir)
+        if manifest is None or manifest.get("source") != self.source_info():
+            return None
+        try:
+            return LogStore.load(snapshot_dir)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Ignoring snapshot {snapshot_dir}: {e}")
+            return None
+
+    def source_info(self):
+        """
+        Describe the CSV files so snapshots can detect when they changed.
+
+        Returns:
+            dict: Absolute path, size and modification time of each file.
+        """
+        files = []
+        for path in self.paths:
+            stat = os.stat(path)
+            files.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+        return {"files": files}
+
+    def iter_batches(self, chunk_size=100_000):
+        """
+        Stream validated logs from the CSV file in fixed-size chunks.
+
+        Only one raw chunk is held in memory at a time, so peak memory is bounded by
+        chunk_size rather than by the size of the file. Several files are read one after
+        another, in name order.
+
+        Args:
+            chunk_size (int): Number of CSV rows parsed per batch.
+        Yields:
+            LogStore: Store holding the valid logs of one chunk.
+        """
+        for path in self.paths:
+            chunks = self._read_csv(path, chunksize=chunk_size)
+            while True:
+                with metrics.stage("csv_parse"):
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                frame, rejected = self.validate_frame(chunk)
+                if len(rejected):
+                    print(f"[WARN] Skipping {len(rejected)} rows: {list(rejected)}")
+                yield LogStore.from_frame(frame)
+
+    def read_frame(self):
+        """
+        Read and validate logs from the CSV file using whole-column operations.
+
+        Applies the same rules as the row-by-row path: rows with a missing required
+        field, an unparseable timestamp or a non-numeric metric are rejected.
+
+        When reading several files, they are parsed in parallel worker processes and merged
+        into one frame ordered by timestamp. Rejected rows are then identified by (file, row)
+        and files that cannot be read are reported in file_errors instead of aborting.
+
+        Returns:
+            tuple: (pd.DataFrame of valid rows with typed columns, pd.Index of rejected row indices).
+        """
+        paths = self.paths
+        if paths == [self.filepath]:
+            return self.validate_frame(self._read_csv(self.filepath))
+        return self._read_files(paths)
+
+    def _read_csv(self, path, **kwargs):
+        """
+        Parse a CSV file with pandas, timed as the "csv_parse" stage.
+
+        Args:
+            path (str): The CSV file.
+            **kwargs: Extra arguments for pd.read_csv.
+        Returns:
+            pd.DataFrame or TextFileReader: The parsed file (an iterator of chunks with chunksize).
+        """
+        with metrics.stage("csv_parse"):
+            return pd.read_csv(path, **kwargs)
+
+    def _read_files(self, paths):
+        """
+        Parse several CSV files in a process pool and merge them in timestamp order.
+
+        Args:
+            paths (list): The CSV files to read.
+        Returns:
+            tuple: (pd.DataFrame of valid rows, pd.Index of rejected (file, row) pairs).
+        """
+        self.file_errors = {}
+        results = []
+        if paths:
+            workers = min(len(paths), self.max_workers or os.cpu_count() or 1)
+            # Spawned, not forked: the API reads from a loader thread while other threads hold locks
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                results = list(pool.map(_read_file, paths))
+        frames, rejected = [], []
+        for path, frame, file_rejected, error in results:
+            if error is not None:
+                self.file_errors[path] = error
+                print(f"[WARN] Skipping file {path}: {error}")
                 continue
+            if not frame.empty:
+                frames.append(frame)
+            rejected.extend((path, row) for row in file_rejected)
+        if not frames:
+            return self._empty_frame(), pd.Index(rejected, dtype=object, tupleize_cols=False)
+        merged = pd.concat(frames, ignore_index=True).sort_values("timestamp", kind="stable", ignore_index=True)
+        return merged, pd.Index(rejected, dtype=object, tupleize_cols=False)
+
+    @metrics.timed("validation")
+    def validate_frame(self, df):
+        """
+        Validate a raw DataFrame of logs with column masks instead of per-row checks.
+
+        Args:
+            df (pd.DataFrame): Raw log rows, as read from the source.
+        Returns:
+            tuple: (pd.DataFrame of valid rows with typed columns, pd.Index of rejected row indices).
+        """
+        if any(field not in df.columns for field in self.REQUIRED_FIELDS):
+            return self._empty_frame(), df.index
+        valid = df[self.REQUIRED_FIELDS].notna().all(axis=1)
+        candidates = df[valid]
+        timestamps, ok = self._parse_timestamp_column(candidates["timestamp"])
+        numeric = {}
+        for field in self.NUMERIC_FIELDS:
+            numeric[field], parsed = self._parse_numeric_column(candidates[field])
+            ok &= parsed
+        frame = pd.DataFrame({
+            "timestamp": timestamps[ok],
+            # Rooms and states are names: a numeric room (e.g. JSON "sala": 5) is stored as "5"
+            "sala": candidates["sala"][ok].astype(str),
+            "estado": candidates["estado"][ok].astype(str),
+            "temperatura": numeric["temperatura"][ok],
+            "humedad": numeric["humedad"][ok],
+            "co2": numeric["co2"][ok],
+            "mensaje": candidates["mensaje"][ok] if "mensaje" in candidates.columns else None,
+        })
+        return frame, df.index.difference(frame.index)
+
+    def _parse_timestamp_column(self, values):
+        """
+        Parse a column of timestamp strings, trying each supported format over the whole column.
+
+        Values that no vectorized format accepts are retried with _parse_timestamp so the
+        result matches the row-by-row path exactly.
+
+        Args:
+            values (pd.Series): The raw timestamp values.
+        Returns:
+            tuple: (pd.Series of datetimes, pd.Series of bool marking parsed values).
+        """
+        parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[us]")
+        for fmt in self.TIMESTAMP_FORMATS:
+            missing = parsed.isna()
+            if not missing.any():
+                break
+            parsed[missing] = pd.to_datetime(values[missing], format=fmt, errors="coerce")
+        ok = parsed.notna()
+        for idx in values.index[~ok]:
             try:
-                log = Log(
-                    timestamp=self._parse_timestamp(row["timestamp"]),
-                    sala=row["sala"],
-                    estado=row["estado"],
-                    temperatura=float(row["temperatura"]),
-                    humedad=float(row["humedad"]),
-                    co2=float(row["co2"]),
-                    mensaje=row.get("mensaje", None)
-                )
-                logs.append(log)
-            except (ValueError, TypeError) as e:
-                print(f"[WARN] Skipping row {idx}: {e}")
+                parsed[idx] = self._parse_timestamp(values[idx])
+                ok[idx] = True
+            except (ValueError, TypeError):
                 continue
-        return logs
+        return parsed, ok
+
+    def _parse_numeric_column(self, values):
+        """
+        Convert a column of metric values to float in bulk.
+
+        Values pandas cannot coerce are retried with float() so the result matches the
+        row-by-row path exactly.
+
+        Args:
+            values (pd.Series): The raw metric values.
+        Returns:
+            tuple: (pd.Series of floats, pd.Series of bool marking converted values).
+        """
+        parsed = pd.to_numeric(values, errors="coerce").astype(float)
+        ok = parsed.notna()
+        for idx in values.index[~ok]:
+            try:
+                parsed[idx] = float(values[idx])
+                ok[idx] = True
+            except (ValueError, TypeError):
+                continue
+        return parsed, ok
+
+    @metrics.timed("object_construction")
+    def _frame_to_logs(self, frame):
+        """
+        Build Log objects from a validated frame, one column at a time.
+
+        Args:
+            frame (pd.DataFrame): Valid rows as returned by validate_frame.
+        Returns:
+            list: List of Log objects.
+        """
+        columns = zip(
+            frame["timestamp"].dt.to_pydatetime(),
+            frame["sala"].tolist(),
+            frame["estado"].tolist(),
+            frame["temperatura"].tolist(),
+            frame["humedad"].tolist(),
+            frame["co2"].tolist(),
+            frame["mensaje"].tolist(),
+        )
+        return [
+            Log(timestamp=timestamp, sala=sala, estado=estado, temperatura=temperatura,
+                humedad=humedad, co2=co2, mensaje=mensaje)
+            for timestamp, sala, estado, temperatura, humedad, co2, mensaje in columns
+        ]
+
+    def _empty_frame(self):
+        """
+        Build an empty frame with the validated log schema.
+
+        Returns:
+            pd.DataFrame: Frame with no rows.
+        """
+        return pd.DataFrame({
+            "timestamp": pd.Series(dtype="datetime64[us]"),
+            "sala": pd.Series(dtype=object),
+            "estado": pd.Series(dtype=object),
+            "temperatura": pd.Series(dtype=float),
+            "humedad": pd.Series(dtype=float),
+            "co2": pd.Series(dtype=float),
+            "mensaje": pd.Series(dtype=object),
+        })
 
     def _is_valid_row(self, row):
         """
@@ -83,9 +410,25 @@ class LogReader:
             datetime: The parsed datetime object.
         """
         # Try multiple formats if needed
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
+        for fmt in self.TIMESTAMP_FORMATS:
             try:
                 return datetime.strptime(value, fmt)
             except ValueError:
                 continue
         raise ValueError(f"Invalid timestamp format: {value}")
+
+
+def _read_file(path):
+    """
+    Parse and validate one CSV file (runs in a worker process).
+
+    Args:
+        path (str): The CSV file.
+    Returns:
+        tuple: (path, valid frame, rejected row indices, error message or None).
+    """
+    try:
+        frame, rejected = LogReader(path).read_frame()
+        return path, frame, [int(row) for row in rejected], None
+    except (OSError, ValueError) as e:
+        return path, None, [], str(e)
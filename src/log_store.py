@@ -0,0 +1,698 @@
+import itertools
+import json
+import os
+import shutil
+import threading
+import numpy as np
+import pandas as pd
+from src.log import Log
+from src.metrics import metrics
+from src.room import RoomRegistry
+from src import messages
+
+
+class _Column:
+    """
+    Append-only NumPy buffer that grows geometrically.
+    Rows below the current size are never rewritten, so views taken earlier stay valid.
+    """
+    def __init__(self, dtype, values=None):
+        """
+        Initialize the column.
+
+        Args:
+            dtype: NumPy dtype of the column.
+            values (array-like, optional): Initial values (used as-is when already of the right dtype).
+        """
+        self._buffer = np.empty(0, dtype=dtype) if values is None else np.asarray(values, dtype=dtype)
+        self._size = len(self._buffer)
+
+    def append(self, values):
+        """
+        Append values to the end of the column.
+
+        Args:
+            values (array-like): The values to append.
+        """
+        values = np.asarray(values, dtype=self._buffer.dtype)
+        if not len(values):
+            return
+        self.reserve(len(values))
+        end = self._size + len(values)
+        self._buffer[self._size:end] = values
+        self._size = end
+
+    def reserve(self, count):
+        """
+        Make room for count more values. A read-only buffer (e.g. a memory-mapped
+        snapshot column) is copied on its first write.
+
+        Args:
+            count (int): Number of values about to be appended.
+        """
+        end = self._size + count
+        if end > len(self._buffer) or (count and not self._buffer.flags.writeable):
+            grown = np.empty(max(end, 2 * len(self._buffer), 1024), dtype=self._buffer.dtype)
+            grown[:self._size] = self._buffer[:self._size]
+            self._buffer = grown
+
+    def view(self):
+        """
+        Return the filled part of the column.
+
+        Returns:
+            np.ndarray: A view over the stored values.
+        """
+        return self._buffer[:self._size]
+
+
+class LogStore:
+    """
+    Columnar in-memory storage for validated environmental logs.
+    Each field is kept as a typed NumPy column; sala and estado are dictionary-encoded
+    as integer codes, rooms through a RoomRegistry. Messages that a known template rebuilds
+    from the row's values are stored as a template code, and only the other messages as
+    text (see src/messages.py). Log objects are only built on demand (lazy view).
+    Each Room carries a time index segment (its row positions sorted by timestamp)
+    maintained on every append, so range queries are two binary searches plus a slice.
+    """
+    METRICS = ("temperatura", "humedad", "co2")
+    SNAPSHOT_FORMAT = 2
+    # Versions are drawn from one counter so they stay unique across stores (e.g. after a reload)
+    _versions = itertools.count(1)
+
+    def __init__(self):
+        """
+        Initialize an empty store.
+        """
+        self._lock = threading.Lock()
+        self._timestamp = _Column("datetime64[us]")
+        self._sala = _Column(np.int32)
+        self._estado = _Column(np.int32)
+        self._temperatura = _Column(np.float64)
+        self._humedad = _Column(np.float64)
+        self._co2 = _Column(np.float64)
+        # Message code per row, plus the positions and free text of the TEXT rows
+        self._mensaje = _Column(np.int8)
+        self._mensaje_rows = _Column(np.int64)
+        self._mensaje_text = _Column(object)
+        self._registry = RoomRegistry()
+        self._states = []
+        self._state_codes = {}
+        self.version = 0
+
+    @classmethod
+    @metrics.timed("object_construction")
+    def from_frame(cls, frame):
+        """
+        Build a store from a validated DataFrame (see LogReader.validate_frame).
+
+        Args:
+            frame (pd.DataFrame): Valid log rows with typed columns.
+        Returns:
+            LogStore: The populated store.
+        """
+        store = cls()
+        store.append_frame(frame)
+        return store
+
+    @classmethod
+    def from_logs(cls, logs):
+        """
+        Build a store from Log objects.
+
+        Args:
+            logs (iterable): Log objects.
+        Returns:
+            LogStore: The populated store.
+        """
+        store = cls()
+        store.append_logs(logs)
+        return store
+
+    @classmethod
+    def from_batches(cls, batches):
+        """
+        Build a store from an iterable of batches (see LogReader.iter_batches).
+
+        Args:
+            batches (iterable): LogStore batches.
+        Returns:
+            LogStore: The populated store.
+        """
+        store = cls()
+        for batch in batches:
+            store.append_store(batch)
+        return store
+
+    def append_store(self, other):
+        """
+        Append all rows of another store, translating its room and state codes.
+
+        Args:
+            other (LogStore): The store to append.
+        """
+        other = other.snapshot()
+        if not len(other):
+            return
+        with self._lock:
+            room_map = np.array([self._registry.intern(room) for room in other.rooms], dtype=np.int32)
+            state_map = np.array([self._intern(state, self._states, self._state_codes) for state in other._states], dtype=np.int32)
+            self._append_columns([
+                (self._timestamp, other.timestamp),
+                (self._sala, room_map[other.sala_codes]),
+                (self._estado, state_map[other.estado_codes]),
+                (self._temperatura, other.temperatura),
+                (self._humedad, other.humedad),
+                (self._co2, other.co2),
+                (self._mensaje, other.mensaje_codes),
+                (self._mensaje_rows, other.mensaje_rows + len(self)),
+                (self._mensaje_text, other.mensaje_texts),
+            ])
+
+    def append_frame(self, frame):
+        """
+        Append validated rows to the store.
+
+        Args:
+            frame (pd.DataFrame): Valid log rows with typed columns.
+        """
+        if frame.empty:
+            return
+        with self._lock:
+            metrics_values = {name: frame[name].to_numpy(dtype=np.float64) for name in self.METRICS}
+            mensaje = frame["mensaje"].to_numpy(dtype=object)
+            codes = messages.encode(mensaje, metrics_values)
+            text = np.flatnonzero(codes == messages.TEXT)
+            self._append_columns([
+                (self._timestamp, frame["timestamp"].to_numpy(dtype="datetime64[us]")),
+                (self._sala, self._registry.encode(frame["sala"])),
+                (self._estado, self._encode(frame["estado"], self._states, self._state_codes)),
+                (self._temperatura, metrics_values["temperatura"]),
+                (self._humedad, metrics_values["humedad"]),
+                (self._co2, metrics_values["co2"]),
+                (self._mensaje, codes),
+                (self._mensaje_rows, text + len(self)),
+                (self._mensaje_text, mensaje[text]),
+            ])
+
+    def _append_columns(self, columns):
+        """
+        Append one batch of rows to every column, index them and bump the version.
+
+        All values are converted and every column is grown before any is written, so
+        a failure leaves the store unchanged instead of half-appended.
+
+        Args:
+            columns (list): (column, values) pairs; the row columns must have equal lengths.
+        """
+        start = len(self)
+        columns = [(column, np.asarray(values, dtype=column.view().dtype)) for column, values in columns]
+        for column, values in columns:
+            column.reserve(len(values))
+        for column, values in columns:
+            column.append(values)
+        self._index_rows(start)
+        self.version = next(LogStore._versions)
+
+    def append_logs(self, logs):
+        """
+        Append Log objects to the store.
+
+        Args:
+            logs (iterable): Log objects.
+        """
+        logs = list(logs)
+        self.append_frame(pd.DataFrame({
+            "timestamp": pd.Series([log.timestamp for log in logs], dtype="datetime64[us]"),
+            "sala": [log.sala for log in logs],
+            "estado": [log.estado for log in logs],
+            "temperatura": [log.temperatura for log in logs],
+            "humedad": [log.humedad for log in logs],
+            "co2": [log.co2 for log in logs],
+            "mensaje": pd.Series([log.mensaje for log in logs], dtype=object),
+        }))
+
+    @staticmethod
+    def _encode(values, categories, codes):
+        """
+        Map values to integer codes, registering unseen values.
+
+        Args:
+            values (pd.Series): The values to encode.
+            categories (list): Known values, indexed by code.
+            codes (dict): Value to code mapping.
+        Returns:
+            np.ndarray: The codes for each value.
+        """
+        local_codes, uniques = pd.factorize(values)
+        mapping = np.array([LogStore._intern(value, categories, codes) for value in uniques], dtype=np.int32)
+        return mapping[local_codes]
+
+    @staticmethod
+    def _intern(value, categories, codes):
+        """
+        Return the code of a value, registering it if unseen.
+
+        Args:
+            value: The value to look up.
+            categories (list): Known values, indexed by code.
+            codes (dict): Value to code mapping.
+        Returns:
+            int: The code of the value.
+        """
+        if value not in codes:
+            codes[value] = len(categories)
+            categories.append(value)
+        return codes[value]
+
+    def _index_rows(self, start):
+        """
+        Add rows from position start onwards to the segments of their rooms.
+
+        Rows that arrive in timestamp order are appended to their room's segment;
+        late rows are sorted among themselves and merged into that segment only.
+
+        Args:
+            start (int): Position of the first row not yet indexed.
+        """
+        timestamps = self._timestamp.view()[start:]
+        codes = self._sala.view()[start:]
+        order = np.lexsort((timestamps, codes))
+        boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+        for group in np.split(order, boundaries):
+            room = self._registry[int(codes[group[0]])]
+            new_ts = timestamps[group]
+            new_ids = group.astype(np.int64) + start
+            if room.segment is None:
+                room.segment = (_Column("datetime64[us]", new_ts), _Column(np.int64, new_ids))
+                continue
+            part_ts, part_ids = room.segment
+            if not part_ts._size or new_ts[0] >= part_ts.view()[-1]:
+                part_ts.append(new_ts)
+                part_ids.append(new_ids)
+                continue
+            # New rows are already sorted: merge them in with one O(segment) copy, no re-sort.
+            # side="right" keeps rows with equal timestamps in arrival order.
+            at = np.searchsorted(part_ts.view(), new_ts, side="right")
+            room.segment = (
+                _Column("datetime64[us]", np.insert(part_ts.view(), at, new_ts)),
+                _Column(np.int64, np.insert(part_ids.view(), at, new_ids)),
+            )
+
+    def snapshot(self):
+        """
+        Return a consistent read-only view of the current rows.
+        Later appends to this store are not visible through the snapshot.
+
+        Returns:
+            LogStore: A store sharing the current column data.
+        """
+        snap = LogStore.__new__(LogStore)
+        snap._lock = threading.Lock()
+        with self._lock:
+            for name in ("_timestamp", "_sala", "_estado", "_temperatura", "_humedad", "_co2",
+                         "_mensaje", "_mensaje_rows", "_mensaje_text"):
+                column = getattr(self, name)
+                setattr(snap, name, _Column(column.view().dtype, column.view()))
+            snap._registry = self._registry.copy()
+            for room in snap._registry:
+                if room.segment is not None:
+                    part_ts, part_ids = room.segment
+                    room.segment = (_Column(part_ts.view().dtype, part_ts.view()), _Column(np.int64, part_ids.view()))
+            snap._states = list(self._states)
+            snap._state_codes = dict(self._state_codes)
+            snap.version = self.version
+        return snap
+
+    def save(self, directory, source=None):
+        """
+        Write the store as a binary snapshot: one .npy file per column, the time index,
+        the free-text messages, and a manifest.json with the room/state dictionaries.
+        The snapshot is written next to the target and swapped in when complete.
+
+        Args:
+            directory (str): Snapshot directory (replaced if it exists).
+            source (dict, optional): Description of the source file, stored in the manifest.
+        """
+        snap = self.snapshot()
+        partial = f"{directory}.{os.getpid()}.part"
+        shutil.rmtree(partial, ignore_errors=True)
+        os.makedirs(partial)
+        for name in ("timestamp", "sala_codes", "estado_codes", "temperatura", "humedad", "co2", "mensaje_codes", "mensaje_rows"):
+            np.save(os.path.join(partial, f"{name}.npy"), getattr(snap, name))
+        # Free-text messages are stored as one NUL-separated UTF-8 blob, decoded with a single split
+        with open(os.path.join(partial, "mensaje.txt"), "w", encoding="utf-8") as f:
+            f.write("\x00".join(str(value) for value in snap.mensaje_texts))
+        indexed = [room for room in snap._registry if room.segment is not None]
+        codes = [room.code for room in indexed]
+        index_ts = [room.segment[0].view() for room in indexed]
+        index_ids = [room.segment[1].view() for room in indexed]
+        np.save(os.path.join(partial, "index_ts.npy"), np.concatenate(index_ts) if codes else snap.timestamp[:0])
+        np.save(os.path.join(partial, "index_ids.npy"), np.concatenate(index_ids) if codes else np.empty(0, dtype=np.int64))
+        with open(os.path.join(partial, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump({
+                "format": self.SNAPSHOT_FORMAT,
+                "rows": len(snap),
+                "rooms": list(snap.rooms),
+                "states": snap._states,
+                "index": [[code, len(ids)] for code, ids in zip(codes, index_ids)],
+                "source": source,
+            }, f)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(partial, directory)
+
+    @staticmethod
+    def read_manifest(directory):
+        """
+        Read the manifest of a snapshot.
+
+        Args:
+            directory (str): Snapshot directory.
+        Returns:
+            dict or None: The manifest, or None if there is no usable snapshot.
+        """
+        try:
+            with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return manifest if manifest.get("format") == LogStore.SNAPSHOT_FORMAT else None
+
+    @classmethod
+    def load(cls, directory):
+        """
+        Load a snapshot written by save. Numeric columns and the time index are
+        memory-mapped, so they are paged in on first access instead of being parsed.
+
+        Args:
+            directory (str): Snapshot directory.
+        Returns:
+            LogStore: The loaded store.
+        Raises:
+            ValueError: If the snapshot is missing or inconsistent.
+        """
+        manifest = cls.read_manifest(directory)
+        if manifest is None:
+            raise ValueError(f"No usable snapshot in {directory}")
+        load = lambda name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+        mensaje_rows = load("mensaje_rows")
+        with open(os.path.join(directory, "mensaje.txt"), encoding="utf-8") as f:
+            mensaje_text = np.array(f.read().split("\x00") if len(mensaje_rows) else [], dtype=object)
+        if len(mensaje_text) != len(mensaje_rows):
+            raise ValueError(f"Corrupt snapshot in {directory}")
+        store = cls()
+        store._timestamp = _Column("datetime64[us]", load("timestamp"))
+        store._sala = _Column(np.int32, load("sala_codes"))
+        store._estado = _Column(np.int32, load("estado_codes"))
+        store._temperatura = _Column(np.float64, load("temperatura"))
+        store._humedad = _Column(np.float64, load("humedad"))
+        store._co2 = _Column(np.float64, load("co2"))
+        store._mensaje = _Column(np.int8, load("mensaje_codes"))
+        store._mensaje_rows = _Column(np.int64, mensaje_rows)
+        store._mensaje_text = _Column(object, mensaje_text)
+        store._registry = RoomRegistry(manifest["rooms"])
+        store._states = list(manifest["states"])
+        store._state_codes = {state: code for code, state in enumerate(store._states)}
+        index_ts, index_ids = load("index_ts"), load("index_ids")
+        start = 0
+        for code, size in manifest["index"]:
+            store._registry[code].segment = (
+                _Column("datetime64[us]", index_ts[start:start + size]),
+                _Column(np.int64, index_ids[start:start + size]),
+            )
+            start += size
+        store.version = next(LogStore._versions)
+        return store
+
+    def __len__(self):
+        return self._timestamp._size
+
+    def __getitem__(self, index):
+        """
+        Build the Log object for one row.
+
+        Args:
+            index (int): Row position (negative values count from the end).
+        Returns:
+            Log: The log at that position.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LogStore index out of range")
+        code = int(self.mensaje_codes[index])
+        text = self.mensaje_texts[np.searchsorted(self.mensaje_rows, index)] if code == messages.TEXT else None
+        values = {name: float(getattr(self, name)[index]) for name in self.METRICS}
+        return Log(
+            timestamp=self.timestamp[index].item(),
+            sala=self._registry[self.sala_codes[index]].name,
+            estado=self._states[self.estado_codes[index]],
+            temperatura=values["temperatura"],
+            humedad=values["humedad"],
+            co2=values["co2"],
+            mensaje=messages.decode_row(code, text, values),
+        )
+
+    def __iter__(self):
+        # Messages and columns are decoded a chunk at a time instead of row by row
+        size, chunk_rows = len(self), 10_000
+        for start in range(0, size, chunk_rows):
+            positions = np.arange(start, min(start + chunk_rows, size))
+            columns = zip(
+                self.timestamp[positions].tolist(),
+                self.sala(positions).tolist(),
+                self.estado(positions).tolist(),
+                self.temperatura[positions].tolist(),
+                self.humedad[positions].tolist(),
+                self.co2[positions].tolist(),
+                self.mensaje(positions).tolist(),
+            )
+            for timestamp, sala, estado, temperatura, humedad, co2, mensaje in columns:
+                yield Log(timestamp, sala, estado, temperatura, humedad, co2, mensaje)
+
+    @property
+    def timestamp(self):
+        return self._timestamp.view()
+
+    @property
+    def sala_codes(self):
+        return self._sala.view()
+
+    @property
+    def estado_codes(self):
+        return self._estado.view()
+
+    @property
+    def temperatura(self):
+        return self._temperatura.view()
+
+    @property
+    def humedad(self):
+        return self._humedad.view()
+
+    @property
+    def co2(self):
+        return self._co2.view()
+
+    @property
+    def mensaje_codes(self):
+        return self._mensaje.view()
+
+    @property
+    def mensaje_rows(self):
+        return self._mensaje_rows.view()
+
+    @property
+    def mensaje_texts(self):
+        return self._mensaje_text.view()
+
+    @property
+    def rooms(self):
+        """
+        Room names, indexed by code.
+        """
+        return self._registry.names
+
+    @property
+    def registry(self):
+        """
+        The RoomRegistry interning the room names, with the per-room segments.
+        """
+        return self._registry
+
+    @property
+    def states(self):
+        """
+        State names, indexed by code.
+        """
+        return tuple(self._states)
+
+    def room_code(self, room):
+        """
+        Look up the code of a room.
+
+        Args:
+            room (str): The room name.
+        Returns:
+            int or None: The code, or None if the room is unknown.
+        """
+        return self._registry.code(room)
+
+    def query(self, room, start=None, end=None, after=None):
+        """
+        Find the rows of a room within an inclusive time range using the time index.
+
+        Args:
+            room (str): Room name.
+            start (datetime, optional): Inclusive start of the range (unbounded if omitted).
+            end (datetime, optional): Inclusive end of the range (unbounded if omitted).
+            after (tuple, optional): (timestamp, row) of the last row already seen; only rows
+                ordered after it are returned, for cursor pagination.
+        Returns:
+            np.ndarray: Matching row positions, ordered by timestamp (ties keep insertion order).
+        """
+        room = self._registry.get(room)
+        segment = None if room is None else room.segment
+        if segment is None:
+            return np.empty(0, dtype=np.int64)
+        part_ts, part_ids = segment[0].view(), segment[1].view()
+        lo = 0 if start is None else np.searchsorted(part_ts, np.datetime64(start, "us"), side="left")
+        hi = len(part_ts) if end is None else np.searchsorted(part_ts, np.datetime64(end, "us"), side="right")
+        if after is not None:
+            ts = np.datetime64(after[0], "us")
+            first = np.searchsorted(part_ts, ts, side="left")
+            last = np.searchsorted(part_ts, ts, side="right")
+            # Rows sharing the cursor's timestamp are in insertion (row id) order
+            lo = max(lo, first + np.searchsorted(part_ids[first:last], after[1], side="right"))
+        return part_ids[lo:max(lo, hi)]
+
+    def sala(self, ids=None):
+        """
+        Decode room names.
+
+        Args:
+            ids (np.ndarray, optional): Row positions to decode (all rows if omitted).
+        Returns:
+            np.ndarray: Object array of room names.
+        """
+        codes = self.sala_codes if ids is None else self.sala_codes[ids]
+        return np.asarray(self.rooms, dtype=object)[codes] if len(codes) else np.empty(0, dtype=object)
+
+    def estado(self, ids=None):
+        """
+        Decode state names.
+
+        Args:
+            ids (np.ndarray, optional): Row positions to decode (all rows if omitted).
+        Returns:
+            np.ndarray: Object array of state names.
+        """
+        codes = self.estado_codes if ids is None else self.estado_codes[ids]
+        return np.asarray(self._states, dtype=object)[codes] if len(codes) else np.empty(0, dtype=object)
+
+    def mensaje(self, ids=None):
+        """
+        Rebuild messages from their template codes and the free-text rows.
+
+        Args:
+            ids (np.ndarray, optional): Row positions to decode (all rows if omitted).
+        Returns:
+            np.ndarray: Object array of messages (None when missing).
+        """
+        positions = np.arange(len(self)) if ids is None else np.asarray(ids, dtype=np.int64)
+        codes = self.mensaje_codes[positions]
+        text_rows = self.mensaje_rows
+        texts = self.mensaje_texts[np.searchsorted(text_rows, positions[codes == messages.TEXT])]
+        return messages.decode(codes, texts, {name: getattr(self, name)[positions] for name in self.METRICS})
+
+    def to_frame(self, ids=None):
+        """
+        Materialize rows as a DataFrame with the Log field names as columns.
+
+        Args:
+            ids (np.ndarray, optional): Row positions to include (all rows if omitted).
+        Returns:
+            pd.DataFrame: The selected rows.
+        """
+        positions = np.arange(len(self)) if ids is None else np.asarray(ids)
+        return pd.DataFrame({
+            "timestamp": self.timestamp[positions],
+            "sala": self.sala(positions),
+            "estado": self.estado(positions),
+            "temperatura": self.temperatura[positions],
+            "humedad": self.humedad[positions],
+            "co2": self.co2[positions],
+            "mensaje": self.mensaje(positions),
+        })
+
+    def iter_frames(self, ids=None, chunk_rows=10_000):
+        """
+        Materialize rows as a sequence of small DataFrames, so large selections never
+        exist as one frame in memory.
+
+        Args:
+            ids (np.ndarray, optional): Row positions to include (all rows if omitted).
+            chunk_rows (int): Maximum rows per frame.
+        Yields:
+            pd.DataFrame: Consecutive chunks of the selection (one empty frame if nothing matches).
+        """
+        positions = np.arange(len(self)) if ids is None else np.asarray(ids)
+        yield self.to_frame(positions[:chunk_rows])
+        for start in range(chunk_rows, len(positions), chunk_rows):
+            yield self.to_frame(positions[start:start + chunk_rows])
+
+    def iter_records(self, ids=None, chunk_rows=10_000):
+        """
+        Convert rows to JSON-friendly dicts chunk by chunk (see records).
+
+        Args:
+            ids (np.ndarray, optional): Row positions to include (all rows if omitted).
+            chunk_rows (int): Maximum rows per chunk.
+        Yields:
+            list: Dicts of consecutive rows of the selection.
+        """
+        positions = np.arange(len(self)) if ids is None else np.asarray(ids)
+        for start in range(0, len(positions), chunk_rows):
+            yield self.records(positions[start:start + chunk_rows])
+
+    @metrics.timed("serialization")
+    def records(self, ids=None):
+        """
+        Convert rows to JSON-friendly dicts with the Log field names as keys.
+
+        Args:
+            ids (np.ndarray or slice, optional): Rows to include (all rows if omitted).
+        Returns:
+            list: List of dicts, one per row.
+        """
+        positions = np.arange(len(self))[ids if ids is not None else slice(None)]
+        mensaje = self.mensaje(positions)
+        columns = zip(
+            self.timestamp[positions].tolist(),
+            self.sala(positions).tolist(),
+            self.estado(positions).tolist(),
+            self.temperatura[positions].tolist(),
+            self.humedad[positions].tolist(),
+            self.co2[positions].tolist(),
+            np.where(pd.isna(mensaje), None, mensaje).tolist(),
+        )
+        return [
+            {"timestamp": timestamp, "sala": sala, "estado": estado, "temperatura": temperatura,
+             "humedad": humedad, "co2": co2, "mensaje": mensaje}
+            for timestamp, sala, estado, temperatura, humedad, co2, mensaje in columns
+        ]
+
+
+def as_store(logs):
+    """
+    Return logs as a LogStore, converting a list of Log objects if needed.
+
+    Args:
+        logs (LogStore or iterable): The logs to process.
+    Returns:
+        LogStore: A columnar view of the logs.
+    """
+    if isinstance(logs, LogStore):
+        return logs
+    return LogStore.from_logs(logs)
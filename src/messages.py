@@ -0,0 +1,191 @@
+import string
+import sys
+import numpy as np
+import pandas as pd
+
+# Message codes stored per row; templates are numbered from FIRST_TEMPLATE in TEMPLATES order
+MISSING = 0
+TEXT = 1
+FIRST_TEMPLATE = 2
+
+
+class MessageTemplate:
+    """
+    A message pattern that can be rebuilt from the numeric columns of its row, e.g.
+    "T={temperatura}°C". Fields name LogStore columns; the "d" format spec renders a
+    value as an integer, no spec renders it like str(float).
+    """
+    def __init__(self, pattern):
+        """
+        Initialize the template.
+
+        Args:
+            pattern (str): The message with {column} or {column:d} fields.
+        """
+        self.pattern = pattern
+        self._parts = [(literal, field, spec) for literal, field, spec, _ in string.Formatter().parse(pattern)]
+        # Positional format string taking the already rendered field values
+        self._format = "".join(
+            literal.replace("{", "{{").replace("}", "}}") + ("{}" if field is not None else "")
+            for literal, field, _ in self._parts
+        )
+
+    def render(self, columns):
+        """
+        Build the message of every row.
+
+        Args:
+            columns (dict): Column name to np.ndarray of the rows' values.
+        Returns:
+            np.ndarray: Object array of messages.
+        """
+        size = len(next(iter(columns.values()))) if columns else 0
+        fields = [_format(columns[field], spec) for _, field, spec in self._parts if field is not None]
+        if not fields:
+            return np.full(size, self.pattern, dtype=object)
+        rendered = np.empty(size, dtype=object)
+        rendered[:] = list(map(self._format.format, *fields))
+        return rendered
+
+    def render_row(self, values):
+        """
+        Build the message of a single row, without the vectorized setup of render.
+
+        Args:
+            values (dict): Column name to the row's value.
+        Returns:
+            str: The message.
+        """
+        return self._format.format(*(_format_value(values[field], spec) for _, field, spec in self._parts if field is not None))
+
+    @property
+    def fields(self):
+        """
+        Names of the columns the template reads.
+        """
+        return tuple(field for _, field, _ in self._parts if field is not None)
+
+
+# Known message templates; append new ones at the end so stored codes stay valid
+TEMPLATES = (
+    MessageTemplate("Medición registrada: T={temperatura}°C, H={humedad}%, CO2={co2:d}ppm"),
+)
+
+
+def encode(messages, columns):
+    """
+    Replace messages that a template rebuilds exactly by the template's code.
+
+    A message is only templated when rendering the template from the row's values gives
+    back the same text, so decoding is lossless; anything else is kept as free text.
+
+    Args:
+        messages (array-like): The messages of a batch of rows (NaN/None when missing).
+        columns (dict): Column name to np.ndarray of the same rows' values.
+    Returns:
+        np.ndarray: int8 code of each row (MISSING, TEXT or a template code).
+    """
+    messages = np.asarray(messages, dtype=object)
+    codes = np.full(len(messages), TEXT, dtype=np.int8)
+    missing = pd.isna(messages)
+    codes[missing] = MISSING
+    pending = np.flatnonzero(~missing)
+    for code, template in enumerate(TEMPLATES, start=FIRST_TEMPLATE):
+        if not len(pending):
+            break
+        rendered = template.render({field: columns[field][pending] for field in template.fields})
+        matched = pending[rendered == messages[pending]]
+        codes[matched] = code
+        pending = np.setdiff1d(pending, matched, assume_unique=True)
+    return codes
+
+
+def decode(codes, texts, columns):
+    """
+    Rebuild the messages of a selection of rows.
+
+    Args:
+        codes (np.ndarray): Message code of each row.
+        texts (np.ndarray): Free text of the TEXT rows, in row order.
+        columns (dict): Column name to np.ndarray of the rows' values.
+    Returns:
+        np.ndarray: Object array of messages (None when missing).
+    """
+    messages = np.full(len(codes), None, dtype=object)
+    messages[codes == TEXT] = texts
+    for code in np.unique(codes[codes >= FIRST_TEMPLATE]):
+        rows = np.flatnonzero(codes == code)
+        template = TEMPLATES[code - FIRST_TEMPLATE]
+        messages[rows] = template.render({field: columns[field][rows] for field in template.fields})
+    return messages
+
+
+def decode_row(code, text, values):
+    """
+    Rebuild the message of a single row.
+
+    Args:
+        code (int): Message code of the row.
+        text (str): Free text of the row (only read for TEXT rows).
+        values (dict): Column name to the row's value.
+    Returns:
+        str or None: The message (None when missing).
+    """
+    if code == MISSING:
+        return None
+    if code == TEXT:
+        return text
+    return TEMPLATES[code - FIRST_TEMPLATE].render_row(values)
+
+
+def compression_stats(store):
+    """
+    Measure how much the template encoding saves on the messages of a store.
+
+    Args:
+        store (LogStore): The logs.
+    Returns:
+        dict: Row counts by encoding, raw and encoded UTF-8 sizes with their ratio, and the
+            memory the messages would take as Python strings against the encoded columns.
+    """
+    codes = store.mensaje_codes
+    texts = store.mensaje_texts
+    messages = store.mensaje()
+    present = messages[codes != MISSING]
+    raw_bytes = sum(len(str(message).encode("utf-8")) for message in present)
+    encoded_bytes = codes.nbytes + store.mensaje_rows.nbytes + sum(len(str(text).encode("utf-8")) for text in texts)
+    # Each Python string costs its object size plus one pointer in the object column
+    raw_memory = len(messages) * 8 + sum(sys.getsizeof(message) for message in present)
+    encoded_memory = codes.nbytes + store.mensaje_rows.nbytes + len(texts) * 8 + sum(sys.getsizeof(text) for text in texts)
+    templated = int((codes >= FIRST_TEMPLATE).sum())
+    return {
+        "rows": len(codes),
+        "templated": templated,
+        "text": len(texts),
+        "missing": int((codes == MISSING).sum()),
+        "raw_bytes": raw_bytes,
+        "encoded_bytes": encoded_bytes,
+        "compression_ratio": raw_bytes / encoded_bytes if encoded_bytes else None,
+        "memory_saved_bytes": raw_memory - encoded_memory,
+    }
+
+
+def _format(values, spec):
+    """
+    Render a numeric column as strings for a template field.
+    Each distinct value is converted once, since readings repeat heavily.
+    """
+    if spec == "d":
+        values = np.where(np.isfinite(values), values, 0).round().astype(np.int64)
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return np.array([str(value) for value in uniques.tolist()], dtype=object)[codes]
+
+
+def _format_value(value, spec):
+    """
+    Render one value for a template field, exactly as _format renders it in a column.
+    """
+    value = float(value)
+    if spec == "d":
+        return str(int(round(value)) if np.isfinite(value) else 0)
+    return str(value)
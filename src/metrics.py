@@ -0,0 +1,245 @@
+import bisect
+import functools
+import threading
+import time
+
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+STAGE_METRIC = "ecowatch_stage_seconds"
+REQUEST_METRIC = "ecowatch_request_seconds"
+
+
+class Histogram:
+    """
+    Cumulative histogram of observed values, in the Prometheus sense.
+    """
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets (tuple): Sorted upper bounds of the buckets (+Inf is implied).
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        """
+        Record one value.
+
+        Args:
+            value (float): The observed value.
+        """
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+            self.count += 1
+
+
+class _Timer:
+    """
+    Context manager observing the elapsed monotonic time of its block.
+    """
+    __slots__ = ("histogram", "started")
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started)
+        return False
+
+
+class _NullTimer:
+    """
+    Context manager doing nothing, returned while metrics are disabled.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """
+    Registry of timing histograms and gauges, rendered in the Prometheus text format.
+    Timers use the monotonic clock. While disabled, timers are a shared no-op context
+    manager and observations return immediately, so instrumentation can stay in place.
+    """
+    def __init__(self, enabled=True, buckets=DEFAULT_BUCKETS):
+        """
+        Initialize the registry.
+
+        Args:
+            enabled (bool): Whether timings are recorded.
+            buckets (tuple): Upper bounds of the histogram buckets.
+        """
+        self.enabled = enabled
+        self.buckets = buckets
+        self._histograms = {}
+        self._gauges = {}
+        self._help = {
+            STAGE_METRIC: "Time spent in each processing stage.",
+            REQUEST_METRIC: "HTTP request latency until the response starts.",
+        }
+        self._lock = threading.Lock()
+
+    def histogram(self, name, **labels):
+        """
+        Get (or create) the histogram of a metric and label set.
+
+        Args:
+            name (str): Metric name.
+            **labels: Label values.
+        Returns:
+            Histogram: The histogram.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(self.buckets))
+        return histogram
+
+    def observe(self, name, value, **labels):
+        """
+        Record a value (no-op while disabled).
+
+        Args:
+            name (str): Metric name.
+            value (float): The observed value.
+            **labels: Label values.
+        """
+        if self.enabled:
+            self.histogram(name, **labels).observe(value)
+
+    def timer(self, name, **labels):
+        """
+        Time a block of code: `with metrics.timer(name, **labels): ...`.
+
+        Args:
+            name (str): Metric name.
+            **labels: Label values.
+        Returns:
+            Context manager recording the block's duration.
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self.histogram(name, **labels))
+
+    def stage(self, stage, **labels):
+        """
+        Time a processing stage (CSV parse, validation, report generation, ...).
+
+        Args:
+            stage (str): Stage name.
+            **labels: Extra label values.
+        Returns:
+            Context manager recording the block's duration.
+        """
+        return self.timer(STAGE_METRIC, stage=stage, **labels)
+
+    def timed(self, stage, **labels):
+        """
+        Decorator timing every call of a function as a processing stage.
+
+        Args:
+            stage (str): Stage name.
+            **labels: Extra label values.
+        Returns:
+            callable: The decorator.
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.stage(stage, **labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def gauge(self, name, help, collect):
+        """
+        Register a gauge read at render time.
+
+        Args:
+            name (str): Metric name.
+            help (str): Description.
+            collect (callable): Returns the current value.
+        """
+        self._gauges[name] = collect
+        self._help[name] = help
+
+    def reset(self):
+        """
+        Drop every recorded observation.
+        """
+        with self._lock:
+            self._histograms.clear()
+
+    def render(self):
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics page.
+        """
+        lines = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        families = {}
+        for (name, labels), histogram in histograms:
+            families.setdefault(name, []).append((labels, histogram))
+        for name, series in families.items():
+            lines.append(f"# HELP {name} {self._help.get(name, name)}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in series:
+                with histogram._lock:
+                    counts, total, count = list(histogram.counts), histogram.sum, histogram.count
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets + (float("inf"),), counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{name}_bucket{_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels)} {total!r}")
+                lines.append(f"{name}_count{_labels(labels)} {count}")
+        for name, collect in self._gauges.items():
+            lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {float(collect())!r}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels):
+    """
+    Format label pairs as {name="value",...} (empty string without labels).
+    """
+    if not labels:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+# Process-wide registry used by the instrumented modules
+metrics = Metrics()
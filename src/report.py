@@ -11,7 +11,7 @@ class Report(ABC):
         Generate the report based on the provided logs.
 
         Args:
-            logs (list): List of Log objects to process.
+            logs (LogStore or list): Logs to process (a LogStore or a list of Log objects).
         Returns:
             Any: The result of the report generation (format depends on the report type).
         """
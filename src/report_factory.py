@@ -1,8 +1,19 @@
 from src.report import Report
 from src.reports_state_by_room import StateByRoomReport
 from src.reports_critical_alerts import CriticalAlertsReport
+from src.reports_anomalies import AnomalyReport
+from src.log_store import as_store
+from src.metrics import metrics
+import io
+import json
+import os
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # Optional: the standard json module is used instead
+    orjson = None
+
 class ReportFactory:
     """
     Factory class to create report instances based on the report type.
@@ -37,12 +48,44 @@ class ReportFactory:
             raise ValueError(f"Report type '{report_type}' is not registered.")
         return creator(*args, **kwargs)
 
+    @property
+    def report_types(self):
+        """
+        Identifiers of the registered report types, in registration order.
+        """
+        return tuple(self._creators)
+
+    def generate_many(self, report_types, logs):
+        """
+        Generate several reports from one columnar view of the logs.
+
+        The logs are converted to a LogStore once and every report reads the same typed
+        columns, so K reports cost one conversion plus K vectorized passes instead of K
+        conversions. All report types are checked before any report is generated.
+
+        Args:
+            report_types (iterable): Report identifiers registered in the factory.
+            logs (LogStore or list): Logs to process.
+        Returns:
+            dict: Report identifier to generated report (pd.DataFrame), in request order.
+        Raises:
+            ValueError: If a report type is not registered.
+        """
+        reports = {report_type: self.create_report(report_type) for report_type in report_types}
+        store = as_store(logs)
+        generated = {}
+        for report_type, report in reports.items():
+            with metrics.stage("report_generation", report=report_type):
+                generated[report_type] = report.generate(store)
+        return generated
+
     def register_default_reports(self):
         """
         Register all default report types in the factory.
         """
         self.register_report("state_by_room", StateByRoomReport)
         self.register_report("critical_alerts", CriticalAlertsReport)
+        self.register_report("anomalies", AnomalyReport)
 
 
 def export_report(df, filename):
@@ -59,3 +102,130 @@ def export_report(df, filename):
         df.to_excel(filename, index=False)
     else:
         raise ValueError("Unsupported file format. Use .csv or .xlsx")
+
+
+# Rows serialized per chunk by iter_csv_export and iter_frame_chunks
+CSV_CHUNK_ROWS = 10_000
+
+
+def iter_frame_chunks(df, chunk_rows=CSV_CHUNK_ROWS):
+    """
+    Split a DataFrame into consecutive row chunks (the empty frame yields itself once).
+
+    Args:
+        df (pd.DataFrame): The frame to split.
+        chunk_rows (int): Maximum rows per chunk.
+    Yields:
+        pd.DataFrame: Row slices of df.
+    """
+    yield df.iloc[:chunk_rows]
+    for start in range(chunk_rows, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def iter_csv_export(frames, filename=None):
+    """
+    Serialize DataFrame chunks to CSV incrementally, in a single pass.
+
+    The header is written with the first chunk. If filename is given, the same bytes
+    are also written to disk; the file only replaces an existing export once the
+    last chunk has been written.
+
+    Args:
+        frames (iterable): DataFrame chunks with identical columns.
+        filename (str, optional): Path of the on-disk copy.
+    Yields:
+        bytes: Encoded CSV chunks.
+    """
+    partial = f"{filename}.{os.getpid()}.{id(frames)}.part" if filename else None
+    tee = open(partial, "wb") if partial else None
+    try:
+        header = True
+        for frame in frames:
+            with metrics.stage("serialization", format="csv"):
+                chunk = frame.to_csv(index=False, header=header, date_format="%Y-%m-%d %H:%M:%S").encode()
+            header = False
+            if tee:
+                tee.write(chunk)
+            yield chunk
+        if tee:
+            tee.close()
+            os.replace(partial, filename)
+    finally:
+        if tee and not tee.closed:
+            tee.close()
+            os.remove(partial)
+
+
+def write_xlsx(df, filename):
+    """
+    Write a DataFrame to an XLSX file. Module-level so it can run in a worker process.
+
+    Args:
+        df (pd.DataFrame): The data to write.
+        filename (str): The output file path.
+    """
+    df.to_excel(filename, index=False, engine="openpyxl")
+
+
+def frame_to_xlsx(df):
+    """
+    Serialize a DataFrame as XLSX. Module-level so it can run in a worker process.
+
+    Args:
+        df (pd.DataFrame): The data to serialize.
+    Returns:
+        bytes: The XLSX file content.
+    """
+    buf = io.BytesIO()
+    df.to_excel(buf, index=False, engine="openpyxl")
+    return buf.getvalue()
+
+
+def _json_default(value):
+    """
+    Encode the values json cannot handle natively (datetimes) as ISO 8601 strings.
+    """
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def iter_ndjson(chunks):
+    """
+    Serialize chunks of records as newline-delimited JSON, one line per record.
+
+    orjson is used when installed; it is several times faster than the json module.
+
+    Args:
+        chunks (iterable): Lists of JSON-friendly dicts (see LogStore.iter_records).
+    Yields:
+        bytes: Encoded lines of one chunk.
+    """
+    for records in chunks:
+        with metrics.stage("serialization", format="ndjson"):
+            if orjson is not None:
+                chunk = b"".join(orjson.dumps(record) + b"\n" for record in records)
+            else:
+                chunk = "".join(json.dumps(record, default=_json_default) + "\n" for record in records).encode()
+        yield chunk
+
+
+@metrics.timed("export")
+def write_export(frames, filename, format):
+    """
+    Write DataFrame chunks to a file as CSV (chunk by chunk) or XLSX.
+
+    Args:
+        frames (iterable): DataFrame chunks with identical columns.
+        filename (str): The output file path (any extension).
+        format (str): "csv" or "xlsx".
+    """
+    if format == "csv":
+        with open(filename, "wb") as f:
+            for chunk in iter_csv_export(frames):
+                f.write(chunk)
+    elif format == "xlsx":
+        write_xlsx(pd.concat(frames, ignore_index=True), filename)
+    else:
+        raise ValueError("Unsupported file format. Use csv or xlsx")
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import pandas as pd
 
 class ReportStrategy(ABC):
     """
@@ -11,8 +12,23 @@ class ReportStrategy(ABC):
         Generate a report based on the provided logs.
 
         Args:
-            logs (list): List of Log objects to process.
+            logs (LogStore or list): Logs to process (a LogStore or a list of Log objects).
         Returns:
             Any: The result of the report generation (format depends on the strategy).
         """
         pass
+
+    def generate_batches(self, batches):
+        """
+        Generate the report from an iterable of log batches, one batch at a time.
+
+        The default implementation concatenates the per-batch results, which is correct
+        for row-wise reports; aggregating strategies override it to merge partial results.
+
+        Args:
+            batches (iterable): LogStore batches (see LogReader.iter_batches).
+        Returns:
+            pd.DataFrame: The combined report.
+        """
+        results = [result for result in (self.generate(batch) for batch in batches) if not result.empty]
+        return pd.concat(results, ignore_index=True) if results else pd.DataFrame()
@@ -0,0 +1,235 @@
+from src.report import Report
+from src.report_strategy import ReportStrategy
+from src.log_store import as_store
+from src.alert_rules import METRICS
+from collections import deque
+import math
+import threading
+import numpy as np
+import pandas as pd
+
+# Columns of the anomalies report
+COLUMNS = ("room", "timestamp", "metric", "value", "expected", "zscore")
+
+
+class _RoomStats:
+    """
+    Exponentially weighted mean and variance of each metric of one room.
+    """
+    __slots__ = ("count", "mean", "var")
+
+    def __init__(self, count, mean, var):
+        self.count = count
+        self.mean = mean
+        self.var = var
+
+
+class AnomalyDetector:
+    """
+    Streaming per-room anomaly detector.
+    Keeps an exponentially weighted mean and variance of every metric per room and scores
+    each log against the statistics of the logs before it: a metric whose z-score exceeds
+    the threshold is an anomaly. Scoring and updating a log is O(1) in time and memory per
+    room, so the detector can be fed log by log (e.g. as a TemporalCache listener).
+    """
+    def __init__(self, alpha=0.05, threshold=4.0, warmup=20, max_anomalies=None):
+        """
+        Initialize the detector.
+
+        Args:
+            alpha (float): Weight of the newest log in the moving statistics (0 < alpha <= 1).
+            threshold (float): Absolute z-score above which a metric is anomalous.
+            warmup (int): Logs a room needs before its readings are scored.
+            max_anomalies (int, optional): Most recent anomalies kept (all if omitted).
+        """
+        self.alpha = alpha
+        self.threshold = threshold
+        self.warmup = warmup
+        self._rooms = {}
+        self._anomalies = deque(maxlen=max_anomalies)
+        self._lock = threading.Lock()
+
+    def add_log(self, log):
+        """
+        Score one log against its room's statistics, then fold it into them.
+
+        Args:
+            log (Log): The log entry to add.
+        """
+        values = (log.temperatura, log.humedad, log.co2)
+        with self._lock:
+            stats = self._rooms.get(log.sala)
+            if stats is None:
+                self._rooms[log.sala] = _RoomStats(1, list(values), [0.0] * len(values))
+                return
+            for i, (metric, value) in enumerate(zip(METRICS, values)):
+                mean, var = stats.mean[i], stats.var[i]
+                if stats.count >= self.warmup and var > 0:
+                    zscore = (value - mean) / math.sqrt(var)
+                    if abs(zscore) > self.threshold:
+                        self._anomalies.append((log.sala, log.timestamp, metric, value, mean, zscore))
+                diff = value - mean
+                increment = self.alpha * diff
+                stats.mean[i] = mean + increment
+                stats.var[i] = (1 - self.alpha) * (var + diff * increment)
+            stats.count += 1
+
+    def add_batch(self, logs):
+        """
+        Score and fold a batch of logs, in row order, with one vectorized pass per room.
+        Gives the same result as calling add_log on each log.
+
+        Args:
+            logs (LogStore or list): Logs to add.
+        """
+        store = as_store(logs)
+        if not len(store):
+            return
+        codes = store.sala_codes
+        order = np.argsort(codes, kind="stable")
+        boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+        values = np.column_stack([getattr(store, column) for column in METRICS.values()])
+        found = []
+        with self._lock:
+            for ids in np.split(order, boundaries):
+                room = store.rooms[codes[ids[0]]]
+                found.extend(self._add_room_rows(room, ids, values[ids], store.timestamp[ids]))
+            found.sort(key=lambda anomaly: anomaly[0])
+            self._anomalies.extend(anomaly for _, anomaly in found)
+
+    def _add_room_rows(self, room, ids, values, timestamps):
+        """
+        Score and fold the rows of one room.
+
+        The exponentially weighted recursions are run by pandas. A room with earlier
+        statistics is continued by seeding the recursion with its mean and adding the
+        decayed earlier variance, since the variance recursion is linear in it.
+
+        Args:
+            room (str): The room name.
+            ids (np.ndarray): Row positions, in row order.
+            values (np.ndarray): Metric values of the rows (one column per metric).
+            timestamps (np.ndarray): Timestamps of the rows.
+        Returns:
+            list: (row, anomaly tuple) pairs.
+        """
+        stats = self._rooms.get(room)
+        seeded = stats is not None
+        frame = np.vstack([stats.mean, values]) if seeded else values
+        ewm = pd.DataFrame(frame).ewm(alpha=self.alpha, adjust=False)
+        means, variances = ewm.mean().to_numpy(), ewm.var(bias=True).to_numpy()
+        if seeded:
+            variances = variances + np.outer((1 - self.alpha) ** np.arange(len(frame)), stats.var)
+            prior_mean, prior_var = means[:-1], variances[:-1]
+            prior_count = stats.count + np.arange(len(values))
+        else:
+            # The first log of a room only initializes its statistics
+            prior_mean = np.vstack([values[:1], means[:-1]])
+            prior_var = np.vstack([np.zeros((1, values.shape[1])), variances[:-1]])
+            prior_count = np.arange(len(values))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            zscores = (values - prior_mean) / np.sqrt(prior_var)
+        scored = (prior_count >= self.warmup)[:, None] & (prior_var > 0)
+        rows, columns = np.nonzero(scored & (np.abs(zscores) > self.threshold))
+        metrics = list(METRICS)
+        found = [
+            (int(ids[row]), (room, timestamps[row].item(), metrics[column], float(values[row, column]),
+                             float(prior_mean[row, column]), float(zscores[row, column])))
+            for row, column in zip(rows, columns)
+        ]
+        count = (stats.count if seeded else 0) + len(values)
+        self._rooms[room] = _RoomStats(count, means[-1].tolist(), variances[-1].tolist())
+        return found
+
+    def to_frame(self):
+        """
+        Build the anomalies report from the anomalies found so far.
+
+        Returns:
+            pd.DataFrame: One row per anomalous metric of a log, in arrival order.
+        """
+        with self._lock:
+            anomalies = list(self._anomalies)
+        if not anomalies:
+            return pd.DataFrame()
+        return pd.DataFrame(anomalies, columns=COLUMNS)
+
+
+class AnomalyDetectionStrategy(ReportStrategy):
+    """
+    Strategy for generating an anomalies report.
+    Scores every log against exponentially weighted per-room statistics (see AnomalyDetector).
+    """
+    def __init__(self, alpha=0.05, threshold=4.0, warmup=20):
+        """
+        Initialize the strategy.
+
+        Args:
+            alpha (float): Weight of the newest log in the moving statistics.
+            threshold (float): Absolute z-score above which a metric is anomalous.
+            warmup (int): Logs a room needs before its readings are scored.
+        """
+        self.alpha = alpha
+        self.threshold = threshold
+        self.warmup = warmup
+
+    def generate(self, logs):
+        """
+        Generate the anomalies report.
+
+        Args:
+            logs (LogStore or list): Logs to process, in arrival order.
+        Returns:
+            pd.DataFrame: One row per anomalous metric of a log.
+        """
+        return self.generate_batches([logs])
+
+    def generate_batches(self, batches):
+        """
+        Generate the report batch by batch, carrying the per-room statistics across batches.
+
+        Args:
+            batches (iterable): LogStore batches (see LogReader.iter_batches).
+        Returns:
+            pd.DataFrame: One row per anomalous metric of a log.
+        """
+        detector = AnomalyDetector(self.alpha, self.threshold, self.warmup)
+        for batch in batches:
+            detector.add_batch(batch)
+        return detector.to_frame()
+
+
+class AnomalyReport(Report):
+    """
+    Report that lists readings deviating from their room's recent behaviour using a strategy.
+    """
+    def __init__(self, strategy=None):
+        """
+        Initialize the report with a strategy.
+
+        Args:
+            strategy (ReportStrategy, optional): The strategy to use for report generation.
+        """
+        self.strategy = strategy or AnomalyDetectionStrategy()
+
+    def generate(self, logs):
+        """
+        Generate the report using the assigned strategy.
+
+        Args:
+            logs (LogStore or list): Logs to process.
+        Returns:
+            pd.DataFrame: The generated report as a DataFrame.
+        """
+        return self.strategy.generate(logs)
+
+    def generate_batches(self, batches):
+        """
+        Generate the report batch by batch using the assigned strategy.
+
+        Args:
+            batches (iterable): LogStore batches (see LogReader.iter_batches).
+        Returns:
+            pd.DataFrame: The generated report as a DataFrame.
+        """
+        return self.strategy.generate_batches(batches)
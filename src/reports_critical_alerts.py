@@ -1,44 +1,56 @@
 from src.report import Report
 from src.report_strategy import ReportStrategy
+from src.log_store import as_store
+from src.alert_rules import RuleSet, ThresholdRule
 import pandas as pd
 
 class CriticalAlertsStrategy(ReportStrategy):
     """
     Strategy for generating a critical alerts report.
-    Identifies logs where environmental metrics exceed critical thresholds.
+    Identifies logs that fire an alert rule and tags each one with the rule.
     """
-    # Example thresholds (can be adjusted)
+    # Thresholds of the default rule set, used when no rules are given
     TEMP_THRESHOLD = 30.0
     HUMIDITY_THRESHOLD = 80.0
     CO2_THRESHOLD = 1000.0
 
+    def __init__(self, rules=None):
+        """
+        Initialize the strategy with a rule set.
+
+        Args:
+            rules (RuleSet, optional): The alert rules. Defaults to the class thresholds
+                as upper bounds on temperature, humidity and CO2.
+        """
+        self.rules = rules or RuleSet([
+            ThresholdRule("high_temperature", "temperature", upper=self.TEMP_THRESHOLD),
+            ThresholdRule("high_humidity", "humidity", upper=self.HUMIDITY_THRESHOLD),
+            ThresholdRule("high_co2", "co2", upper=self.CO2_THRESHOLD),
+        ])
+
     def generate(self, logs):
         """
-        Generate a report of critical alerts based on thresholds.
+        Generate a report of critical alerts based on the alert rules.
 
         Args:
-            logs (list): List of Log objects to process.
+            logs (LogStore or list): Logs to process.
         Returns:
             pd.DataFrame: DataFrame of critical alerts.
         """
-        data = [
-            {
-                "room": log.sala,
-                "temperature": log.temperatura,
-                "humidity": log.humedad,
-                "co2": log.co2,
-                "state": log.estado,
-                "timestamp": log.timestamp,
-                "message": log.mensaje,
-            }
-            for log in logs
-            if (
-                log.temperatura > self.TEMP_THRESHOLD or
-                log.humedad > self.HUMIDITY_THRESHOLD or
-                log.co2 > self.CO2_THRESHOLD
-            )
-        ]
-        return pd.DataFrame(data)
+        store = as_store(logs)
+        ids, fired = self.rules.evaluate(store)
+        if not len(ids):
+            return pd.DataFrame()
+        return pd.DataFrame({
+            "room": store.sala(ids),
+            "temperature": store.temperatura[ids],
+            "humidity": store.humedad[ids],
+            "co2": store.co2[ids],
+            "state": store.estado(ids),
+            "timestamp": store.timestamp[ids],
+            "message": store.mensaje(ids),
+            "rule": fired,
+        })
 
 class CriticalAlertsReport(Report):
     """
@@ -58,8 +70,19 @@ class CriticalAlertsReport(Report):
         Generate the report using the assigned strategy.
 
         Args:
-            logs (list): List of Log objects to process.
+            logs (LogStore or list): Logs to process.
         Returns:
             pd.DataFrame: The generated report as a DataFrame.
         """
         return self.strategy.generate(logs)
+
+    def generate_batches(self, batches):
+        """
+        Generate the report batch by batch using the assigned strategy.
+
+        Args:
+            batches (iterable): LogStore batches (see LogReader.iter_batches).
+        Returns:
+            pd.DataFrame: The generated report as a DataFrame.
+        """
+        return self.strategy.generate_batches(batches)
@@ -1,5 +1,8 @@
 from src.report import Report
 from src.report_strategy import ReportStrategy
+from src.log_store import as_store
+import threading
+import numpy as np
 import pandas as pd
 
 class StateByRoomStrategy(ReportStrategy):
@@ -12,31 +15,126 @@ class StateByRoomStrategy(ReportStrategy):
         Generate a summary report by room.
 
         Args:
-            logs (list): List of Log objects to process.
+            logs (LogStore or list): Logs to process.
         Returns:
             pd.DataFrame: Tabular summary by room.
         """
-        data = [
-            {
-                "room": log.sala,
-                "temperature": log.temperatura,
-                "humidity": log.humedad,
-                "co2": log.co2,
-                "state": log.estado,
-                "timestamp": log.timestamp,
-            }
-            for log in logs
-        ]
-        df = pd.DataFrame(data)
-        if df.empty:
-            return df
-        summary = df.groupby("room").agg({
-            "temperature": "mean",
-            "humidity": "mean",
-            "co2": "mean",
-            "state": lambda x: x.mode()[0] if not x.mode().empty else None,
-        }).reset_index()
-        return summary
+        return self.generate_batches([logs])
+
+    def generate_batches(self, batches):
+        """
+        Generate the summary batch by batch, folding each batch into running per-room totals.
+
+        Args:
+            batches (iterable): LogStore batches (see LogReader.iter_batches).
+        Returns:
+            pd.DataFrame: Tabular summary by room.
+        """
+        aggregator = StateByRoomAggregator()
+        for batch in batches:
+            aggregator.add_batch(batch)
+        return aggregator.to_frame()
+
+
+class _RoomTotals:
+    """
+    Running count, metric sums and state frequencies of one room.
+    """
+    __slots__ = ("count", "temperature", "humidity", "co2", "states")
+
+    def __init__(self):
+        self.count = 0
+        self.temperature = 0.0
+        self.humidity = 0.0
+        self.co2 = 0.0
+        self.states = {}
+
+
+class StateByRoomAggregator:
+    """
+    Incrementally maintained state-by-room summary.
+    Keeps running sums and counts of temperature, humidity and CO2 plus state frequencies
+    per room, so adding a log is O(1) and producing the report is O(rooms).
+    """
+    def __init__(self):
+        """
+        Initialize an empty aggregator.
+        """
+        self._rooms = {}
+        self._lock = threading.Lock()
+
+    def add_log(self, log):
+        """
+        Fold one log into the running totals.
+
+        Args:
+            log (Log): The log entry to add.
+        """
+        with self._lock:
+            totals = self._rooms.get(log.sala)
+            if totals is None:
+                totals = self._rooms[log.sala] = _RoomTotals()
+            totals.count += 1
+            totals.temperature += log.temperatura
+            totals.humidity += log.humedad
+            totals.co2 += log.co2
+            totals.states[log.estado] = totals.states.get(log.estado, 0) + 1
+
+    def add_batch(self, logs):
+        """
+        Fold a batch of logs into the running totals with one vectorized pass.
+
+        Args:
+            logs (LogStore or list): Logs to add.
+        """
+        store = as_store(logs)
+        if not len(store):
+            return
+        rooms, states = store.rooms, store.states
+        room_codes = store.sala_codes
+        counts = np.bincount(room_codes, minlength=len(rooms))
+        # pandas sums with compensated (Kahan) summation, like the DataFrame mean it replaces
+        sums = pd.DataFrame({
+            "temperature": store.temperatura,
+            "humidity": store.humedad,
+            "co2": store.co2,
+        }).groupby(room_codes).sum().reindex(range(len(rooms)), fill_value=0.0)
+        pair_counts = np.bincount(
+            room_codes.astype(np.int64) * len(states) + store.estado_codes,
+            minlength=len(rooms) * len(states),
+        ).reshape(len(rooms), len(states))
+        with self._lock:
+            for code in np.flatnonzero(counts):
+                totals = self._rooms.get(rooms[code])
+                if totals is None:
+                    totals = self._rooms[rooms[code]] = _RoomTotals()
+                totals.count += int(counts[code])
+                totals.temperature += float(sums.at[code, "temperature"])
+                totals.humidity += float(sums.at[code, "humidity"])
+                totals.co2 += float(sums.at[code, "co2"])
+                for state_code in np.flatnonzero(pair_counts[code]):
+                    state = states[state_code]
+                    totals.states[state] = totals.states.get(state, 0) + int(pair_counts[code, state_code])
+
+    def to_frame(self):
+        """
+        Build the state-by-room report from the running totals.
+
+        Returns:
+            pd.DataFrame: Tabular summary by room, same shape as StateByRoomStrategy.generate.
+        """
+        with self._lock:
+            rooms = sorted(self._rooms.items())
+            if not rooms:
+                return pd.DataFrame()
+            return pd.DataFrame({
+                "room": [room for room, _ in rooms],
+                "temperature": [totals.temperature / totals.count for _, totals in rooms],
+                "humidity": [totals.humidity / totals.count for _, totals in rooms],
+                "co2": [totals.co2 / totals.count for _, totals in rooms],
+                # Ties go to the smallest state name, like Series.mode()
+                "state": [min(totals.states.items(), key=lambda item: (-item[1], item[0]))[0] for _, totals in rooms],
+            })
 
 class StateByRoomReport(Report):
     """
@@ -56,8 +154,19 @@ class StateByRoomReport(Report):
         Generate the report using the assigned strategy.
 
         Args:
-            logs (list): List of Log objects to process.
+            logs (LogStore or list): Logs to process.
         Returns:
             pd.DataFrame: The generated report as a DataFrame.
         """
         return self.strategy.generate(logs)
+
+    def generate_batches(self, batches):
+        """
+        Generate the report batch by batch using the assigned strategy.
+
+        Args:
+            batches (iterable): LogStore batches (see LogReader.iter_batches).
+        Returns:
+            pd.DataFrame: The generated report as a DataFrame.
+        """
+        return self.strategy.generate_batches(batches)
@@ -0,0 +1,336 @@
+import numpy as np
+
+# Bucket levels from coarsest to finest, with their NumPy datetime unit
+LEVELS = (("day", "D"), ("hour", "h"), ("minute", "m"))
+
+# Units of the next finer level in one bucket of a level (minutes per hour, hours per day)
+_FINER_UNITS = {"hour": 60, "day": 24}
+
+# Report metric names and the LogStore columns they are read from
+METRICS = {"temperature": "temperatura", "humidity": "humedad", "co2": "co2"}
+
+# Buckets are keyed by bucket number * ROOM_SLOTS + room code, so keys sort by time, then room
+ROOM_SLOTS = 1 << 20
+
+# How each kind of bucket column is combined; columns are named ("count",),
+# ("sum" | "min" | "max", metric) and ("state", state code)
+_COMBINE = {"count": np.add, "sum": np.add, "min": np.minimum, "max": np.maximum, "state": np.add}
+
+_MICROSECOND = np.timedelta64(1, "us")
+# Log timestamps have one-second resolution (see LogReader.TIMESTAMP_FORMATS)
+_SECOND = np.timedelta64(1, "s")
+
+
+class _Bucket:
+    """
+    Count, sum, minimum and maximum of each metric plus state frequencies over a span of time.
+    Accumulates the buckets and raw rows read by one aggregate call.
+    """
+    __slots__ = ("count", "sums", "mins", "maxs", "states")
+
+    def __init__(self):
+        self.count = 0
+        self.sums = self.mins = self.maxs = None
+        self.states = {}
+
+    def add_rows(self, store, ids):
+        """
+        Fold raw rows of a store into this bucket.
+
+        Args:
+            store (LogStore): The logs.
+            ids (np.ndarray): Row positions to add.
+        """
+        if not len(ids):
+            return
+        values = np.column_stack([getattr(store, column)[ids] for column in METRICS.values()])
+        self._fold(len(ids), values.sum(axis=0), values.min(axis=0), values.max(axis=0))
+        states, counts = np.unique(store.estado(ids), return_counts=True)
+        self._count_states(states, counts)
+
+    def add_buckets(self, columns, rows, states):
+        """
+        Fold buckets of a level into this bucket.
+
+        Args:
+            columns (dict): The level's bucket columns (see _Level.columns).
+            rows (np.ndarray): Positions of the buckets to add.
+            states (list): State names, indexed by state code.
+        """
+        if not len(rows):
+            return
+        stats = {
+            kind: np.array([_COMBINE[kind].reduce(columns[(kind, metric)][rows]) for metric in METRICS])
+            for kind in ("sum", "min", "max")
+        }
+        self._fold(int(columns[("count",)][rows].sum()), stats["sum"], stats["min"], stats["max"])
+        codes = [name[1] for name in columns if name[0] == "state"]
+        self._count_states([states[code] for code in codes], [columns[("state", code)][rows].sum() for code in codes])
+
+    def _fold(self, count, sums, mins, maxs):
+        """
+        Combine per-metric count, sums, minima and maxima with the bucket's own.
+        """
+        if not self.count:
+            self.sums, self.mins, self.maxs = sums.copy(), mins.copy(), maxs.copy()
+        else:
+            self.sums += sums
+            np.minimum(self.mins, mins, out=self.mins)
+            np.maximum(self.maxs, maxs, out=self.maxs)
+        self.count += count
+
+    def _count_states(self, states, counts):
+        for state, count in zip(states, counts):
+            if count:
+                self.states[state] = self.states.get(state, 0) + int(count)
+
+    def to_dict(self):
+        """
+        Describe the bucket for API responses.
+
+        Returns:
+            dict: Count, mean/min/max of each metric (None when empty) and state frequencies.
+        """
+        result = {"count": self.count}
+        for i, metric in enumerate(METRICS):
+            if self.count:
+                result[metric] = {
+                    "mean": float(self.sums[i] / self.count),
+                    "min": float(self.mins[i]),
+                    "max": float(self.maxs[i]),
+                }
+            else:
+                result[metric] = {"mean": None, "min": None, "max": None}
+        result["states"] = dict(sorted(self.states.items()))
+        return result
+
+
+class _Level:
+    """
+    Buckets of one level stored as columns, one row per bucket, sorted by key (see ROOM_SLOTS).
+    Columns keep spare capacity, so buckets of new minutes, which sort last, are appended
+    without copying the level; late buckets are inserted with one copy and no re-sort.
+    """
+    def __init__(self):
+        self.size = 0
+        self._keys = np.empty(0, dtype=np.int64)
+        self._columns = {}
+
+    @property
+    def keys(self):
+        """
+        Sorted bucket keys.
+        """
+        return self._keys[:self.size]
+
+    @property
+    def columns(self):
+        """
+        The filled part of each bucket column.
+        """
+        return {name: column[:self.size] for name, column in self._columns.items()}
+
+    def merge(self, keys, columns):
+        """
+        Fold aggregated buckets into the level.
+
+        Args:
+            keys (np.ndarray): Unique, sorted keys of the buckets to add.
+            columns (dict): Their bucket columns.
+        """
+        for name, values in columns.items():
+            if name not in self._columns:
+                # A state seen for the first time: no earlier bucket counted it
+                self._columns[name] = np.zeros(len(self._keys), dtype=values.dtype)
+        current = self.keys
+        positions = np.searchsorted(current, keys)
+        found = positions < self.size
+        found[found] = current[positions[found]] == keys[found]
+        hits = positions[found]
+        for name, values in columns.items():
+            column = self._columns[name]
+            column[hits] = _COMBINE[name[0]](column[hits], values[found])
+        new = ~found
+        if not new.any():
+            return
+        added = {name: columns[name][new] if name in columns else 0 for name in self._columns}
+        if not self.size or keys[new][0] > current[-1]:
+            self._append(keys[new], added)
+        else:
+            at = positions[new]
+            self._keys = np.insert(current, at, keys[new])
+            self._columns = {name: np.insert(column[:self.size], at, added[name]) for name, column in self._columns.items()}
+            self.size = len(self._keys)
+
+    def _append(self, keys, added):
+        end = self.size + len(keys)
+        if end > len(self._keys):
+            capacity = max(end, 2 * len(self._keys), 1024)
+            self._keys = _grow(self._keys, self.size, capacity)
+            self._columns = {name: _grow(column, self.size, capacity) for name, column in self._columns.items()}
+        self._keys[self.size:end] = keys
+        for name, column in self._columns.items():
+            column[self.size:end] = added[name]
+        self.size = end
+
+
+class Rollups:
+    """
+    Pre-aggregated minute, hour and day buckets per room.
+    Each bucket holds count, sum, min and max of every metric plus state frequencies, so
+    a range aggregate touches a few buckets per level instead of every row in the range.
+    Each level is a set of sorted columns (see _Level) and batches are merged into them
+    with vectorized operations. Batches may arrive in any order; late rows update the
+    buckets they belong to.
+    """
+    def __init__(self):
+        """
+        Initialize empty rollups.
+        """
+        self._levels = {level: _Level() for level, _ in LEVELS}
+        self._room_codes = {}
+        self._state_codes = {}
+        self._states = []
+
+    def add_batch(self, store):
+        """
+        Fold a batch of logs into the buckets of every level.
+
+        The rows are reduced to minute buckets, and hour and day buckets are reduced
+        from the batch's minute and hour buckets rather than from its rows.
+
+        Args:
+            store (LogStore): The logs to add.
+        """
+        if not len(store):
+            return
+        rooms = np.array([self._room_codes.setdefault(room, len(self._room_codes)) for room in store.rooms], dtype=np.int64)
+        states = np.array([self._state_codes.setdefault(state, len(self._state_codes)) for state in store.states], dtype=np.int64)
+        self._states = list(self._state_codes)
+        minutes = store.timestamp.astype("datetime64[m]").astype(np.int64)
+        columns = {("count",): np.ones(len(store), dtype=np.int64)}
+        for metric, column in METRICS.items():
+            columns[("sum", metric)] = columns[("min", metric)] = columns[("max", metric)] = getattr(store, column)
+        state_codes = states[store.estado_codes]
+        for code in np.unique(state_codes):
+            columns[("state", int(code))] = state_codes == code
+        keys, columns = _reduce(minutes * ROOM_SLOTS + rooms[store.sala_codes], columns)
+        for level, _ in reversed(LEVELS):
+            if level in _FINER_UNITS:
+                buckets, room_codes = np.divmod(keys, ROOM_SLOTS)
+                keys, columns = _reduce(buckets // _FINER_UNITS[level] * ROOM_SLOTS + room_codes, columns)
+            self._levels[level].merge(keys, columns)
+
+    def bucket_count(self, level):
+        """
+        Return the number of buckets kept at a level.
+
+        Args:
+            level (str): "day", "hour" or "minute".
+        Returns:
+            int: Number of (room, bucket) entries.
+        """
+        return self._levels[level].size
+
+    def aggregate(self, room, start, end, store=None):
+        """
+        Aggregate the metrics of a room over an inclusive time range.
+
+        The range is covered with whole day buckets, then hour and minute buckets for
+        the parts that do not fill a day or an hour. Rows in the partial minutes at the
+        edges are read from store when given and left out otherwise. Each level is
+        binary searched for the range, so time without buckets costs nothing.
+
+        Args:
+            room (str): Room name.
+            start (datetime): Inclusive start of the range.
+            end (datetime): Inclusive end of the range (the whole second is included).
+            store (LogStore, optional): Store the rollups were built from, for the edges.
+        Returns:
+            dict: Count, mean/min/max of each metric, state frequencies and the number of
+                buckets (and raw rows) read at each level.
+        """
+        total = _Bucket()
+        used = {level: 0 for level, _ in LEVELS}
+        used["raw"] = 0
+        code = self._room_codes.get(room)
+        start = np.datetime64(start, "us")
+        end = np.datetime64(end, "s").astype("datetime64[us]") + _SECOND
+        for level, lo, hi in _cover(start, end):
+            if level == "raw":
+                if store is not None and lo < hi:
+                    ids = store.query(room, lo, hi - _MICROSECOND)
+                    total.add_rows(store, ids)
+                    used["raw"] += len(ids)
+                continue
+            if code is None:
+                continue
+            buckets = self._levels[level]
+            keys = buckets.keys
+            first, last = np.searchsorted(keys, [lo * ROOM_SLOTS, hi * ROOM_SLOTS])
+            rows = first + np.flatnonzero(keys[first:last] % ROOM_SLOTS == code)
+            total.add_buckets(buckets.columns, rows, self._states)
+            used[level] += len(rows)
+        result = total.to_dict()
+        result["buckets"] = used
+        return result
+
+
+def _reduce(keys, columns):
+    """
+    Combine the rows of bucket columns that share a key.
+
+    Args:
+        keys (np.ndarray): Key of each row, in any order.
+        columns (dict): Bucket columns (see _COMBINE), one value per row.
+    Returns:
+        tuple: (unique sorted keys, dict of combined columns).
+    """
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(keys)) + 1])
+    combined = {}
+    for name, values in columns.items():
+        # Boolean state flags are summed as counts
+        dtype = np.int64 if name[0] == "state" else None
+        combined[name] = _COMBINE[name[0]].reduceat(values[order], starts, dtype=dtype)
+    return keys[starts], combined
+
+
+def _grow(column, size, capacity):
+    """
+    Copy the first size values of a column into a zero-filled array of the given capacity.
+    """
+    grown = np.zeros(capacity, dtype=column.dtype)
+    grown[:size] = column[:size]
+    return grown
+
+
+def _cover(start, end, depth=0):
+    """
+    Split the half-open range [start, end) into whole buckets, coarsest level first.
+
+    Args:
+        start (np.datetime64): Inclusive start.
+        end (np.datetime64): Exclusive end.
+        depth (int): Index in LEVELS of the level to try.
+    Returns:
+        list: (level, first bucket, end bucket) tuples, plus ("raw", start, end) tuples
+            for the parts finer than a minute.
+    """
+    if start >= end:
+        return []
+    if depth == len(LEVELS):
+        return [("raw", start, end)]
+    level, unit = LEVELS[depth]
+    first = start.astype(f"datetime64[{unit}]")
+    if first < start:
+        first += np.timedelta64(1, unit)
+    last = end.astype(f"datetime64[{unit}]")
+    if first >= last:
+        return _cover(start, end, depth + 1)
+    return (
+        _cover(start, first.astype("datetime64[us]"), depth + 1)
+        + [(level, int(first.astype(np.int64)), int(last.astype(np.int64)))]
+        + _cover(last.astype("datetime64[us]"), end, depth + 1)
+    )
@@ -1,23 +1,142 @@
+import numpy as np
+import pandas as pd
+
+
 class Room:
     """
     Represents a monitored room or area in the EcoWatch system.
-    Each Room can have multiple logs and is identified by its name.
+    Each Room is identified by its name and interned with a small integer code (see
+    RoomRegistry). Its segment holds the timestamps and row positions of its logs in
+    the LogStore, sorted by timestamp, so per-room lookups never scan other rooms.
     """
-    def __init__(self, name):
+    def __init__(self, name, code):
         """
         Initialize a Room instance.
 
         Args:
             name (str): The name or identifier of the room.
+            code (int): The integer code stored in place of the name.
         """
         self.name = name
-        self.logs = []
+        self.code = code
+        # (timestamps, row positions) columns, maintained by the LogStore
+        self.segment = None
+
+    def __len__(self):
+        return 0 if self.segment is None else len(self.segment[1].view())
+
+    def describe(self):
+        """
+        Summarize the room from its segment in constant time.
+
+        Returns:
+            dict: Name, row count and first/last timestamps (None without rows).
+        """
+        segment = self.segment
+        timestamps = segment[0].view() if segment is not None else ()
+        return {
+            "room": self.name,
+            "rows": len(timestamps),
+            "first": timestamps[0].item() if len(timestamps) else None,
+            "last": timestamps[-1].item() if len(timestamps) else None,
+        }
+
+
+class RoomRegistry:
+    """
+    Interns room names as Room objects with consecutive integer codes.
+    Rows store the code, so room filters and group-bys compare integers or go
+    straight to the room's segment instead of comparing strings.
+    """
+    def __init__(self, names=()):
+        """
+        Initialize the registry.
+
+        Args:
+            names (iterable, optional): Room names to register, in code order.
+        """
+        self._rooms = []
+        self._names = []
+        self._codes = {}
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name):
+        """
+        Return the code of a room, registering it if unseen.
+
+        Args:
+            name (str): The room name.
+        Returns:
+            int: The room code.
+        """
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self._rooms)
+            self._rooms.append(Room(name, code))
+            self._names.append(name)
+        return code
 
-    def add_log(self, log):
+    def encode(self, names):
         """
-        Add a log entry to the room.
+        Map room names to codes, registering unseen rooms.
 
         Args:
-            log (Log): The log entry to add.
+            names (pd.Series or array-like): The names to encode.
+        Returns:
+            np.ndarray: The code of each name.
         """
-        self.logs.append(log)
+        local_codes, uniques = pd.factorize(names)
+        mapping = np.array([self.intern(name) for name in uniques], dtype=np.int32)
+        return mapping[local_codes]
+
+    def code(self, name):
+        """
+        Look up the code of a room.
+
+        Args:
+            name (str): The room name.
+        Returns:
+            int or None: The code, or None if the room is unknown.
+        """
+        return self._codes.get(name)
+
+    def get(self, name):
+        """
+        Look up a room by name.
+
+        Args:
+            name (str): The room name.
+        Returns:
+            Room or None: The room, or None if it is unknown.
+        """
+        code = self._codes.get(name)
+        return None if code is None else self._rooms[code]
+
+    @property
+    def names(self):
+        """
+        Room names, indexed by code.
+        """
+        return tuple(self._names)
+
+    def copy(self):
+        """
+        Return a registry with the same codes and new Room objects sharing the current segments.
+
+        Returns:
+            RoomRegistry: The copy.
+        """
+        registry = RoomRegistry(self._names)
+        for room, source in zip(registry, self._rooms):
+            room.segment = source.segment
+        return registry
+
+    def __getitem__(self, code):
+        return self._rooms[code]
+
+    def __len__(self):
+        return len(self._rooms)
+
+    def __iter__(self):
+        return iter(self._rooms)
@@ -0,0 +1,188 @@
+import argparse
+import os
+import re
+import shutil
+import threading
+import time
+from src.log_reader import LogReader
+from src.log_store import LogStore
+
+_GENERATION_DIR = re.compile(r"^gen-(\d+)$")
+
+
+class SharedDataset:
+    """
+    Columnar dataset shared by several API worker processes through memory-mapped files.
+    A loader process publishes each complete dataset as a numbered generation (a LogStore
+    snapshot directory) and then points the CURRENT file at it. Workers attach read-only:
+    the columns and the time index are memory-mapped, so the page cache holds one copy of
+    them however many workers map them. Workers poll CURRENT and swap to newer generations.
+    """
+    CURRENT = "CURRENT"
+
+    def __init__(self, directory, keep=2):
+        """
+        Initialize the shared dataset.
+
+        Args:
+            directory (str): Directory holding the generations and the CURRENT file.
+            keep (int): Generations kept on disk when publishing; older ones are removed.
+                Workers still mapping a removed generation keep their mapping (POSIX).
+        """
+        self.directory = directory
+        self.keep = keep
+        self.generation = None
+        self.on_reload = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def current_generation(self):
+        """
+        Return the generation CURRENT points to.
+
+        Returns:
+            int or None: The published generation, or None if nothing was published yet.
+        """
+        try:
+            with open(os.path.join(self.directory, self.CURRENT), encoding="utf-8") as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def publish(self, store, source=None):
+        """
+        Write a store as a new generation and make it current.
+
+        The generation is fully written before CURRENT is replaced, so workers never
+        see a partial dataset.
+
+        Args:
+            store (LogStore): The complete set of valid logs.
+            source (dict, optional): Description of the source files, stored in the manifest.
+        Returns:
+            int: The published generation.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        generation = max(self._generations() + [self.current_generation() or 0]) + 1
+        store.save(self._path(generation), source=source)
+        partial = os.path.join(self.directory, f"{self.CURRENT}.{os.getpid()}.part")
+        with open(partial, "w", encoding="utf-8") as f:
+            f.write(str(generation))
+        os.replace(partial, os.path.join(self.directory, self.CURRENT))
+        self.generation = generation
+        for old in self._generations()[:-self.keep]:
+            shutil.rmtree(self._path(old), ignore_errors=True)
+        return generation
+
+    def attach(self):
+        """
+        Map the current generation read-only.
+
+        Returns:
+            LogStore or None: The dataset, or None if nothing was published yet or the
+                generation was removed before it could be mapped.
+        """
+        generation = self.current_generation()
+        if generation is None:
+            return None
+        try:
+            store = LogStore.load(self._path(generation))
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Failed to attach generation {generation} of {self.directory}: {e}")
+            return None
+        self.generation = generation
+        return store
+
+    def poll(self):
+        """
+        Swap to a newer generation if one was published, passing it to on_reload.
+
+        Returns:
+            bool: True if a new generation was attached.
+        """
+        current = self.current_generation()
+        if current is None or current == self.generation:
+            return False
+        store = self.attach()
+        if store is None:
+            return False
+        if self.on_reload:
+            self.on_reload(store)
+        return True
+
+    def start(self, interval, on_reload):
+        """
+        Poll for new generations every interval seconds in a background thread.
+
+        Args:
+            interval (float): Seconds between polls.
+            on_reload (callable): Called with the LogStore of each newly attached generation.
+        """
+        if self._thread is not None:
+            return
+        self.on_reload = on_reload
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="ecowatch-shared", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the background polling thread.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self, interval):
+        while not self._stop.wait(interval):
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"[WARN] Failed to refresh {self.directory}: {e}")
+
+    def _generations(self):
+        """
+        Return the generations present on disk, oldest first.
+        """
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(int(match.group(1)) for match in map(_GENERATION_DIR.match, names) if match)
+
+    def _path(self, generation):
+        return os.path.join(self.directory, f"gen-{generation}")
+
+
+def main():
+    """
+    Loader entry point: read the logs once and publish them as a generation of a shared dataset.
+    With --follow, keep checking the source files and publish a new generation whenever they change.
+    """
+    parser = argparse.ArgumentParser(description="Load the EcoWatch logs once and publish them for the API workers.")
+    parser.add_argument("source", help="CSV file, directory of CSV shards or glob pattern")
+    parser.add_argument("directory", help="shared dataset directory (SHARED_DATASET_DIR of the API)")
+    parser.add_argument("--follow", type=float, default=0,
+                        help="check the source every N seconds and publish a new generation when it changes")
+    parser.add_argument("--keep", type=int, default=2, help="generations kept on disk")
+    args = parser.parse_args()
+
+    reader = LogReader(args.source)
+    shared = SharedDataset(args.directory, keep=args.keep)
+    published = None
+    while True:
+        # Described before reading, so files modified meanwhile are picked up on the next check
+        source = reader.source_info()
+        if source != published:
+            store = reader.read_store()
+            print(f"published generation {shared.publish(store, source=source)} ({len(store)} logs)")
+            published = source
+        if args.follow <= 0:
+            break
+        time.sleep(args.follow)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import asyncio
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class WorkerPool:
+    """
+    Runs heavy work off the request path: a bounded thread pool for report generation
+    and DataFrame work, and a process pool for CPU-bound serialization (XLSX) that
+    would otherwise hold the GIL and slow down every other request.
+    Pools are started on first use; with processes=0 CPU-bound work runs on the
+    thread pool instead.
+    """
+    def __init__(self, threads=4, processes=2):
+        """
+        Initialize the pools.
+
+        Args:
+            threads (int): Worker threads for report generation.
+            processes (int): Worker processes for CPU-bound serialization (0 disables them).
+        """
+        self.threads = threads
+        self.processes = processes
+        self._thread_pool = None
+        self._process_pool = None
+        self._lock = threading.Lock()
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run a function on the thread pool without blocking the event loop.
+
+        Args:
+            func (callable): The function to run.
+            *args, **kwargs: Its arguments.
+        Returns:
+            Any: The function's result.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor(), functools.partial(func, *args, **kwargs))
+
+    async def run_cpu(self, func, *args):
+        """
+        Run a CPU-bound function on the process pool without blocking the event loop.
+
+        Args:
+            func (callable): A module-level (picklable) function.
+            *args: Its (picklable) arguments.
+        Returns:
+            Any: The function's result.
+        """
+        return await asyncio.wrap_future(self.submit_cpu(func, *args))
+
+    def submit_cpu(self, func, *args):
+        """
+        Submit a CPU-bound function to the process pool, for callers outside the event loop.
+
+        Args:
+            func (callable): A module-level (picklable) function.
+            *args: Its (picklable) arguments.
+        Returns:
+            concurrent.futures.Future: The pending result.
+        """
+        return self._cpu_executor().submit(func, *args)
+
+    def shutdown(self):
+        """
+        Stop the pools after the work already submitted (they restart on next use).
+        """
+        with self._lock:
+            pools, self._thread_pool, self._process_pool = (self._thread_pool, self._process_pool), None, None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=True)
+
+    def _executor(self):
+        """
+        Return the thread pool, starting it if needed.
+        """
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="ecowatch-worker")
+            return self._thread_pool
+
+    def _cpu_executor(self):
+        """
+        Return the process pool, starting it if needed (the thread pool if processes=0).
+        """
+        if not self.processes:
+            return self._executor()
+        with self._lock:
+            if self._process_pool is None:
+                # Workers are spawned, not forked, since the API process runs many threads
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._process_pool
@@ -0,0 +1,41 @@
+from datetime import datetime
+import pytest
+from src.alert_rules import RuleSet, ThresholdRule
+from src.log import Log
+from src.log_store import LogStore
+from src.reports_critical_alerts import CriticalAlertsStrategy
+
+def make_store():
+    return LogStore.from_logs([
+        Log(datetime(2024, 6, 1, 12, 0), "Lab", "OK", 26.0, 45.0, 400.0, "Warm lab"),
+        Log(datetime(2024, 6, 1, 12, 1), "Office", "OK", 26.0, 45.0, 400.0, "Warm office"),
+        Log(datetime(2024, 6, 1, 12, 2), "Office", "OK", 14.0, 45.0, 400.0, "Cold"),
+        Log(datetime(2024, 6, 1, 12, 3), "Office", "WARNING", 29.0, 75.0, 900.0, "Muggy"),
+        Log(datetime(2024, 6, 1, 12, 4), "Lab", "CRITICAL", 31.0, 85.0, 1200.0, "Everything high"),
+    ])
+
+def test_rule_set_per_room_bounds_and_priority():
+    rules = RuleSet.from_config([
+        {"name": "muggy", "all": [
+            {"metric": "temperature", "upper": 27},
+            {"metric": "humidity", "upper": 70},
+        ], "rooms": ["Office"]},
+        {"name": "temperature", "metric": "temperature", "lower": 15,
+         "upper": {"default": 28, "Lab": 25, "Unknown": 0}},
+    ])
+    ids, fired = rules.evaluate(make_store())
+    assert list(ids) == [0, 2, 3, 4]
+    assert list(fired) == ["temperature", "temperature", "muggy", "temperature"]
+
+def test_critical_alerts_tags_default_rules():
+    report = CriticalAlertsStrategy().generate(make_store())
+    assert list(report["message"]) == ["Everything high"]
+    assert list(report["rule"]) == ["high_temperature"]
+    custom = CriticalAlertsStrategy(RuleSet([ThresholdRule("co2", "co2", upper=850)]))
+    assert list(custom.generate(make_store())["message"]) == ["Muggy", "Everything high"]
+
+def test_invalid_rules_are_rejected():
+    with pytest.raises(ValueError):
+        ThresholdRule("bad", "pressure", upper=1)
+    with pytest.raises(ValueError):
+        RuleSet.from_config([{"name": "no_bounds", "metric": "co2"}])
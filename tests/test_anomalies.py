@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+from src.cache import TemporalCache
+from src.log import Log
+from src.log_store import LogStore
+from src.report_factory import ReportFactory
+from src.reports_anomalies import AnomalyDetector
+
+def make_logs(rows=300):
+    rng = np.random.default_rng(1)
+    start = datetime(2024, 6, 1, 12, 0)
+    logs = []
+    for i in range(rows):
+        room = f"Room{i % 3}"
+        temperature = 22.0 + rng.normal(0, 0.5) + (15.0 if i in (150, 151) else 0.0)
+        logs.append(Log(start + timedelta(seconds=i), room, "OK", temperature, 45.0 + rng.normal(0, 1), 400.0 + rng.normal(0, 20)))
+    return logs
+
+def test_batch_stream_and_split_batches_agree():
+    logs = make_logs()
+    report = ReportFactory()
+    report.register_default_reports()
+    batch = report.create_report("anomalies").generate(LogStore.from_logs(logs))
+    assert list(batch["timestamp"].dt.second[batch["metric"] == "temperature"]) == [30, 31]
+    streamed = AnomalyDetector()
+    for log in logs:
+        streamed.add_log(log)
+    split = AnomalyDetector()
+    split.add_batch(LogStore.from_logs(logs[:100]))
+    split.add_batch(LogStore.from_logs(logs[100:]))
+    pd.testing.assert_frame_equal(streamed.to_frame(), batch)
+    pd.testing.assert_frame_equal(split.to_frame(), batch)
+
+def test_detector_fed_by_temporal_cache_keeps_recent_anomalies():
+    detector = AnomalyDetector(max_anomalies=1)
+    cache = TemporalCache()
+    cache.add_listener(detector.add_log)
+    cache.add_logs(make_logs())
+    anomalies = detector.to_frame()
+    assert len(anomalies) == 1
+    assert list(anomalies.iloc[0][["room", "timestamp", "metric"]]) == ["Room1", datetime(2024, 6, 1, 12, 2, 31), "temperature"]
@@ -0,0 +1,211 @@
+import base64
+import io
+import json
+import time
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from src import api
+from src.export_jobs import ExportJobManager
+from src.ingest import IngestQueue
+from src.log_store import LogStore
+from src.shared_dataset import SharedDataset
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(api.app) as client:
+        assert api.dataset_ready.wait(10)
+        yield client
+
+QUERY = {"start_time_date": "2030-01-01 00:00:00", "end_time_date": "2030-01-01 01:00:00", "room": "Sala_Test"}
+
+def test_post_batch_validates_and_ingests(client):
+    payload = [
+        {"timestamp": "2030-01-01 00:00:00", "sala": "Sala_Test", "estado": "INFO", "temperatura": 21.0, "humedad": 40.0, "co2": 500},
+        {"timestamp": "2030-01-01T00:00:30", "sala": "Sala_Test", "estado": "INFO", "temperatura": 22.0, "humedad": 41.0, "co2": 510},
+        {"timestamp": "not a date", "sala": "Sala_Test", "estado": "INFO", "temperatura": 22.0, "humedad": 41.0, "co2": 510},
+    ]
+    response = client.post("/logs/batch", json=payload)
+    assert response.status_code == 202
+    assert response.json() == {"accepted": 2, "rejected": [2]}
+    csv_body = "timestamp,sala,estado,temperatura,humedad,co2\n2030-01-01 00:01:00,Sala_Test,WARNING,35.0,40.0,500\n"
+    response = client.post("/logs/batch", content=csv_body, headers={"Content-Type": "text/csv"})
+    assert response.json()["accepted"] == 1
+    api.ingest_queue.join()
+    assert len(client.get("/logs/query", params=QUERY).json()) == 3
+    assert len(api.temporal_cache.get_logs_by_room("Sala_Test")) == 3
+    alerts = client.get("/report/critical_alerts").json()
+    assert [alert["message"] for alert in alerts if alert["room"] == "Sala_Test"] == [None]
+
+def test_post_batch_backpressure(client, monkeypatch):
+    monkeypatch.setattr(api, "ingest_queue", IngestQueue(api.ingest_logs, maxsize=1))
+    reading = {"timestamp": "2030-01-02 00:00:00", "sala": "Sala_Full", "estado": "INFO", "temperatura": 21.0, "humedad": 40.0, "co2": 500}
+    assert client.post("/logs/batch", json=[reading]).status_code == 202
+    assert client.post("/logs/batch", json=[reading]).status_code == 429
+    assert client.post("/logs/batch", content="{", headers={"Content-Type": "application/json"}).status_code == 400
+
+def test_post_batch_is_rejected_on_a_shared_dataset(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(api, "shared_dataset", SharedDataset(str(tmp_path)))
+    reading = {"timestamp": "2030-01-03 00:00:00", "sala": "Sala_Shared", "estado": "INFO", "temperatura": 21.0, "humedad": 40.0, "co2": 500}
+    response = client.post("/logs/batch", json=[reading])
+    assert response.status_code == 409 and "error" in response.json()
+
+def test_reload_counts_discarded_pushed_readings(client, monkeypatch):
+    for name in ("log_store", "state_aggregator", "temporal_cache", "rollups", "anomaly_detector"):
+        monkeypatch.setattr(api, name, getattr(api, name))
+    monkeypatch.setattr(api, "pushed_rows", {"live": 0, "discarded": 0})
+    api.reload_logs(LogStore())
+    reading = {"timestamp": "2029-12-30 00:00:00", "sala": "Sala_Pushed", "estado": "INFO", "temperatura": 21.0, "humedad": 40.0, "co2": 500}
+    assert client.post("/logs/batch", json=[reading, reading]).status_code == 202
+    api.ingest_queue.join()
+    assert len(api.log_store) == 2
+    assert client.get("/health/ready").json()["pushed_rows_discarded"] == 0
+    api.reload_logs(LogStore())
+    assert client.get("/health/ready").json()["pushed_rows_discarded"] == 2
+    assert api.pushed_rows == {"live": 0, "discarded": 2}
+
+def test_export_jobs_are_cached_by_content(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(api, "export_jobs", ExportJobManager(str(tmp_path)))
+    job = client.post("/exports", params={"report": "critical_alerts", "format": "csv"}).json()
+    for _ in range(100):
+        status = client.get(f"/exports/{job['id']}").json()
+        if status["status"] == "done":
+            break
+        time.sleep(0.05)
+    assert status["status"] == "done"
+    download = client.get(f"/exports/{job['id']}/download")
+    assert download.status_code == 200
+    assert download.text == client.get("/report/critical_alerts/export").text
+    again = client.post("/exports", params={"report": "critical_alerts", "format": "csv"}).json()
+    assert again["cached"] and again["status"] == "done"
+    # After a restart versions start over, so the stored export must not be reused
+    monkeypatch.setattr(api, "export_jobs", ExportJobManager(str(tmp_path)))
+    assert not client.post("/exports", params={"report": "critical_alerts", "format": "csv"}).json()["cached"]
+    assert client.get("/exports/unknown").status_code == 404
+
+def test_export_job_uses_the_snapshot_it_was_submitted_for(client, monkeypatch, tmp_path):
+    writes = []
+    class DeferredJobs(ExportJobManager):
+        def submit(self, report_type, params, format, version, write):
+            writes.append(write)
+            return super().submit(report_type, params, format, version, lambda path: None)
+    monkeypatch.setattr(api, "export_jobs", DeferredJobs(str(tmp_path)))
+    client.post("/exports", params={"report": "state_by_room", "format": "csv"})
+    before = client.get("/report/state_by_room/export").text
+    reading = {"timestamp": "2029-12-31 00:00:00", "sala": "Sala_Late_Export", "estado": "INFO", "temperatura": 21.0, "humedad": 40.0, "co2": 500}
+    assert client.post("/logs/batch", json=[reading]).status_code == 202
+    api.ingest_queue.join()
+    # The job runs after the ingest but exports the version it was keyed by
+    writes[0](str(tmp_path / "export.csv"))
+    assert (tmp_path / "export.csv").read_text() == before
+    assert "Sala_Late_Export" not in before
+
+def test_health_endpoints(client):
+    assert client.get("/health/live").json() == {"status": "alive"}
+    ready = client.get("/health/ready")
+    assert ready.status_code == 200
+    assert ready.json()["rows"] > 0
+
+def test_aggregate_matches_raw_rows(client):
+    params = {"start_time_date": "2025-05-01 08:00:08", "end_time_date": "2025-05-01 09:59:59", "room": "Sala_1"}
+    rows = client.get("/logs/query", params=params).json()
+    result = client.get("/logs/aggregate", params=params).json()
+    assert result["count"] == len(rows) > 0
+    assert result["co2"]["max"] == max(row["co2"] for row in rows)
+    assert result["temperature"]["mean"] == pytest.approx(sum(row["temperatura"] for row in rows) / len(rows))
+    assert sum(result["states"].values()) == len(rows)
+    assert result["buckets"]["hour"] == 1 and result["buckets"]["raw"] > 0
+    assert "error" in client.get("/logs/aggregate", params={**params, "start_time_date": "yesterday"}).json()
+
+def test_rooms_lists_counts_and_bounds(client):
+    rooms = client.get("/rooms").json()
+    assert [room["room"] for room in rooms] == sorted(room["room"] for room in rooms)
+    assert sum(room["rows"] for room in rooms) == len(api.log_store)
+    sala_1 = next(room for room in rooms if room["room"] == "Sala_1")
+    rows = client.get("/logs/query", params={
+        "start_time_date": sala_1["first"].replace("T", " "), "end_time_date": sala_1["last"].replace("T", " "), "room": "Sala_1",
+    }).json()
+    assert len(rows) == sala_1["rows"]
+
+def test_message_stats(client):
+    stats = client.get("/logs/messages/stats").json()
+    assert stats["rows"] == len(api.log_store)
+    assert stats["templated"] > 0.9 * stats["rows"]
+    assert stats["memory_saved_bytes"] > 0
+
+def test_anomalies_report(client):
+    readings = [
+        {"timestamp": f"2030-02-01 00:{minute:02d}:00", "sala": "Sala_Spike", "estado": "INFO",
+         "temperatura": 21.0 + minute % 2 * 0.5 + (20.0 if minute == 40 else 0.0), "humedad": 40.0, "co2": 500}
+        for minute in range(41)
+    ]
+    # A later reading first, so the spike arrives too late for the TemporalCache; it is still scored
+    later = {**readings[0], "timestamp": "2030-06-01 00:00:00", "sala": "Sala_Later"}
+    assert client.post("/logs/batch", json=[later]).status_code == 202
+    api.ingest_queue.join()
+    dropped = api.temporal_cache.late_dropped
+    assert client.post("/logs/batch", json=readings).status_code == 202
+    api.ingest_queue.join()
+    assert api.temporal_cache.late_dropped == dropped + len(readings)
+    anomalies = [row for row in client.get("/report/anomalies").json() if row["room"] == "Sala_Spike"]
+    assert [(row["timestamp"], row["metric"]) for row in anomalies] == [("2030-02-01T00:40:00", "temperature")]
+    export = client.get("/report/anomalies/export").text
+    assert export.startswith("room,timestamp,metric,value,expected,zscore") and "Sala_Spike" in export
+
+def test_numeric_room_names_are_stored_as_strings(client):
+    reading = {"timestamp": "2030-03-01 00:00:00", "sala": 5, "estado": 1, "temperatura": 21.0, "humedad": 40.0, "co2": 500}
+    assert client.post("/logs/batch", json=[reading]).status_code == 202
+    csv = "timestamp,sala,estado,temperatura,humedad,co2\n2030-03-01 00:01:00,6,OK,21.0,40.0,500\n"
+    assert client.post("/logs/batch", content=csv, headers={"content-type": "text/csv"}).status_code == 202
+    api.ingest_queue.join()
+    rooms = [room["room"] for room in client.get("/rooms").json()]
+    assert "5" in rooms and "6" in rooms
+    summary = client.get("/report/state_by_room").json()
+    assert {"room": "5", "state": "1"}.items() <= next(row for row in summary if row["room"] == "5").items()
+
+def test_report_bundle(client):
+    bundle = client.get("/report/bundle", params={"reports": "state_by_room,critical_alerts"}).json()
+    assert list(bundle) == ["state_by_room", "critical_alerts"]
+    assert bundle["state_by_room"] == client.get("/report/state_by_room").json()
+    assert bundle["critical_alerts"] == client.get("/report/critical_alerts").json()
+    response = client.get("/report/bundle", params={"reports": "state_by_room,unknown"})
+    assert response.status_code == 400 and "unknown" in response.json()["error"]
+
+def test_metrics_endpoint(client):
+    client.get("/report/state_by_room")
+    text = client.get("/metrics").text
+    assert 'ecowatch_request_seconds_count{method="GET",path="/report/state_by_room",status="200"}' in text
+    assert 'stage="validation"' in text
+    assert "ecowatch_report_cache_hit_ratio" in text
+
+def test_cursor_pagination_and_ndjson(client):
+    params = {"start_time_date": "2025-05-01 08:00:00", "end_time_date": "2025-05-01 12:00:00", "room": "Sala_2"}
+    everything = client.get("/logs/query", params=params).json()
+    pages, cursor = [], None
+    while True:
+        response = client.get("/logs/query", params={**params, "limit": 7, **({"cursor": cursor} if cursor else {})})
+        pages.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert pages == everything and len(everything) > 7
+    stream = client.get("/logs/query", params=params, headers={"Accept": "application/x-ndjson"})
+    assert stream.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in stream.text.splitlines()] == everything
+    first = client.get("/logs", params={"limit": 5})
+    second = client.get("/logs", params={"limit": 5, "cursor": first.headers["X-Next-Cursor"], "format": "ndjson"})
+    assert len(second.text.splitlines()) == 5
+    assert client.get("/logs", params={"cursor": "???"}).status_code == 400
+    for row in (-1, len(api.log_store) + 5):
+        forged = base64.urlsafe_b64encode(f"0:{row}".encode()).decode().rstrip("=")
+        assert client.get("/logs", params={"cursor": forged}).status_code == 400
+        assert client.get("/logs/query", params={**params, "cursor": forged}).status_code == 400
+
+def test_xlsx_export_runs_on_worker_process(client, monkeypatch, tmp_path):
+    monkeypatch.setitem(api.EXPORT_DIRS, "xlsx", str(tmp_path))
+    response = client.get("/report/state_by_room/export", params={"format": "xlsx"})
+    assert response.status_code == 200
+    saved = tmp_path / "state_by_room_report.xlsx"
+    assert saved.read_bytes() == response.content
+    exported = pd.read_excel(io.BytesIO(response.content))
+    assert len(exported) == len(client.get("/report/state_by_room").json())
@@ -0,0 +1,71 @@
+import threading
+import time
+from datetime import datetime
+from src.cache import ReportCache, TemporalCache
+from src.log import Log
+
+def test_report_cache_hits_evicts_and_invalidates():
+    cache = ReportCache(maxsize=2)
+    calls = []
+    def compute(name):
+        return lambda: calls.append(name) or name
+
+    assert cache.get_or_compute("a", {}, 1, compute("a")) == "a"
+    assert cache.get_or_compute("a", {}, 1, compute("a")) == "a"
+    assert calls == ["a"]
+    cache.get_or_compute("b", {}, 1, compute("b"))
+    cache.get_or_compute("c", {"limit": 5}, 1, compute("c"))
+    cache.get_or_compute("a", {}, 1, compute("a"))
+    assert calls == ["a", "b", "c", "a"]
+    # A new dataset version invalidates every cached report
+    cache.get_or_compute("c", {"limit": 5}, 2, compute("c"))
+    assert calls[-1] == "c"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 5, 1)
+    # A late request for an older version neither evicts nor replaces the newer entries
+    assert cache.get_or_compute("c", {"limit": 5}, 1, compute("old")) == "old"
+    assert cache.get_or_compute("c", {"limit": 5}, 2, compute("c")) == "c"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 6, 1)
+
+def test_report_cache_coalesces_concurrent_misses():
+    cache = ReportCache()
+    calls = []
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return "report"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("a", {}, 1, compute)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["report"] * 4
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats["misses"], stats["coalesced"]) == (1, 3)
+
+def make_log(minute, second=0, sala="Room1"):
+    return Log(datetime(2024, 6, 1, 12, minute, second), sala, "OK", 22.0, 45.0, 400.0)
+
+def test_temporal_cache_uses_event_time_and_orders_late_logs():
+    cache = TemporalCache(window_minutes=5, allowed_lateness_seconds=60)
+    for minute in (0, 2, 1, 4):
+        assert cache.add_log(make_log(minute, sala="Room1"))
+    cache.add_log(make_log(3, sala="Room2"))
+    # Historical data is kept even though it is far older than the wall clock
+    assert len(cache) == 5
+    assert [log.timestamp.minute for log in cache.get_logs_by_room("Room1")] == [0, 1, 2, 4]
+    assert [log.sala for log in cache.get_logs_by_timestamp(datetime(2024, 6, 1, 12, 3))] == ["Room2"]
+    # Watermark reaches 12:07, so everything before 12:02 expires
+    cache.add_log(make_log(8, sala="Room2"))
+    assert [log.timestamp.minute for log in cache.get_logs_by_room("Room1")] == [2, 4]
+    assert cache.get_logs_by_timestamp(datetime(2024, 6, 1, 12, 1)) == []
+    # Too late for the window: dropped
+    assert not cache.add_log(make_log(1, sala="Room1"))
+    assert cache.late_dropped == 1
@@ -0,0 +1,61 @@
+import os
+import tempfile
+from src.log_follower import LogFollower
+from src.log_reader import LogReader
+
+HEADER = "timestamp,sala,estado,temperatura,humedad,co2,mensaje\n"
+
+def row(minute, sala="Room1"):
+    return f"2024-06-01 12:{minute:02d}:00,{sala},OK,22.5,45.0,400,All good\n"
+
+def test_follower_reads_appends_and_reloads_rotated_file():
+    path = os.path.join(tempfile.mkdtemp(), "logs.csv")
+    with open(path, "w") as f:
+        f.write(HEADER + row(0) + row(1))
+    appended, reloaded = [], []
+    follower = LogFollower(LogReader(path), on_append=appended.append, on_reload=reloaded.append)
+    assert len(follower.load()) == 2
+    assert follower.poll() == 0
+
+    # Only complete lines are consumed
+    with open(path, "a") as f:
+        f.write(row(2) + row(3)[:10])
+    assert follower.poll() == 1
+    with open(path, "a") as f:
+        f.write(row(3)[10:])
+    assert follower.poll() == 1
+    assert [store[0].timestamp.minute for store in appended] == [2, 3]
+
+    # A replaced file is reloaded in full
+    os.remove(path)
+    with open(path, "w") as f:
+        f.write(HEADER + row(5, "Room2"))
+    assert follower.poll() == 1
+    assert reloaded[-1][0].sala == "Room2"
+    with open(path, "w") as f:
+        f.write(HEADER)
+    assert follower.poll() == 0
+    assert len(reloaded) == 2
+
+def test_follower_waits_for_the_rest_of_a_partial_last_line():
+    path = os.path.join(tempfile.mkdtemp(), "logs.csv")
+    full = "2024-06-01 12:01:00,Room1,OK,22.5,45.0,1066,All good\n"
+    cut = full.index("45.0,10") + len("45.0,10")
+    with open(path, "w") as f:
+        f.write(HEADER + row(0) + full[:cut])
+    appended, reloaded = [], []
+    follower = LogFollower(LogReader(path), on_append=appended.append, on_reload=reloaded.append)
+    assert len(follower.load()) == 1
+    with open(path, "a") as f:
+        f.write(full[cut:])
+    assert follower.poll() == 1
+    assert appended[0][0].co2 == 1066.0
+
+    # The same holds when a rewritten file is reloaded
+    with open(path, "w") as f:
+        f.write(HEADER + row(5, "Room2") + full[:cut])
+    assert follower.poll() == 1
+    with open(path, "a") as f:
+        f.write(full[cut:])
+    assert follower.poll() == 1
+    assert len(reloaded) == 1 and appended[-1][0].co2 == 1066.0
@@ -2,6 +2,8 @@ import pytest
 import pandas as pd
 from src.log_reader import LogReader
 from src.log import Log
+from src.log_store import LogStore
+from src.reports_state_by_room import StateByRoomStrategy
 import tempfile
 
 # Helper to create a temporary CSV file
@@ -32,3 +34,101 @@ def test_read_invalid_logs():
     logs = reader.read_logs()
     # Both rows are invalid: one missing co2, one missing timestamp
     assert len(logs) == 0
+
+def test_vectorized_matches_row_by_row():
+    csv_content = """timestamp,sala,estado,temperatura,humedad,co2,mensaje
+2024-06-01 12:00:00,Room1,OK,22.5,45.0,400,All good
+2024-06-01T12:01:00,Room2,WARNING,23.0,50.0,420,
+2024-6-1 12:02:00,Room1,OK,22.0,44.0,410,Unpadded date
+2024/06/01 12:03:00,Room1,OK,22.0,44.0,410,Bad format
+2024-06-01 12:04:00,Room2,OK,abc,50.0,420,Bad number
+2024-06-01 12:05:00,,OK,23.0,50.0,420,Missing room
+2024-06-01 12:06:00,Room3,CRITICAL,35.5,85.0,1200,Too hot
+"""
+    path = create_temp_csv(csv_content)
+    reader = LogReader(path)
+    expected = reader.read_logs()
+    actual = reader.read_logs(vectorized=True)
+    assert len(actual) == len(expected) == 4
+    for exp, act in zip(expected, actual):
+        assert type(act.timestamp) is type(exp.timestamp)
+        assert act.timestamp == exp.timestamp
+        for field in ("sala", "estado", "temperatura", "humedad", "co2"):
+            assert getattr(act, field) == getattr(exp, field)
+        assert str(act.mensaje) == str(exp.mensaje)
+    _, rejected = reader.read_frame()
+    assert list(rejected) == [3, 4, 5]
+
+def test_iter_batches_matches_full_read():
+    csv_content = """timestamp,sala,estado,temperatura,humedad,co2,mensaje
+2024-06-01 12:00:00,Room1,OK,22.5,45.0,400,All good
+2024-06-01 12:01:00,Room2,OK,31.0,50.0,420,Hot
+,Room2,OK,23.0,50.0,420,Missing timestamp
+2024-06-01 12:03:00,Room1,WARNING,23.0,85.0,1100,Humid
+2024-06-01 12:04:00,Room3,OK,21.0,40.0,380,All good
+"""
+    reader = LogReader(create_temp_csv(csv_content))
+    batches = list(reader.iter_batches(chunk_size=2))
+    assert [len(batch) for batch in batches] == [2, 1, 1]
+    store = LogStore.from_batches(batches)
+    assert [log.__dict__ for log in store] == [log.__dict__ for log in reader.read_logs()]
+    pd.testing.assert_frame_equal(
+        StateByRoomStrategy().generate_batches(reader.iter_batches(chunk_size=2)),
+        StateByRoomStrategy().generate(store),
+    )
+
+def test_snapshot_round_trip_and_rebuild():
+    csv_content = """timestamp,sala,estado,temperatura,humedad,co2,mensaje
+2024-06-01 12:00:00,Room1,OK,22.5,45.0,400,All good
+2024-06-01 12:01:00,Room2,OK,31.0,50.0,420,
+2024-06-01 12:02:00,Room1,WARNING,23.0,85.0,1100,Humid
+"""
+    path = create_temp_csv(csv_content)
+    snapshot_dir = tempfile.mkdtemp() + "/snapshot"
+    reader = LogReader(path)
+    assert reader.read_snapshot(snapshot_dir) is None
+    built = reader.read_store(snapshot_dir=snapshot_dir)
+    loaded = reader.read_snapshot(snapshot_dir)
+    assert loaded is not None
+    assert [str(log.__dict__) for log in loaded] == [str(log.__dict__) for log in built]
+    assert list(loaded.query("Room1")) == [0, 2]
+    loaded.append_logs([built[0]])
+    assert len(loaded) == 4
+    # Changing the CSV makes the snapshot stale
+    with open(path, "a") as f:
+        f.write("2024-06-01 12:03:00,Room3,OK,21.0,40.0,380,All good\n")
+    assert reader.read_snapshot(snapshot_dir) is None
+    assert len(reader.read_store(snapshot_dir=snapshot_dir)) == 4
+    assert len(reader.read_snapshot(snapshot_dir)) == 4
+
+def test_unwritable_snapshot_still_returns_the_logs(capsys):
+    path = create_temp_csv("""timestamp,sala,estado,temperatura,humedad,co2
+2024-06-01 12:00:00,Room1,OK,22.5,45.0,400
+""")
+    # A snapshot directory below a regular file cannot be created
+    store = LogReader(path).read_store(snapshot_dir=path + "/snapshot")
+    assert len(store) == 1
+    assert "[WARN] Could not write snapshot" in capsys.readouterr().out
+
+def test_read_sharded_directory():
+    shards = tempfile.mkdtemp()
+    with open(f"{shards}/a.csv", "w") as f:
+        f.write("""timestamp,sala,estado,temperatura,humedad,co2,mensaje
+2024-06-01 12:02:00,Room1,OK,22.5,45.0,400,Third
+2024-06-01 12:00:00,Room2,OK,23.0,50.0,420,First
+""")
+    with open(f"{shards}/b.csv", "w") as f:
+        f.write("""timestamp,sala,estado,temperatura,humedad,co2,mensaje
+2024-06-01 12:01:00,Room1,WARNING,23.0,85.0,1100,Second
+,Room3,OK,21.0,40.0,380,Missing timestamp
+""")
+    with open(f"{shards}/broken.csv", "wb") as f:
+        f.write(b"\xff\xfe\x00broken")
+    reader = LogReader(shards, max_workers=2)
+    frame, rejected = reader.read_frame()
+    assert list(frame["mensaje"]) == ["First", "Second", "Third"]
+    assert list(rejected) == [(f"{shards}/b.csv", 1)]
+    assert list(reader.file_errors) == [f"{shards}/broken.csv"]
+    glob_reader = LogReader(f"{shards}/[ab].csv")
+    assert [log.mensaje for log in glob_reader.read_logs()] == ["First", "Second", "Third"]
+    assert len(LogStore.from_batches(glob_reader.iter_batches())) == 3
@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from src.log import Log
+from src.log_store import LogStore
+from src import messages
+from src.reports_state_by_room import StateByRoomStrategy, StateByRoomAggregator
+from src.reports_critical_alerts import CriticalAlertsStrategy
+from src.report_factory import ReportFactory
+import pytest
+
+def make_logs():
+    return [
+        Log(datetime(2024, 6, 1, 12, 0), "Room1", "OK", 22.5, 45.0, 400.0, "All good"),
+        Log(datetime(2024, 6, 1, 12, 1), "Room2", "WARNING", 31.0, 50.0, 420.0, None),
+        Log(datetime(2024, 6, 1, 12, 2), "Room1", "WARNING", 23.0, 85.0, 1100.0, "Humid"),
+        Log(datetime(2024, 6, 1, 12, 3), "Room1", "OK", 21.0, 40.0, 380.0, "All good"),
+    ]
+
+def test_lazy_log_view_round_trip():
+    logs = make_logs()
+    store = LogStore.from_logs(logs)
+    assert len(store) == len(logs)
+    assert [log.__dict__ for log in store] == [log.__dict__ for log in logs]
+    assert store[-1].sala == "Room1"
+    assert store.records([1])[0]["mensaje"] is None
+
+def test_snapshot_ignores_later_appends():
+    store = LogStore.from_logs(make_logs()[:2])
+    snapshot = store.snapshot()
+    store.append_logs(make_logs()[2:])
+    assert len(snapshot) == 2
+    assert len(store) == 4
+    assert store.version == snapshot.version + 1
+
+def test_reports_accept_store_and_list():
+    logs = make_logs()
+    store = LogStore.from_logs(logs)
+    for strategy in (StateByRoomStrategy(), CriticalAlertsStrategy()):
+        pd.testing.assert_frame_equal(strategy.generate(store), strategy.generate(logs))
+    summary = StateByRoomStrategy().generate(store)
+    assert list(summary["room"]) == ["Room1", "Room2"]
+    assert list(summary["state"]) == ["OK", "WARNING"]
+    assert len(CriticalAlertsStrategy().generate(store)) == 2
+
+def test_generate_many_matches_single_reports():
+    logs = make_logs()
+    factory = ReportFactory()
+    factory.register_default_reports()
+    reports = factory.generate_many(["critical_alerts", "state_by_room"], logs)
+    assert list(reports) == ["critical_alerts", "state_by_room"]
+    for report_type, df in reports.items():
+        pd.testing.assert_frame_equal(df, factory.create_report(report_type).generate(logs))
+    with pytest.raises(ValueError):
+        factory.generate_many(["state_by_room", "unknown"], logs)
+
+def test_query_index_handles_late_and_appended_rows():
+    logs = make_logs()
+    store = LogStore.from_logs(logs[2:])
+    store.append_logs(logs[:2])
+    store.append_logs([Log(datetime(2024, 6, 1, 12, 5), "Room1", "OK", 20.0, 40.0, 390.0)])
+    start, end = datetime(2024, 6, 1, 12, 0), datetime(2024, 6, 1, 12, 3)
+    rows = [store[int(i)] for i in store.query("Room1", start, end)]
+    assert [log.timestamp.minute for log in rows] == [0, 2, 3]
+    assert [store[int(i)].timestamp.minute for i in store.query("Room1")] == [0, 2, 3, 5]
+    assert len(store.query("Room9", start, end)) == 0
+
+def test_late_rows_merge_into_segments_in_timestamp_order():
+    rng = np.random.default_rng(3)
+    store = LogStore()
+    for _ in range(5):
+        # Minute resolution, so equal timestamps across batches are common
+        minutes = rng.integers(0, 30, 40)
+        store.append_logs([Log(datetime(2024, 6, 1, 12, int(m)), f"Room{int(m) % 2}", "OK", 20.0, 40.0, 400.0) for m in minutes])
+    for room in store.rooms:
+        rows = np.flatnonzero(store.sala() == room)
+        expected = rows[np.argsort(store.timestamp[rows], kind="stable")]
+        assert list(store.query(room)) == list(expected)
+
+def test_appends_to_a_loaded_snapshot_copy_the_mapped_columns(tmp_path):
+    LogStore.from_logs(make_logs()).save(str(tmp_path / "snapshot"))
+    store = LogStore.load(str(tmp_path / "snapshot"))
+    version = store.version
+    # Without free text the message rows column gets no values, with it it does
+    store.append_logs([Log(datetime(2024, 6, 1, 12, 4), "Room1", "OK", 21.0, 40.0, 380.0)])
+    store.append_logs([Log(datetime(2024, 6, 1, 12, 5), "Room3", "OK", 21.0, 40.0, 380.0, "Door open")])
+    assert len(store) == 6 and store.version > version
+    assert len(store.query("Room1")) == 4
+    assert [row["mensaje"] for row in store.records(slice(3, 6))] == ["All good", None, "Door open"]
+    assert len(LogStore.load(str(tmp_path / "snapshot"))) == 4
+
+def test_failed_append_leaves_the_store_unchanged():
+    store = LogStore.from_logs(make_logs())
+    version = store.version
+    frame = store.to_frame().assign(temperatura=["not a number"] * 4)
+    with pytest.raises(ValueError):
+        store.append_frame(frame)
+    assert len(store) == 4 and store.version == version
+    assert len(store.records()) == 4
+
+def test_room_registry_segments_follow_appends_and_snapshots():
+    logs = make_logs()
+    store = LogStore.from_logs(logs[2:])
+    snapshot = store.snapshot()
+    store.append_logs(logs[:2])
+    room = store.registry.get("Room1")
+    assert (room.code, store.room_code("Room2")) == (0, 1)
+    assert room.describe() == {"room": "Room1", "rows": 3, "first": datetime(2024, 6, 1, 12, 0), "last": datetime(2024, 6, 1, 12, 3)}
+    assert len(snapshot.registry.get("Room1")) == 2
+    assert snapshot.registry.get("Room2") is None
+    assert list(store.sala_codes) == [0, 0, 0, 1]
+
+def test_state_by_room_aggregator_matches_strategy():
+    logs = make_logs()
+    aggregator = StateByRoomAggregator()
+    aggregator.add_batch(LogStore.from_logs(logs[:2]))
+    for log in logs[2:]:
+        aggregator.add_log(log)
+    pd.testing.assert_frame_equal(aggregator.to_frame(), StateByRoomStrategy().generate(logs))
+
+def test_messages_are_template_encoded_and_rebuilt():
+    texts = [
+        "Medición registrada: T=22.5°C, H=45.0%, CO2=400ppm",
+        "Medición registrada: T=22.5°C, H=45%, CO2=400ppm",
+        "Door open",
+        None,
+    ]
+    store = LogStore.from_logs([
+        Log(datetime(2024, 6, 1, 12, minute), "Room1", "OK", 22.5, 45.0, 400.0, text)
+        for minute, text in enumerate(texts)
+    ])
+    assert list(store.mensaje_codes) == [messages.FIRST_TEMPLATE, messages.TEXT, messages.TEXT, messages.MISSING]
+    assert list(store.mensaje_texts) == texts[1:3]
+    assert [log.mensaje for log in store] == texts
+    assert [store[i].mensaje for i in range(len(store))] == texts
+    assert [row["mensaje"] for row in store.records(slice(1, 3))] == texts[1:3]
+    stats = messages.compression_stats(store)
+    assert (stats["templated"], stats["text"], stats["missing"]) == (1, 2, 1)
+    assert stats["compression_ratio"] > 1
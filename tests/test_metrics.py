@@ -0,0 +1,23 @@
+from src.metrics import Metrics, STAGE_METRIC
+
+def test_histogram_renders_cumulative_buckets():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        metrics.observe(STAGE_METRIC, value, stage="csv_parse")
+    with metrics.stage("validation"):
+        pass
+    text = metrics.render()
+    assert 'ecowatch_stage_seconds_bucket{stage="csv_parse",le="0.1"} 1' in text
+    assert 'ecowatch_stage_seconds_bucket{stage="csv_parse",le="1.0"} 3' in text
+    assert 'ecowatch_stage_seconds_bucket{stage="csv_parse",le="+Inf"} 4' in text
+    assert 'ecowatch_stage_seconds_count{stage="csv_parse"} 4' in text
+    assert 'ecowatch_stage_seconds_count{stage="validation"} 1' in text
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics(enabled=False)
+    timed = metrics.timed("report_generation")(lambda x: x * 2)
+    assert timed(21) == 42
+    with metrics.stage("export"):
+        pass
+    metrics.observe(STAGE_METRIC, 1.0, stage="export")
+    assert metrics.render() == "\n"
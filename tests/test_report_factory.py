@@ -0,0 +1,39 @@
+import os
+import pandas as pd
+from src.report_factory import iter_csv_export, iter_frame_chunks
+
+def make_frame(rows=25):
+    return pd.DataFrame({
+        "room": [f"Room{i % 3}" for i in range(rows)],
+        "timestamp": pd.date_range("2024-06-01 12:00:00", periods=rows, freq="min"),
+        "value": [float(i) for i in range(rows)],
+    })
+
+def test_chunked_csv_export_matches_single_frame_and_tees_to_disk(tmp_path):
+    df = make_frame()
+    chunks = list(iter_frame_chunks(df, chunk_rows=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    target = tmp_path / "report.csv"
+    exported = iter_csv_export(iter_frame_chunks(df, chunk_rows=10), str(target))
+    first = next(exported)
+    # The copy only replaces the target once the last chunk is written
+    assert not target.exists()
+    body = first + b"".join(exported)
+    assert body.decode().count("room,timestamp,value") == 1
+    assert body == df.to_csv(index=False, date_format="%Y-%m-%d %H:%M:%S").encode()
+    assert target.read_bytes() == body
+    assert os.listdir(tmp_path) == ["report.csv"]
+
+def test_closing_a_csv_export_early_removes_the_partial_file(tmp_path):
+    target = tmp_path / "report.csv"
+    target.write_bytes(b"previous export")
+    exported = iter_csv_export(iter_frame_chunks(make_frame(), chunk_rows=10), str(target))
+    next(exported)
+    assert len(os.listdir(tmp_path)) == 2
+    exported.close()
+    assert os.listdir(tmp_path) == ["report.csv"]
+    assert target.read_bytes() == b"previous export"
+
+def test_empty_frame_exports_its_header_once():
+    df = make_frame(0)
+    assert b"".join(iter_csv_export(iter_frame_chunks(df, chunk_rows=10))) == b"room,timestamp,value\n"
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+import numpy as np
+import pytest
+from src.log import Log
+from src.log_store import LogStore
+from src.rollups import Rollups
+
+def make_logs(rows=2000):
+    rng = np.random.default_rng(2)
+    start = datetime(2024, 6, 1)
+    return [
+        Log(start + timedelta(seconds=int(rng.integers(0, 3 * 86400))), f"Room{i % 3}", ["OK", "WARNING", "CRITICAL"][i % 5 % 3],
+            float(rng.normal(22, 2)), float(rng.normal(45, 5)), float(rng.normal(500, 50)))
+        for i in range(rows)
+    ]
+
+def test_out_of_order_batches_match_raw_rows():
+    logs = make_logs()
+    store = LogStore.from_logs(logs)
+    rollups = Rollups()
+    # Later batches fall before, between and after the buckets already kept
+    for part in (logs[1000:1500], logs[:10], logs[1500:], logs[10:1000]):
+        rollups.add_batch(LogStore.from_logs(sorted(part, key=lambda log: log.timestamp, reverse=True)))
+    start, end = datetime(2024, 6, 1, 5, 30, 17), datetime(2024, 6, 3, 2, 10, 41)
+    result = rollups.aggregate("Room1", start, end, store=store)
+    rows = [log for log in logs if log.sala == "Room1" and start <= log.timestamp <= end]
+    assert result["count"] == len(rows)
+    assert result["co2"]["min"] == min(log.co2 for log in rows)
+    assert result["temperature"]["mean"] == pytest.approx(sum(log.temperatura for log in rows) / len(rows))
+    assert result["states"] == {state: sum(log.estado == state for log in rows) for state in {log.estado for log in rows}}
+    assert result["buckets"]["day"] == 1 and result["buckets"]["hour"] > 0
+
+def test_wide_range_only_reads_existing_buckets():
+    rollups = Rollups()
+    everything = (datetime(1, 1, 1), datetime(9999, 12, 31, 23, 59, 59))
+    assert rollups.aggregate("Room0", *everything)["count"] == 0
+    logs = make_logs()
+    rollups.add_batch(LogStore.from_logs(logs))
+    result = rollups.aggregate("Room0", *everything)
+    assert result["count"] == sum(log.sala == "Room0" for log in logs)
+    assert result["buckets"] == {"day": 3, "hour": 0, "minute": 0, "raw": 0}
+    assert rollups.aggregate("Unknown", *everything)["count"] == 0
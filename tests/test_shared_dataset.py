@@ -0,0 +1,38 @@
+import os
+import time
+from datetime import datetime
+from src.log import Log
+from src.log_store import LogStore
+from src.shared_dataset import SharedDataset
+
+def make_store(rows):
+    return LogStore.from_logs([
+        Log(datetime(2024, 6, 1, 12, minute), f"Room{minute % 2}", "OK", 22.0, 45.0, 400.0, "All good")
+        for minute in range(rows)
+    ])
+
+def test_workers_attach_read_only_and_swap_generations(tmp_path):
+    loader = SharedDataset(str(tmp_path), keep=2)
+    worker = SharedDataset(str(tmp_path))
+    assert worker.attach() is None
+    assert loader.publish(make_store(3)) == 1
+    store = worker.attach()
+    assert (worker.generation, len(store)) == (1, 3)
+    # Columns are mapped from the published files, not copied into the worker
+    assert not store.timestamp.flags.writeable
+    assert list(store.query("Room1")) == [1]
+
+    reloaded = []
+    worker.start(0.01, on_reload=reloaded.append)
+    try:
+        loader.publish(make_store(4))
+        loader.publish(make_store(5))
+        deadline = time.monotonic() + 5
+        while worker.generation != 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        worker.stop()
+    assert worker.generation == 3
+    assert len(reloaded[-1]) == 5
+    # Only the newest generations are kept on disk
+    assert sorted(name for name in os.listdir(tmp_path) if name.startswith("gen-")) == ["gen-2", "gen-3"]